@@ -3,6 +3,7 @@ import json
 import bpy
 from bpy.app.handlers import persistent
 from .utils.registration import get_prefs, get_path
+from .lib.utils.updates import updates_deferred
 from .materials.materials import (
     get_blend_filenames,
     load_materials)
@@ -47,6 +48,9 @@ def get_tile_type(tile_type):
 
 @persistent
 def update_mt_scene_props_handler(dummy):
+    # a tile is being assembled
+    if updates_deferred():
+        return
     context = bpy.context
     scene = context.scene
     if not hasattr(scene, 'mt_scene_props'):
@@ -0,0 +1,530 @@
+# Benchmark MakeTile's tile generators.
+#
+# Run from the command line with Blender in background mode:
+#
+#   blender -b --factory-startup --python benchmarks/benchmark_tiles.py -- \
+#       --out results.json --subdivisions 1 2 4 --repeats 3
+#
+# Every tile type that appears in the tile type menu (non INTERNAL subclasses of
+# MT_Tile_Generator) is generated for each combination of size and subdivision scale.
+# Results are written as JSON or CSV depending on the extension of --out so runs on
+# different commits can be compared.
+#
+# To compare a boolean per cutter with one combined boolean per operation:
+#
+#   blender -b --factory-startup --python benchmarks/benchmark_tiles.py -- \
+#       --out cutters.json --cutters stack combined
+import os
+import sys
+import csv
+import gc
+import json
+import argparse
+import importlib
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+from statistics import median
+from time import perf_counter
+import bpy
+import addon_utils
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+STAGES = (
+    'initialise', 'base_draw', 'core_draw', 'cutters', 'uv_project',
+    'booleans', 'displacement_setup', 'finalise')
+
+
+def parse_args(argv):
+    """Parse arguments passed to the script after '--'.
+
+    Args:
+        argv (list[str]): sys.argv
+
+    Returns:
+        argparse.Namespace: arguments
+    """
+    argv = argv[argv.index('--') + 1:] if '--' in argv else []
+    parser = argparse.ArgumentParser(
+        prog='blender -b --python benchmark_tiles.py --',
+        description="Benchmark MakeTile tile generators.")
+    parser.add_argument(
+        '--out', default='benchmark_results.json',
+        help="File to write results to. Ends in .json or .csv")
+    parser.add_argument(
+        '--tile-types', nargs='*', default=None,
+        help="Tile types to benchmark e.g. STRAIGHT_WALL RECT_FLOOR. Defaults to all")
+    parser.add_argument(
+        '--blueprint', default='PLAIN',
+        help="Blueprint to use for base and core. Defaults to PLAIN")
+    parser.add_argument(
+        '--sizes', nargs='*', default=[''],
+        help="Tile sizes as X,Y,Z. An empty string uses the tile type's default size. "
+        "Tile types sized by radius or leg length only use the base size")
+    parser.add_argument(
+        '--subdivisions', nargs='*', type=float, default=[1, 2, 4],
+        help="Factors to scale each tile type's default native subdivisions by")
+    parser.add_argument(
+        '--repeats', type=int, default=3,
+        help="Number of times to generate each tile")
+    parser.add_argument(
+        '--warm-cache', action='store_true',
+        help="Keep the core cache and cutter templates between runs instead of clearing them")
+    parser.add_argument(
+        '--cutters', nargs='*', choices=('stack', 'combined'), default=['stack'],
+        help="How cutters are applied. 'stack' adds a boolean per cutter, 'combined' adds one "
+        "boolean per operation that cuts with all of a part's cutters. Give both to compare them")
+    parser.add_argument(
+        '--no-evaluate', action='store_true',
+        help="Don't evaluate modifiers after generating each tile")
+    parser.add_argument(
+        '--trace', default=None,
+        help="File to write a Chrome trace of every run to")
+    parser.add_argument(
+        '--trace-memory', action='store_true',
+        help="Record peak Python memory with tracemalloc. Slows down generation")
+    return parser.parse_args(argv)
+
+
+def enable_addon():
+    """Enable MakeTile from this checkout and create its scene properties.
+
+    Returns:
+        module: MakeTile addon module
+    """
+    parent_dir = os.path.dirname(ADDON_DIR)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+
+    addon = addon_utils.enable(ADDON_NAME, default_set=True)
+    if addon is None:
+        raise RuntimeError("Could not enable " + ADDON_NAME)
+
+    # In background mode there's no depsgraph update to trigger this for us
+    app_handlers = importlib.import_module(ADDON_NAME + '.app_handlers')
+    if app_handlers.create_properties_on_activation in bpy.app.handlers.depsgraph_update_pre:
+        app_handlers.create_properties_on_activation(None)
+    else:
+        app_handlers.create_properties()
+        app_handlers.load_material_libraries()
+
+    return addon
+
+
+def get_generators():
+    """Return the tile generators shown in the tile type menu.
+
+    Returns:
+        list[MT_Tile_Generator]: generators
+    """
+    create_tile = importlib.import_module(ADDON_NAME + '.tile_creation.create_tile')
+    utils = importlib.import_module(ADDON_NAME + '.lib.utils.utils')
+
+    return [
+        cls for cls in utils.get_all_subclasses(create_tile.MT_Tile_Generator)
+        if 'INTERNAL' not in cls.bl_options]
+
+
+def get_operator(bl_idname):
+    """Return the bpy.ops operator with bl_idname.
+
+    Args:
+        bl_idname (str): e.g. 'object.make_straight_wall'
+
+    Returns:
+        bpy.ops._BPyOpsSubModOp: operator
+    """
+    category, name = bl_idname.split('.')
+    return getattr(getattr(bpy.ops, category), name)
+
+
+def set_up_scene(scene_props, generator, blueprint, size, subdivision_scale):
+    """Set scene properties for a benchmark run.
+
+    Args:
+        scene_props (MakeTile.properties.MT_Scene_Properties): maketile scene properties
+        generator (MT_Tile_Generator): tile generator
+        blueprint (str): blueprint for base and core
+        size (str): X,Y,Z tile size or '' for default
+        subdivision_scale (float): factor to scale default native subdivisions by
+
+    Returns:
+        dict: scene properties that were set
+    """
+    scene_props.tile_blueprint = blueprint
+    # resets tile size and subdivisions to the tile type's defaults
+    scene_props.tile_type = generator.mt_type
+    scene_props.base_blueprint = blueprint
+    scene_props.main_part_blueprint = blueprint
+
+    if size:
+        tile_x, tile_y, tile_z = (float(i) for i in size.split(','))
+        # keep base footprint in proportion with tile
+        scene_props.base_x = scene_props.base_x * tile_x / scene_props.tile_x
+        scene_props.base_y = scene_props.base_y * tile_y / scene_props.tile_y
+        scene_props.tile_x = tile_x
+        scene_props.tile_y = tile_y
+        scene_props.tile_z = tile_z
+
+    settings = {}
+    for prop in scene_props.bl_rna.properties:
+        if prop.identifier.endswith('native_subdivisions'):
+            value = max(1, round(getattr(scene_props, prop.identifier) * subdivision_scale))
+            setattr(scene_props, prop.identifier, value)
+            settings[prop.identifier] = value
+
+    settings['tile_size'] = [scene_props.tile_x, scene_props.tile_y, scene_props.tile_z]
+    settings['base_size'] = [scene_props.base_x, scene_props.base_y, scene_props.base_z]
+    return settings
+
+
+def snapshot_data():
+    """Return the datablocks that currently exist so new ones can be removed after a run.
+
+    Returns:
+        set[bpy.types.ID]: datablocks
+    """
+    return set(bpy.data.objects) | set(bpy.data.meshes) | \
+        set(bpy.data.collections) | set(bpy.data.textures)
+
+
+def remove_new_data(before):
+    """Remove datablocks created since snapshot_data was called.
+
+    Args:
+        before (set[bpy.types.ID]): datablocks returned by snapshot_data
+    """
+    bpy.data.batch_remove(snapshot_data() - before)
+
+
+def get_booleans(objects):
+    """Return the boolean modifiers on the tile's objects.
+
+    Args:
+        objects (list[bpy.types.Object]): tile objects
+
+    Returns:
+        list[bpy.types.BooleanModifier]: boolean modifiers
+    """
+    return [mod for obj in objects for mod in obj.modifiers if mod.type == 'BOOLEAN']
+
+
+def evaluate_tile(context, objects):
+    """Evaluate modifiers on the tile's objects with and without booleans.
+
+    Args:
+        context (bpy.context): context
+        objects (list[bpy.types.Object]): tile objects
+
+    Returns:
+        float: time to evaluate all modifiers
+        float: time spent evaluating boolean modifiers
+        int: evaluated vertex count
+        int: evaluated face count
+    """
+    booleans = get_booleans(objects)
+
+    def timed_update():
+        for obj in objects:
+            obj.update_tag()
+        start = perf_counter()
+        context.view_layer.update()
+        return perf_counter() - start
+
+    for mod in booleans:
+        mod.show_viewport = False
+    without_booleans = timed_update()
+
+    for mod in booleans:
+        mod.show_viewport = True
+    with_booleans = timed_update()
+
+    depsgraph = context.evaluated_depsgraph_get()
+    verts = faces = 0
+    for obj in objects:
+        if obj.type != 'MESH' or obj.hide_viewport:
+            continue
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        verts += len(mesh.vertices)
+        faces += len(mesh.polygons)
+        obj_eval.to_mesh_clear()
+
+    return with_booleans, max(0.0, with_booleans - without_booleans), verts, faces
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of the Blender process.
+
+    Returns:
+        float: peak memory in MB or None if it can't be measured
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak / 1024 / 1024
+    return peak / 1024
+
+
+def run_once(context, generator, args, profiles):
+    """Generate a tile and measure it.
+
+    Args:
+        context (bpy.context): context
+        generator (MT_Tile_Generator): tile generator
+        args (argparse.Namespace): arguments
+        profiles (list[dict]): list to add a profile of the run's stages to
+
+    Returns:
+        dict: measurements
+    """
+    profiling = importlib.import_module(ADDON_NAME + '.lib.utils.profiling')
+    cache = importlib.import_module(ADDON_NAME + '.lib.bmturtle.cache')
+    create_tile = importlib.import_module(ADDON_NAME + '.tile_creation.create_tile')
+
+    if not args.warm_cache:
+        cache.core_cache.clear()
+        cache.array_cache.clear()
+        create_tile.clear_cutter_templates()
+
+    operator = get_operator(generator.bl_idname)
+    before = snapshot_data()
+    gc.collect()
+
+    if args.trace_memory:
+        tracemalloc.start()
+
+    updates = []
+
+    def count_update(*args):
+        updates.append(1)
+
+    bpy.app.handlers.depsgraph_update_post.append(count_update)
+    try:
+        with profiling.record_stages() as timer:
+            with profiling.stage(generator.bl_idname, 'generate'):
+                start = perf_counter()
+                result = operator()
+                wall_time = perf_counter() - start
+    finally:
+        bpy.app.handlers.depsgraph_update_post.remove(count_update)
+
+    profiles.append({
+        'start': start,
+        'duration': wall_time,
+        'totals': timer.totals,
+        'counts': timer.counts,
+        'events': timer.events})
+
+    row = {'wall_time': wall_time, 'depsgraph_updates': len(updates)}
+
+    if args.trace_memory:
+        row['peak_python_mb'] = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+
+    if 'FINISHED' not in result:
+        raise RuntimeError(generator.bl_idname + " returned " + str(result))
+
+    base = context.active_object
+    tile = bpy.data.collections[base.mt_object_props.tile_name]
+    objects = list(tile.all_objects)
+
+    meshes = [obj for obj in objects if obj.type == 'MESH']
+    row['verts'] = sum(len(obj.data.vertices) for obj in meshes)
+    row['faces'] = sum(len(obj.data.polygons) for obj in meshes)
+    row['boolean_modifiers'] = len(get_booleans(objects))
+
+    for name in STAGES:
+        row[name] = timer.totals.get(name, 0.0)
+
+    if not args.no_evaluate:
+        evaluate_time, boolean_time, verts, faces = evaluate_tile(context, objects)
+        row['evaluate'] = evaluate_time
+        row['booleans'] += boolean_time
+        row['evaluated_verts'] = verts
+        row['evaluated_faces'] = faces
+
+    row['peak_rss_mb'] = peak_rss_mb()
+
+    # keep cutter templates loaded during the run for the next one
+    templates = create_tile.get_templates_collection()
+    before |= {templates, bpy.data.collections['MT Helpers']}
+    before |= set(templates.objects) | {obj.data for obj in templates.objects}
+    remove_new_data(before)
+    return row
+
+
+def run(args):
+    """Run benchmarks.
+
+    Args:
+        args (argparse.Namespace): arguments
+
+    Returns:
+        list[dict]: one row per generated tile
+        list[dict]: stage profile of each generated tile
+    """
+    context = bpy.context
+    scene_props = context.scene.mt_scene_props
+    prefs = context.preferences.addons[ADDON_NAME].preferences
+    generators = get_generators()
+
+    if args.tile_types:
+        generators = [gen for gen in generators if gen.mt_type in args.tile_types]
+
+    rows = []
+    profiles = []
+    for generator in generators:
+        for size in args.sizes:
+            for subdivision_scale in args.subdivisions:
+                settings = set_up_scene(
+                    scene_props, generator, args.blueprint, size, subdivision_scale)
+
+                for cutters in args.cutters:
+                    prefs.combine_cutters = cutters == 'combined'
+                    for repeat in range(args.repeats):
+                        row = {
+                            'tile_type': generator.mt_type,
+                            'operator': generator.bl_idname,
+                            'blueprint': args.blueprint,
+                            'size': size or 'default',
+                            'subdivision_scale': subdivision_scale,
+                            'cutters': cutters,
+                            'repeat': repeat,
+                            'settings': settings}
+                        try:
+                            row.update(run_once(context, generator, args, profiles))
+                        except Exception as err:
+                            row['error'] = repr(err)
+                        rows.append(row)
+                        print_row(row)
+    return rows, profiles
+
+
+def print_row(row):
+    """Print a one line summary of a run.
+
+    Args:
+        row (dict): measurements
+    """
+    if 'error' in row:
+        print("{tile_type} x{subdivision_scale} size {size} {cutters}: {error}".format(**row))
+        return
+
+    stages = ", ".join(name + " " + format(row[name], '.3f') for name in STAGES)
+    print("{tile_type} x{subdivision_scale} size {size} {cutters}: {wall_time:.3f}s ({stages}) {verts} verts".format(
+        stages=stages, **row))
+
+
+def get_commit():
+    """Return the git commit of this checkout if there is one.
+
+    Returns:
+        str: commit hash or None
+    """
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=ADDON_DIR,
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarise(rows):
+    """Return the median of each measurement over repeats.
+
+    Args:
+        rows (list[dict]): one row per generated tile
+
+    Returns:
+        list[dict]: one row per tile type, size and subdivision scale
+    """
+    groups = {}
+    for row in rows:
+        if 'error' in row:
+            continue
+        key = (row['tile_type'], row['blueprint'], row['size'], row['subdivision_scale'], row['cutters'])
+        groups.setdefault(key, []).append(row)
+
+    summary = []
+    for (tile_type, blueprint, size, subdivision_scale, cutters), group in groups.items():
+        entry = {
+            'tile_type': tile_type,
+            'blueprint': blueprint,
+            'size': size,
+            'subdivision_scale': subdivision_scale,
+            'cutters': cutters,
+            'runs': len(group)}
+        for key, value in group[0].items():
+            if isinstance(value, float) and key != 'subdivision_scale':
+                entry[key] = median(row[key] for row in group)
+            elif isinstance(value, int) and key in (
+                    'verts', 'faces', 'evaluated_verts', 'evaluated_faces', 'boolean_modifiers',
+                    'depsgraph_updates'):
+                entry[key] = value
+        summary.append(entry)
+    return summary
+
+
+def write_results(path, rows, args):
+    """Write results to a JSON or CSV file.
+
+    Args:
+        path (str): file path
+        rows (list[dict]): one row per generated tile
+        args (argparse.Namespace): arguments
+    """
+    if path.lower().endswith('.csv'):
+        fieldnames = []
+        for row in rows:
+            fieldnames.extend(key for key in row if key not in fieldnames)
+        with open(path, 'w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(
+                    {key: json.dumps(value) if isinstance(value, dict) else value
+                     for key, value in row.items()})
+        return
+
+    results = {
+        'date': datetime.now().isoformat(),
+        'commit': get_commit(),
+        'blender_version': bpy.app.version_string,
+        'platform': platform.platform(),
+        'arguments': vars(args),
+        'summary': summarise(rows),
+        'runs': rows}
+
+    with open(path, 'w') as json_file:
+        json.dump(results, json_file, indent=2)
+
+
+def main():
+    args = parse_args(sys.argv)
+    enable_addon()
+    rows, profiles = run(args)
+    write_results(os.path.abspath(args.out), rows, args)
+    print("Wrote " + str(len(rows)) + " results to " + os.path.abspath(args.out))
+
+    if args.trace:
+        profiling = importlib.import_module(ADDON_NAME + '.lib.utils.profiling')
+        with open(args.trace, 'w') as trace_file:
+            json.dump(profiling.chrome_trace(profiles), trace_file)
+        print("Wrote trace to " + os.path.abspath(args.trace))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,324 @@
+from contextlib import contextmanager
+import numpy as np
+import bpy
+from .commands import create_turtle, release_turtle, home
+from .cache import array_cache, freeze
+from ..geometry.uv import box_project
+from ..geometry.deform import bend, bend_factor, unbend
+from ..geometry.arrays import array_offset, fit_count, array_mesh
+from ..geometry.displacement import vertex_uvs
+
+
+def core_to_object(name, coords, faces, groups):
+    """Create a Blender object from core geometry generated by lib.geometry.
+
+    Geometry is placed at the turtle (scene cursor) as if it had been drawn there
+    and the cursor is left at the object's origin, as bmturtle draw functions do.
+
+    Args:
+        name (str): Object name
+        coords (ndarray(n, 3)): vert coordinates relative to turtle
+        faces (ndarray(m, k) | list[tuple[int]]): faces as vert indices, wound so normals face outwards
+        groups (dict{str: ndarray[int]}): vert indices in each vertex group
+
+    Returns:
+        bpy.types.Object: core
+    """
+    bm, obj, turtle = create_turtle(name, list(groups))
+    bm.free()
+
+    basis = np.array(turtle.basis)
+    coords = np.asarray(coords) @ basis.T + np.array(turtle.location)
+
+    if isinstance(faces, np.ndarray):
+        faces = faces.tolist()
+
+    mesh = obj.data
+    mesh.from_pydata(coords.tolist(), [], faces)
+    mesh.update()
+
+    for group, indices in groups.items():
+        obj.vertex_groups[group].add(np.asarray(indices).tolist(), 1, 'REPLACE')
+
+    home(turtle, obj)
+    release_turtle(turtle, obj)
+
+    return obj
+
+
+def project_uvs(obj, island_margin=0.01, arc_groups=()):
+    """Unwrap a core by box projection, replacing the UVs of its active UV layer.
+
+    Much faster than bpy.ops.uv.smart_project for the boxes and prisms cores are made of.
+    Bent cores are projected as if they were straight so their curved faces are unrolled.
+    Faces of cores drawn with curved sides are unrolled if their vertex group is in arc_groups.
+
+    Args:
+        obj (bpy.types.Object): core
+        island_margin (float, optional): gap between islands in UV space. Defaults to 0.01.
+        arc_groups (list[str], optional): vertex groups on curved sides. Faces with \
+        all their verts in one are unrolled around the side's axis. Defaults to ().
+    """
+    mesh = obj.data
+
+    coords = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    props = obj.mt_object_props
+    if props.bend_factor:
+        coords = unbend(coords, props.bend_factor, props.bend_centre)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+
+    arcs = []
+    for name in arc_groups:
+        group = obj.vertex_groups.get(name)
+        if group is None:
+            continue
+        in_group = np.zeros(len(mesh.vertices), dtype=bool)
+        in_group[[v.index for v in mesh.vertices if any(g.group == group.index for g in v.groups)]] = True
+        arcs.append(np.logical_and.reduceat(in_group[loop_verts], loop_starts))
+
+    uvs = box_project(coords, loop_verts, loop_starts, loop_totals, island_margin, arcs)
+
+    uv_layer = mesh.uv_layers.active or mesh.uv_layers.new(name='UVMap')
+    uv_layer.data.foreach_set('uv', uvs.ravel())
+    mesh.update()
+
+
+def bend_object(obj, angle):
+    """Bend an object's mesh around its local Z axis.
+
+    Replaces a SIMPLE_DEFORM bend modifier, which would otherwise be evaluated on
+    every depsgraph update. Vertex groups and UVs are unchanged. The bend is stored
+    in the object's mt_object_props so it can be undone by unbent.
+
+    Args:
+        obj (bpy.types.Object): mesh object
+        angle (float): angle of arc in radians
+    """
+    mesh = obj.data
+    coords = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape(-1, 3)
+
+    props = obj.mt_object_props
+    props.bend_factor = bend_factor(coords, angle)
+    props.bend_centre = (coords[:, 0].min() + coords[:, 0].max()) / 2 if len(coords) else 0
+
+    mesh.vertices.foreach_set('co', bend(coords, angle).ravel())
+    mesh.update()
+
+
+@contextmanager
+def unbent(obj):
+    """Context manager that straightens an object bent by bend_object until the block exits.
+
+    Used when baking so the bake sees the straight core, as it did when cores were
+    bent by a SIMPLE_DEFORM modifier that was hidden at render time.
+
+    Args:
+        obj (bpy.types.Object): mesh object
+    """
+    props = obj.mt_object_props
+    if not props.bend_factor:
+        yield
+        return
+
+    mesh = obj.data
+    bent = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', bent)
+    mesh.vertices.foreach_set('co', unbend(bent, props.bend_factor, props.bend_centre).ravel())
+    mesh.update()
+    try:
+        yield
+    finally:
+        mesh.vertices.foreach_set('co', bent)
+        mesh.update()
+
+
+def bake_arrays(obj):
+    """Replace an object's array modifiers with the geometry they generate.
+
+    Used for cutters so the booleans that use them see a static mesh rather than
+    re-expanding the arrays on every depsgraph update. Results are cached by the
+    object's mesh and array settings, e.g. fit length and offset.
+
+    Objects whose modifiers aren't all constant or relative offset arrays are left
+    alone, as are objects with caps that aren't meshes or whose own modifiers
+    aren't all arrays like that.
+
+    Args:
+        obj (bpy.types.Object): mesh object
+
+    Returns:
+        bool: whether the arrays were baked
+    """
+    if not obj.modifiers:
+        return False
+
+    evaluated = evaluate_arrays(obj)
+    if evaluated is None:
+        return False
+
+    old_mesh = obj.data
+    obj.data = arrays_to_mesh(old_mesh.name, evaluated[1])
+    for material in old_mesh.materials:
+        obj.data.materials.append(material)
+    if old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+    obj.modifiers.clear()
+    return True
+
+
+def evaluate_arrays(obj):
+    """Return the geometry an object's array modifiers generate without changing the object.
+
+    The array modifier uses the evaluated mesh of its caps so caps with array
+    modifiers of their own are evaluated first. Results are cached by the mesh
+    and array settings of the object and its caps.
+
+    Args:
+        obj (bpy.types.Object): mesh object
+
+    Returns:
+        tuple(tuple, tuple): cache key and mesh arrays as returned by mesh_arrays, \
+        or None if the modifiers can't be evaluated
+    """
+    mods = list(obj.modifiers)
+    if obj.type != 'MESH' or not all(_is_bakeable(obj, mod) for mod in mods):
+        return None
+
+    mesh = mesh_arrays(obj.data)
+    settings = [_array_settings(mod) for mod in mods]
+    caps = []
+    for mod in mods:
+        for cap in (mod.start_cap, mod.end_cap):
+            if cap is None:
+                caps.append(None)
+                continue
+            evaluated_cap = evaluate_arrays(cap)
+            if evaluated_cap is None:
+                return None
+            caps.append(evaluated_cap)
+
+    key = (
+        _mesh_key(mesh),
+        freeze(settings),
+        tuple(cap[0] if cap is not None else None for cap in caps))
+    if not mods:
+        return key, mesh
+
+    entry = array_cache.get(key)
+    if entry is None:
+        cap_meshes = [cap[1] if cap is not None else None for cap in caps]
+        for i, (relative, constant, fit_type, count, fit_length, merge) in enumerate(settings):
+            offset = array_offset(mesh[0], relative, constant)
+            if fit_type == 'FIT_LENGTH':
+                count = fit_count(fit_length, offset)
+            mesh = array_mesh(mesh, count, offset, merge, cap_meshes[i * 2], cap_meshes[i * 2 + 1])
+
+        entry = {'mesh': mesh, 'nbytes': sum(a.nbytes for a in mesh)}
+        array_cache.put(key, entry)
+    return key, entry['mesh']
+
+
+def mesh_arrays(mesh):
+    """Return a mesh's verts and faces as arrays.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        tuple(ndarray(n, 3), ndarray[int], ndarray[int]): vert coordinates, vert index of each loop \
+        and number of loops in each face
+    """
+    coords = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    return coords.reshape(-1, 3), loop_verts, loop_totals
+
+
+def arrays_to_mesh(name, arrays):
+    """Create a mesh from arrays returned by mesh_arrays.
+
+    Args:
+        name (str): mesh name
+        arrays (tuple): vert coordinates, loop verts and loop totals
+
+    Returns:
+        bpy.types.Mesh: mesh
+    """
+    coords, loop_verts, loop_totals = arrays
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set('co', np.asarray(coords, dtype=np.float32).ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set('vertex_index', np.asarray(loop_verts, dtype=np.int32))
+    mesh.polygons.add(len(loop_totals))
+    loop_starts = np.concatenate(([0], np.cumsum(loop_totals)[:-1])) if len(loop_totals) else []
+    mesh.polygons.foreach_set('loop_start', np.asarray(loop_starts, dtype=np.int32))
+    mesh.polygons.foreach_set('loop_total', np.asarray(loop_totals, dtype=np.int32))
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def image_heights(image):
+    """Return the values in a baked displacement map.
+
+    Args:
+        image (bpy.types.Image): greyscale image
+
+    Returns:
+        ndarray(h, w): mean of the RGB channels of each pixel, bottom row first
+    """
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)[..., :3].mean(axis=2)
+
+
+def mesh_vertex_uvs(mesh):
+    """Return the UV of each vert in a mesh's active UV layer.
+
+    Args:
+        mesh (bpy.types.Mesh): mesh
+
+    Returns:
+        ndarray(n, 2): UVs
+    """
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_uvs = np.zeros(len(mesh.loops) * 2, dtype=np.float32)
+    if mesh.uv_layers.active is not None:
+        mesh.uv_layers.active.data.foreach_get('uv', loop_uvs)
+    return vertex_uvs(loop_verts, loop_uvs, len(mesh.vertices))
+
+
+def _is_bakeable(obj, mod):
+    return (
+        mod.type == 'ARRAY'
+        and not mod.use_object_offset
+        and mod.fit_type in ('FIXED_COUNT', 'FIT_LENGTH')
+        and obj not in (mod.start_cap, mod.end_cap))
+
+
+def _array_settings(mod):
+    return (
+        tuple(mod.relative_offset_displace) if mod.use_relative_offset else None,
+        tuple(mod.constant_offset_displace) if mod.use_constant_offset else None,
+        mod.fit_type,
+        mod.count,
+        round(mod.fit_length, 6),
+        mod.merge_threshold if mod.use_merge_vertices else None)
+
+
+def _mesh_key(mesh):
+    coords, loop_verts, loop_totals = mesh
+    return coords.round(6).tobytes(), loop_verts.tobytes(), loop_totals.tobytes()
@@ -0,0 +1,257 @@
+class MeshBuilder:
+    """Records turtle geometry as plain lists and emits it to a mesh in one go.
+
+    A MeshBuilder can be passed to bmturtle commands in place of a bmesh.
+    Extrusions only visit the currently selected geometry instead of
+    running bmesh.ops and rescanning every vert in the mesh, and the result
+    is written with a single from_pydata call.
+
+    Extrusions follow the same rules as the bmesh path in extrude_translate:
+    VERT mode extrudes each selected vert individually, EDGE mode extrudes
+    selected edges into quads and FACE mode extrudes the selected faces as a
+    region, keeping the original faces unless del_original is True.
+
+    Verts are stored as plain tuples so recording doesn't need Blender.
+    """
+
+    def __init__(self):
+        self.select_mode = {'VERT'}
+        self.verts = []
+        self.faces = []
+        self.selected_verts = []
+        self.selected_edges = []
+        self.selected_faces = []
+        # edge key -> number of faces using edge
+        self._edges = {}
+        # number of edges using each vert
+        self._vert_edges = []
+        self._dead_verts = set()
+
+    @classmethod
+    def from_bmesh(cls, bm):
+        """Return a builder containing a copy of bm's geometry and selection.
+
+        Args:
+            bm (bmesh): bmesh
+
+        Returns:
+            MeshBuilder: builder
+        """
+        builder = cls()
+        bm.verts.index_update()
+
+        for v in bm.verts:
+            builder._new_vert(v.co)
+        for e in bm.edges:
+            builder._add_edge(e.verts[0].index, e.verts[1].index)
+        for f in bm.faces:
+            builder._add_face(tuple(v.index for v in f.verts))
+
+        builder.select_mode = set(bm.select_mode)
+        builder.selected_verts = [v.index for v in bm.verts if v.select]
+        builder.selected_edges = [
+            _edge_key(e.verts[0].index, e.verts[1].index) for e in bm.edges if e.select]
+        builder.selected_faces = [i for i, f in enumerate(bm.faces) if f.select]
+
+        return builder
+
+    def add_vert(self, co):
+        """Add a vert and select it.
+
+        Args:
+            co (Vector[3]): location
+
+        Returns:
+            int: vert index
+        """
+        index = self._new_vert(co)
+        self.selected_verts.append(index)
+        return index
+
+    def select_all(self):
+        """Select all verts, edges and faces."""
+        self.selected_verts = [
+            i for i in range(len(self.verts)) if i not in self._dead_verts]
+        self.selected_edges = list(self._edges)
+        self.selected_faces = [i for i, f in enumerate(self.faces) if f is not None]
+
+    def deselect_all(self):
+        """Deselect all verts, edges and faces."""
+        self.selected_verts = []
+        self.selected_edges = []
+        self.selected_faces = []
+
+    def extrude(self, world_trans, del_original=True):
+        """Extrude and translate the current selection.
+
+        Args:
+            world_trans (Vector[3]): translation in world space
+            del_original (bool, optional): Whether to delete original faces. Defaults to True.
+        """
+        if self.select_mode == {'VERT'}:
+            new_verts = []
+            for v in self.selected_verts:
+                new_vert = self._new_vert(_translated(self.verts[v], world_trans))
+                self._add_edge(v, new_vert)
+                new_verts.append(new_vert)
+
+            self.selected_verts = new_verts
+            self.selected_edges = []
+            self.selected_faces = []
+
+        if self.select_mode == {'EDGE'}:
+            new_verts = {}
+            new_edges = []
+            for a, b in self.selected_edges:
+                new_a = self._dupe_vert(a, world_trans, new_verts)
+                new_b = self._dupe_vert(b, world_trans, new_verts)
+                self._add_face((a, b, new_b, new_a))
+                new_edges.append(_edge_key(new_a, new_b))
+
+            self.selected_verts = list(new_verts.values())
+            self.selected_edges = new_edges
+            self.selected_faces = []
+
+        if self.select_mode == {'FACE'}:
+            faces = [self.faces[i] for i in self.selected_faces]
+
+            # edges used by fewer than two selected faces bound the region
+            region_edges = {}
+            for f in faces:
+                for a, b in _face_edges(f):
+                    key = _edge_key(a, b)
+                    region_edges[key] = region_edges.get(key, 0) + 1
+
+            new_verts = {}
+            new_faces = []
+            for f in faces:
+                new_faces.append(self._add_face(
+                    tuple(self._dupe_vert(v, world_trans, new_verts) for v in f)))
+
+            for f in faces:
+                for a, b in _face_edges(f):
+                    if region_edges[_edge_key(a, b)] < 2:
+                        self._add_face((b, a, new_verts[a], new_verts[b]))
+
+            if del_original is True:
+                self.delete_faces(self.selected_faces)
+
+            self.selected_verts = list(new_verts.values())
+            self.selected_edges = [
+                _edge_key(a, b) for i in new_faces for a, b in _face_edges(self.faces[i])]
+            self.selected_faces = new_faces
+
+    def delete_faces(self, face_indices):
+        """Delete faces along with any edges and verts only they use.
+
+        Matches bmesh.ops.delete with context='FACES'.
+
+        Args:
+            face_indices (list[int]): indices of faces to delete
+        """
+        touched = set()
+        for i in face_indices:
+            f = self.faces[i]
+            if f is None:
+                continue
+            self.faces[i] = None
+            for a, b in _face_edges(f):
+                key = _edge_key(a, b)
+                self._edges[key] -= 1
+                touched.add(key)
+
+        for key in touched:
+            if self._edges[key] == 0:
+                del self._edges[key]
+                for v in key:
+                    self._vert_edges[v] -= 1
+                    if self._vert_edges[v] == 0:
+                        self._dead_verts.add(v)
+
+    def emit(self, bm, mesh):
+        """Write recorded geometry to mesh and load it into bm.
+
+        Geometry is written with a single from_pydata call. Vert and face
+        selection is carried across so drawing can carry on in bm.
+
+        Args:
+            bm (bmesh): bmesh to load the result into
+            mesh (bpy.types.Mesh): empty mesh
+
+        Returns:
+            list[int]: index in bm of each recorded vert. None for deleted verts.
+        """
+        remap = [None] * len(self.verts)
+        coords = []
+        for i, co in enumerate(self.verts):
+            if i not in self._dead_verts:
+                remap[i] = len(coords)
+                coords.append(co)
+
+        live_faces = [i for i, f in enumerate(self.faces) if f is not None]
+        faces = [tuple(remap[v] for v in self.faces[i]) for i in live_faces]
+        loose_edges = [
+            (remap[a], remap[b]) for (a, b), users in self._edges.items() if users == 0]
+
+        mesh.from_pydata(coords, loose_edges, faces)
+
+        vert_select = [False] * len(coords)
+        for v in self.selected_verts:
+            if remap[v] is not None:
+                vert_select[remap[v]] = True
+
+        selected_faces = set(self.selected_faces)
+        face_select = [i in selected_faces for i in live_faces]
+
+        edge_verts = [0] * (len(mesh.edges) * 2)
+        mesh.edges.foreach_get('vertices', edge_verts)
+        edge_select = [
+            vert_select[edge_verts[i]] and vert_select[edge_verts[i + 1]]
+            for i in range(0, len(edge_verts), 2)]
+
+        mesh.vertices.foreach_set('select', vert_select)
+        mesh.edges.foreach_set('select', edge_select)
+        mesh.polygons.foreach_set('select', face_select)
+        mesh.update()
+
+        bm.from_mesh(mesh)
+        bm.select_mode = self.select_mode
+
+        return remap
+
+    def _new_vert(self, co):
+        self.verts.append(tuple(co))
+        self._vert_edges.append(0)
+        return len(self.verts) - 1
+
+    def _dupe_vert(self, v, world_trans, new_verts):
+        if v not in new_verts:
+            new_verts[v] = self._new_vert(_translated(self.verts[v], world_trans))
+        return new_verts[v]
+
+    def _add_edge(self, a, b):
+        key = _edge_key(a, b)
+        if key not in self._edges:
+            self._edges[key] = 0
+            self._vert_edges[a] += 1
+            self._vert_edges[b] += 1
+        return key
+
+    def _add_face(self, verts):
+        self.faces.append(verts)
+        for a, b in _face_edges(verts):
+            key = self._add_edge(a, b)
+            self._edges[key] += 1
+        return len(self.faces) - 1
+
+
+def _edge_key(a, b):
+    return (a, b) if a < b else (b, a)
+
+
+def _face_edges(verts):
+    return zip(verts, verts[1:] + verts[:1])
+
+
+def _translated(co, trans):
+    return tuple(a + b for a, b in zip(co, trans))
@@ -0,0 +1,218 @@
+from collections import OrderedDict
+from functools import wraps
+import numpy as np
+import bpy
+from ...utils.registration import get_prefs
+
+
+class CoreCache:
+    """In session least recently used cache of generated core mesh data.
+
+    Mesh data is stored as plain arrays rather than as bpy.types.Mesh datablocks
+    because references to datablocks become invalid on undo or when a file is loaded.
+
+    Args:
+        max_bytes (int): Size above which least recently used entries are evicted
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return cached entry and mark it as recently used.
+
+        Args:
+            key (tuple): key
+
+        Returns:
+            dict: entry or None
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """Add entry to cache, evicting least recently used entries if over max_bytes.
+
+        Args:
+            key (tuple): key
+            entry (dict): entry as returned by store_core
+        """
+        if key in self._entries:
+            self.size -= self._entries.pop(key)['nbytes']
+
+        if entry['nbytes'] > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self.size += entry['nbytes']
+
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted['nbytes']
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+
+core_cache = CoreCache(64 * 1024 * 1024)
+
+# arrayed cutter meshes made by adapter.bake_arrays
+array_cache = CoreCache(16 * 1024 * 1024)
+
+
+def cached_core(func):
+    """Cache the mesh of the object returned by a core draw function.
+
+    The cache is keyed by the draw function, its arguments and the turtle's (scene cursor's)
+    start location and rotation. On a hit a new object is created from a copy of the
+    cached mesh data and the cursor is left where the draw function would have left it.
+
+    Args:
+        func (function): draw function that returns a bpy.types.Object
+
+    Returns:
+        function: wrapped draw function
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        cursor = bpy.context.scene.cursor
+
+        try:
+            key = (
+                func.__module__,
+                func.__qualname__,
+                freeze(args),
+                freeze(kwargs),
+                freeze(cursor.location),
+                freeze(cursor.rotation_euler))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        core_cache.max_bytes = get_prefs().core_cache_size * 1024 * 1024
+
+        entry = core_cache.get(key)
+        if entry is not None:
+            return load_core(entry)
+
+        obj = func(*args, **kwargs)
+        core_cache.put(key, store_core(obj))
+        return obj
+
+    return wrapper
+
+
+def freeze(value):
+    """Return a hashable version of value for use in a cache key.
+
+    Args:
+        value (any): value
+
+    Raises:
+        TypeError: if value can't be made hashable
+
+    Returns:
+        tuple | any: hashable value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (str, bytes)):
+        return value
+    if hasattr(value, '__iter__'):
+        return tuple(freeze(v) for v in value)
+    hash(value)
+    return value
+
+
+def store_core(obj):
+    """Copy mesh data, vertex groups and state needed to recreate a core.
+
+    Args:
+        obj (bpy.types.Object): core
+
+    Returns:
+        dict: cache entry
+    """
+    mesh = obj.data
+    cursor = bpy.context.scene.cursor
+
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loops)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+
+    group_names = [group.name for group in obj.vertex_groups]
+    group_verts = [[] for group in group_names]
+    for v in mesh.vertices:
+        for g in v.groups:
+            group_verts[g.group].append(v.index)
+    group_verts = [np.array(verts, dtype=np.int32) for verts in group_verts]
+
+    arrays = [coords, edges, loops, loop_starts, loop_totals] + group_verts
+
+    return {
+        'name': obj.name,
+        'coords': coords,
+        'edges': edges,
+        'loops': loops,
+        'loop_starts': loop_starts,
+        'loop_totals': loop_totals,
+        'group_names': group_names,
+        'group_verts': group_verts,
+        'penstate': obj.mt_object_props.penstate,
+        'cursor_location': cursor.location.copy(),
+        'cursor_rotation': cursor.rotation_euler.copy(),
+        'nbytes': sum(a.nbytes for a in arrays)}
+
+
+def load_core(entry):
+    """Create a core object from a cache entry.
+
+    Args:
+        entry (dict): cache entry
+
+    Returns:
+        bpy.types.Object: core
+    """
+    mesh = bpy.data.meshes.new("mesh")
+    mesh.vertices.add(len(entry['coords']) // 3)
+    mesh.vertices.foreach_set('co', entry['coords'])
+    mesh.edges.add(len(entry['edges']) // 2)
+    mesh.edges.foreach_set('vertices', entry['edges'])
+    mesh.loops.add(len(entry['loops']))
+    mesh.loops.foreach_set('vertex_index', entry['loops'])
+    mesh.polygons.add(len(entry['loop_starts']))
+    mesh.polygons.foreach_set('loop_start', entry['loop_starts'])
+    mesh.polygons.foreach_set('loop_total', entry['loop_totals'])
+    mesh.update(calc_edges=True)
+
+    obj = bpy.data.objects.new(entry['name'], mesh)
+    obj.mt_object_props.penstate = entry['penstate']
+
+    for name, verts in zip(entry['group_names'], entry['group_verts']):
+        group = obj.vertex_groups.new(name=name)
+        group.add(verts.tolist(), 1, 'REPLACE')
+
+    bpy.context.layer_collection.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+
+    cursor = bpy.context.scene.cursor
+    cursor.location = entry['cursor_location']
+    cursor.rotation_euler = entry['cursor_rotation']
+
+    return obj
@@ -1,19 +1,26 @@
-from math import pi, radians
+from math import pi
+import numpy as np
 import bpy
 import bmesh
-from .helpers import extrude_translate
+from mathutils import Vector, Euler
+from .helpers import extrude_translate, extrude_verts_along
+from .turtle import Turtle
+from .builder import MeshBuilder
+from ..utils.updates import update_view_layer
 
 def create_turtle(name, vert_groups=None):
-    """Creates a mesh object and associated bmesh to pass to bmturtle functions
+    """Creates a mesh object, associated bmesh and turtle to pass to bmturtle functions
+
+    The turtle starts at the scene cursor's location and rotation.
 
     Args:
         name (str): Object name
         vert_groups (list[str], optional): Names of vertex groups to create. Defaults to None.
 
     Returns:
-        tuple: bmesh, object
+        tuple: bmesh, object, Turtle
     """
-    turtle = bpy.context.scene.cursor
+    turtle = Turtle.from_cursor(bpy.context.scene.cursor)
     # create new empty turtle world
     mesh = bpy.data.meshes.new("mesh")
     obj = bpy.data.objects.new(name, mesh)
@@ -33,156 +40,184 @@ def create_turtle(name, vert_groups=None):
     bpy.context.view_layer.objects.active = obj
 
     # update depgraph
-    bpy.context.view_layer.update()
+    update_view_layer()
 
     bm = bmesh.new()
     bm.from_mesh(mesh)
 
-    return bm, obj
+    return bm, obj, turtle
+
 
+def release_turtle(turtle, obj):
+    """Write turtle state back to the scene cursor and owning object.
 
-def add_vert(bm):
+    Args:
+        turtle (Turtle): turtle
+        obj (bpy.types.Object): bmesh owning object
+    """
+    turtle.to_cursor(bpy.context.scene.cursor)
+    obj.mt_object_props.penstate = turtle.penstate
+
+
+def add_vert(bm, turtle):
     """Add a vertice at the turtle location
 
     Args:
-        bm (bmesh): bmesh
+        bm (bmesh | MeshBuilder): bmesh
+        turtle (Turtle): turtle
     """
-    turtle = bpy.context.scene.cursor
+    if isinstance(bm, MeshBuilder):
+        bm.add_vert(turtle.location)
+        return
+
     vert = bmesh.ops.create_vert(bm, co=turtle.location)
     vert['vert'][0].select = True
 
 
-def pu(bm):
+def pu(bm, turtle):
     """Pen Up.
-    Deselect all verts and set bmesh owning object's penstate property to 'False'
+    Deselect all verts and set turtle's penstate to 'False'
 
     Args:
-        bm (bmesh): bmesh
+        bm (bmesh | MeshBuilder): bmesh
+        turtle (Turtle): turtle
     """
-    for v in bm.verts:
-        v.select_set(False)
-    bm.select_flush(False)
+    if isinstance(bm, MeshBuilder):
+        bm.deselect_all()
+    else:
+        for v in bm.verts:
+            v.select_set(False)
+        bm.select_flush(False)
 
-    bpy.context.view_layer.objects.active.mt_object_props.penstate = False
-    # bpy.context.view_layer.objects.active['penstate'] = False
+    turtle.penstate = False
 
 
-def pd(bm):
+def pd(bm, turtle):
     """Pen Down.
-    Deselect all verts and set bmesh owning object's penstate property to 'True'
+    Set turtle's penstate to 'True'
 
     Args:
         bm (bmesh): bmesh
+        turtle (Turtle): turtle
     """
-    bpy.context.view_layer.objects.active.mt_object_props.penstate = True
+    turtle.penstate = True
 
 
-def fd(bm, distance, del_original=True):
+def fd(bm, turtle, distance, del_original=True):
     """Move Forward.
-    Moves turtle forward along its positive local y axis. If object's penstate is down (True) then also extrudes
+    Moves turtle forward along its positive local y axis. If turtle's penstate is down (True) then also extrudes
     any selected vaerts / edges / faces
 
     Args:
         bm (bmesh): bmesh
+        turtle (Turtle): turtle
         distance (float): distance
         del_original (bool, optional): Whether to delete original faces when extruding. Defaults to True.
     """
-    extrude_translate(bm, (0.0, distance, 0.0), del_original)
+    extrude_translate(bm, turtle, (0.0, distance, 0.0), del_original)
 
 
-def bk(bm, distance, del_original=True):
+def bk(bm, turtle, distance, del_original=True):
     """Move Backward.
-    Moves turtle backward along its negative local y axis. If object's penstate is down (True) then also extrudes
+    Moves turtle backward along its negative local y axis. If turtle's penstate is down (True) then also extrudes
     any selected vaerts / edges / faces
 
     Args:
         bm (bmesh): bmesh
+        turtle (Turtle): turtle
         distance (float): distance
         del_original (bool, optional): Whether to delete original faces when extruding. Defaults to True.
     """
-    extrude_translate(bm, (0.0, -distance, 0.0), del_original)
+    extrude_translate(bm, turtle, (0.0, -distance, 0.0), del_original)
 
 
-def up(bm, distance, del_original=True):
+def up(bm, turtle, distance, del_original=True):
     """Move Up.
-    Moves turtle up along its positive local z axis. If object's penstate is down (True) then also extrudes
+    Moves turtle up along its positive local z axis. If turtle's penstate is down (True) then also extrudes
     any selected vaerts / edges / faces
 
     Args:
         bm (bmesh): bmesh
+        turtle (Turtle): turtle
         distance (float): distance
         del_original (bool, optional): Whether to delete original faces when extruding. Defaults to True.
     """
-    extrude_translate(bm, (0.0, 0.0, distance), del_original)
+    extrude_translate(bm, turtle, (0.0, 0.0, distance), del_original)
 
 
-def dn(bm, distance, del_original=True):
+def dn(bm, turtle, distance, del_original=True):
     """Move Down.
-    Moves turtle down along its negative local z axis. If object's penstate is down (True) then also extrudes
+    Moves turtle down along its negative local z axis. If turtle's penstate is down (True) then also extrudes
     any selected vaerts / edges / faces
 
     Args:
         bm (bmesh): bmesh
+        turtle (Turtle): turtle
         distance (float): distance
         del_original (bool, optional): Whether to delete original faces when extruding. Defaults to True.
     """
-    extrude_translate(bm, (0.0, 0.0, -distance), del_original)
+    extrude_translate(bm, turtle, (0.0, 0.0, -distance), del_original)
 
 
-def ri(bm, distance, del_original=True):
+def ri(bm, turtle, distance, del_original=True):
     """Move Right.
-    Moves turtle right along its positive local x axis. If object's penstate is down (True) then also extrudes
+    Moves turtle right along its positive local x axis. If turtle's penstate is down (True) then also extrudes
     any selected vaerts / edges / faces
 
     Args:
         bm (bmesh): bmesh
+        turtle (Turtle): turtle
         distance (float): distance
         del_original (bool, optional): Whether to delete original faces when extruding. Defaults to True.
     """
-    extrude_translate(bm, (distance, 0.0, 0.0), del_original)
+    extrude_translate(bm, turtle, (distance, 0.0, 0.0), del_original)
 
 
-def lf(bm, distance, del_original=True):
+def lf(bm, turtle, distance, del_original=True):
     """Move Left.
-    Moves turtle left along its negative local x axis. If object's penstate is down (True) then also extrudes
+    Moves turtle left along its negative local x axis. If turtle's penstate is down (True) then also extrudes
     any selected vaerts / edges / faces
 
     Args:
         bm (bmesh): bmesh
+        turtle (Turtle): turtle
         distance (float): distance
         del_original (bool, optional): Whether to delete original faces when extruding. Defaults to True.
     """
-    extrude_translate(bm, (-distance, 0.0, 0.0), del_original)
+    extrude_translate(bm, turtle, (-distance, 0.0, 0.0), del_original)
 
 
-def lt(degrees):
+def lt(turtle, degrees):
     """Left turn.
     Rotates the turtle left around its Z axis
 
     Args:
+        turtle (Turtle): turtle
         degrees (float): degrees
     """
-    turtle = bpy.context.scene.cursor
-    turtle.rotation_euler = (
-        turtle.rotation_euler[0],
-        turtle.rotation_euler[1],
-        turtle.rotation_euler[2] + radians(degrees))
+    turtle.turn(degrees)
 
 
-def rt(degrees):
+def rt(turtle, degrees):
     """Right turn.
     Rotates the tortle right around its Z axis
 
     Args:
+        turtle (Turtle): turtle
         degrees (float): degrees
     """
-    lt(-degrees)
+    turtle.turn(-degrees)
 
 
-def arc(bm, radius, degrees, segments):
+def arc(bm, turtle, radius, degrees, segments):
     """Draw and arc centered on the turtle.
 
+    Segment points are calculated in one go from the turtle's rotation rather than
+    by moving and turning the turtle for each segment.
+
     Args:
+        bm (bmesh | MeshBuilder): bmesh
+        turtle (Turtle): turtle
         radius (float): radius
         degrees (float): degrees of arc to draw
         segments (int): number of segments to draw
@@ -191,50 +226,59 @@ def arc(bm, radius, degrees, segments):
     seg_length = circ / ((360 / degrees) * segments)
     rotation = degrees / segments
 
-    turtle = bpy.context.scene.cursor
     start_loc = turtle.location.copy()
     start_rot = turtle.rotation_euler.copy()
 
-    pu(bm)
+    pu(bm, turtle)
 
-    fd(bm, radius)
-    add_vert(bm)
-    pd(bm)
-    rt(90)
-    rt(rotation / 2)
+    fd(bm, turtle, radius)
+    add_vert(bm, turtle)
+    pd(bm, turtle)
 
-    i = 0
-    while i < segments:
-        fd(bm, seg_length)
-        rt(rotation)
+    # heading of each segment, equivalent to rt(90 + rotation / 2) then rt(rotation)
+    # after each segment but without accumulating error in the turtle's rotation
+    x_rot, y_rot, z_rot = start_rot
+    headings = z_rot - np.radians(90 + rotation / 2 + rotation * np.arange(segments))
 
-        i += 1
+    # direction of turtle's local Y before rotation around Z
+    tilted_y = (Euler((x_rot, y_rot, 0)).to_matrix() @ Vector((0, 1, 0)))[:]
 
-    pu(bm)
+    steps = np.empty((segments, 3))
+    steps[:, 0] = tilted_y[0] * np.cos(headings) - tilted_y[1] * np.sin(headings)
+    steps[:, 1] = tilted_y[0] * np.sin(headings) + tilted_y[1] * np.cos(headings)
+    steps[:, 2] = tilted_y[2]
+
+    extrude_verts_along(bm, np.cumsum(steps * seg_length, axis=0))
+
+    pu(bm, turtle)
 
     turtle.location = start_loc
     turtle.rotation_euler = start_rot
 
 
-def home(obj):
+def home(turtle, obj):
     """Home turtle.
     Returns the turtle to its parent object's origin
 
     Args:
+        turtle (Turtle): turtle
         obj (bpy.types.Object): parent object
     """
-    turtle = bpy.context.scene.cursor
     turtle.location = obj.location
     turtle.rotation_euler = obj.rotation_euler
 
 
-def finalise_turtle(bm, obj):
+def finalise_turtle(bm, obj, turtle=None):
     """Copy bmesh to object and free bmesh
 
     Args:
         bm (bmesh): bmesh
         obj (bpy.types.Object): object
+        turtle (Turtle, optional): If passed, turtle state is written back to the scene cursor. Defaults to None.
     """
+    if turtle is not None:
+        release_turtle(turtle, obj)
+
     # Make face normals consitent
     bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
     mesh = obj.data
@@ -1,16 +1,23 @@
+from heapq import heappush, heappop
+from itertools import chain, count
 from math import inf, tan, radians
+import numpy as np
 import bmesh
-import bpy
 from mathutils import Vector, geometry
-from ..utils.selection import in_bbox
+from ..utils.selection import in_bbox_array
+from .builder import MeshBuilder
 
 
 def bm_select_all(bm):
     """Select all verts.
 
     Args:
-        bm (bmesh): bmesh
+        bm (bmesh | MeshBuilder): bmesh
     """
+    if isinstance(bm, MeshBuilder):
+        bm.select_all()
+        return
+
     for v in bm.verts:
         v.select_set(True)
     bm.select_flush(True)
@@ -20,13 +27,34 @@ def bm_deselect_all(bm):
     """Deselect all verts.
 
     Args:
-        bm (bmesh): bmesh
+        bm (bmesh | MeshBuilder): bmesh
     """
+    if isinstance(bm, MeshBuilder):
+        bm.deselect_all()
+        return
+
     for v in bm.verts:
         v.select_set(False)
     bm.select_flush(False)
 
 
+def bm_vert_coords(bm):
+    """Return coordinates of all verts.
+
+    Args:
+        bm (bmesh): bmesh
+
+    Returns:
+        ndarray(n, 3): float32 vertex coordinates in bm.verts order
+    """
+    count = len(bm.verts)
+    coords = np.fromiter(
+        chain.from_iterable(v.co for v in bm.verts),
+        dtype=np.float32,
+        count=count * 3)
+    return coords.reshape(count, 3)
+
+
 def select_verts_in_bounds(lbound, ubound, buffer, bm):
     """Select vertices within cubical boundary.
 
@@ -39,15 +67,54 @@ def select_verts_in_bounds(lbound, ubound, buffer, bm):
     Returns:
         list[bmesh.verts]: List of verts
     """
-    vert_coords = [v.co.to_tuple() for v in bm.verts]
-    to_select = [in_bbox(lbound, ubound, v, buffer) for v in vert_coords]
+    to_select = in_bbox_array(lbound, ubound, bm_vert_coords(bm), buffer)
 
-    for vert, select in zip(bm.verts, to_select):
+    for vert, select in zip(bm.verts, to_select.tolist()):
         vert.select = select
 
     return [v for v in bm.verts if v.select]
 
 
+def verts_in_bounds(lbound, ubound, buffer, coords):
+    """Return indices of vertices within cubical boundary.
+
+    Unlike select_verts_in_bounds this doesn't change the selection.
+
+    Args:
+        lbound (tuple[3]): Lower left corner of bounds
+        ubound (tuble[3]): Upper left corner of bounds
+        buffer (float): Buffer around bbox
+        coords (ndarray(n, 3)): vertex coordinates, see bm_vert_coords
+
+    Returns:
+        ndarray[int]: vertex indices
+    """
+    return np.flatnonzero(in_bbox_array(lbound, ubound, coords, buffer))
+
+
+def classify_verts_in_bounds(bounds, buffer, coords):
+    """Return indices of vertices within each of several cubical boundaries.
+
+    All boundaries are tested in a single pass over the coordinates.
+
+    Args:
+        bounds (dict{str: (lbound, ubound)}): Lower left and upper left corners of each boundary
+        buffer (float): Buffer around bboxes
+        coords (ndarray(n, 3)): vertex coordinates, see bm_vert_coords
+
+    Returns:
+        dict{str: ndarray[int]}: vertex indices within each boundary
+    """
+    names = list(bounds)
+    lbounds = np.array([bounds[name][0] for name in names], dtype=np.float32) - buffer
+    ubounds = np.array([bounds[name][1] for name in names], dtype=np.float32) + buffer
+
+    coords = coords[:, np.newaxis, :]
+    inside = np.all((coords >= lbounds) & (coords <= ubounds), axis=2)
+
+    return {name: np.flatnonzero(inside[:, i]) for i, name in enumerate(names)}
+
+
 def assign_verts_to_group(verts, obj, deform_groups, group_name):
     """Assigns verts to vertex group
 
@@ -65,23 +132,68 @@ def assign_verts_to_group(verts, obj, deform_groups, group_name):
             groups[group_index] = 1
 
 
-def extrude_translate(bm, local_trans, del_original=True):
-    """Extrudes and translates selected verts, edges or faces
+def subdivide_faces_in_groups(bm, group_indices, max_edge_length, max_passes=8):
+    """Subdivide the faces in vertex groups until none of their edges are longer than max_edge_length.
+
+    A face is in a group if all its verts are. Each pass halves the long edges of
+    these faces. Faces outside the groups that share a halved edge are split so
+    there are no gaps, which limits the transition to one face around the groups.
+    New verts and UVs are interpolated so the new faces stay in the groups.
 
     Args:
         bm (bmesh): bmesh
+        group_indices (set[int]): indices of vertex groups whose faces to subdivide
+        max_edge_length (float): edge length to subdivide to
+        max_passes (int, optional): maximum number of times to halve edges. Defaults to 8.
+
+    Returns:
+        int: number of passes made
+    """
+    deform = bm.verts.layers.deform.verify()
+
+    def in_groups(verts):
+        return {v for v in verts if any(index in v[deform] for index in group_indices)}
+
+    grouped = in_groups(bm.verts)
+    faces = bm.faces
+
+    for i in range(max_passes):
+        edges = {
+            edge
+            for face in faces if all(v in grouped for v in face.verts)
+            for edge in face.edges if edge.calc_length() > max_edge_length}
+        if not edges:
+            return i
+        result = bmesh.ops.subdivide_edges(bm, edges=list(edges), cuts=1, use_grid_fill=True)
+
+        # only new verts change group and only faces using them can have new long edges
+        new_verts = {
+            elem for elem in result['geom_inner'] + result['geom_split']
+            if isinstance(elem, bmesh.types.BMVert)}
+        grouped |= in_groups(new_verts)
+        faces = {face for v in new_verts for face in v.link_faces}
+
+    return max_passes
+
+
+def extrude_translate(bm, turtle, local_trans, del_original=True):
+    """Extrudes and translates selected verts, edges or faces
+
+    Args:
+        bm (bmesh | MeshBuilder): bmesh, or builder to record the extrusion in
+        turtle (Turtle): turtle
         local_trans (Vector[3]): Local transform vector
         del_original (bool, optional): Whether to delete original faces. Defaults to True.
     """
-    # use cursor as turtle
-    turtle = bpy.context.scene.cursor
-
     # work out transform in turtle's local space and convert to global
-    local_trans = Vector(local_trans)
-    world_trans = turtle.matrix.to_3x3() @ local_trans
-    turtle.location = turtle.matrix.translation + world_trans
+    world_trans = turtle.translate(local_trans)
+
+    if isinstance(bm, MeshBuilder):
+        if turtle.penstate is True:
+            bm.extrude(world_trans, del_original)
+        return
 
-    if bpy.context.view_layer.objects.active.mt_object_props.penstate is True:
+    if turtle.penstate is True:
         if bm.select_mode == {'VERT'}:
             bm.select_flush(True)
             # get selected verts
@@ -151,23 +263,75 @@ def extrude_translate(bm, local_trans, del_original=True):
                 f.select_set(True)
 
 
+def extrude_verts_along(bm, offsets):
+    """Extrude each selected vert into a chain of edges passing through offsets
+
+    Equivalent to calling extrude_translate in VERT mode once per offset but
+    adds all the verts and edges in one go.
+
+    Args:
+        bm (bmesh | MeshBuilder): bmesh
+        offsets (ndarray(n, 3)): cumulative offsets of each new vert from its selected vert
+    """
+    if len(offsets) == 0:
+        return
+
+    if isinstance(bm, MeshBuilder):
+        previous = np.zeros(3)
+        for offset in offsets:
+            bm.extrude(Vector(offset - previous))
+            previous = offset
+        return
+
+    bm.select_flush(True)
+    selected = [v for v in bm.verts if v.select]
+    offsets = offsets.tolist()
+
+    ends = []
+    for v in selected:
+        co = v.co.copy()
+        prev = v
+        for offset in offsets:
+            new_vert = bm.verts.new(co + Vector(offset))
+            bm.edges.new((prev, new_vert))
+            prev = new_vert
+        ends.append(prev)
+
+    bm_deselect_all(bm)
+
+    for v in ends:
+        v.select_set(True)
+    bm.select_flush(True)
+
+
 # https://blender.stackexchange.com/questions/186067/what-is-the-bmesh-equivalent-to-bpy-ops-mesh-shortest-path-select
 class Node:
     """Return a node object that contains list of edges \
      that make up shortest path between two verts.
 
+    Only the edge leading back to the previous node on the path is stored,
+    shortest_path is rebuilt from these links when it is read.
+
     Returns:
         dict{vert: BMVert, length: float, shortest_path: list[BMEdge]}: Dict giving shortest path \
         between two verts
     """
     @property
-    def edges(self):
-        return (e for e in self.vert.link_edges if not e.tag)
+    def shortest_path(self):
+        path = []
+        node = self
+        while node.previous is not None:
+            path.append(node.edge)
+            node = node.previous
+        path.reverse()
+        return path
 
     def __init__(self, v):
         self.vert = v
         self.length = inf
-        self.shortest_path = []
+        self.previous = None
+        self.edge = None
+        self.visited = False
 
 
 def bm_shortest_path(bm, v_start, v_target=None):
@@ -176,38 +340,42 @@ def bm_shortest_path(bm, v_start, v_target=None):
     Args:
         bm (bmesh): bmesh
         v_start (bmesh.vert): start vert
-        v_target (bmesh.vert, optional): end vert. Defaults to None.
+        v_target (bmesh.vert, optional): end vert. If passed search stops once its \
+        shortest path is known. Defaults to None.
 
     Returns:
         dict{BMVert: Node}: Nodes
     """
-    for e in bm.edges:
-        e.tag = False
-
-    d = {v : Node(v) for v in bm.verts}
+    d = {v: Node(v) for v in bm.verts}
     node = d[v_start]
     node.length = 0
 
-    visiting = [node]
+    # counter breaks ties so nodes themselves are never compared
+    counter = count()
+    visiting = [(0, next(counter), node)]
 
     while visiting:
-        node = visiting.pop(0)
+        length, _, node = heappop(visiting)
+
+        # skip stale entries left behind when a shorter path was found
+        if node.visited:
+            continue
+        node.visited = True
 
         if node.vert is v_target:
             return d
 
-        for e in node.edges:
-            e.tag = True
-            length = node.length + e.calc_length()
-            v = e.other_vert(node.vert)
-
-            visit = d[v]
-            visiting.append(visit)
-            if visit.length > length:
-                visit.length = length
-                visit.shortest_path = node.shortest_path + [e]
-
-        visiting.sort(key=lambda n: n.length)
+        for e in node.vert.link_edges:
+            visit = d[e.other_vert(node.vert)]
+            if visit.visited:
+                continue
+
+            new_length = length + e.calc_length()
+            if new_length < visit.length:
+                visit.length = new_length
+                visit.previous = node
+                visit.edge = e
+                heappush(visiting, (new_length, next(counter), visit))
 
     return d
 
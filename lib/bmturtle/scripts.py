@@ -1,10 +1,11 @@
 from math import cos, acos, sqrt, degrees, radians
+import numpy as np
 from mathutils import kdtree
 import bmesh
-import bpy
 from .commands import (
     create_turtle,
     finalise_turtle,
+    release_turtle,
     add_vert,
     fd,
     ri,
@@ -21,7 +22,13 @@ from .helpers import (
     bm_deselect_all,
     assign_verts_to_group,
     select_verts_in_bounds,
+    bm_vert_coords,
+    classify_verts_in_bounds,
     bm_shortest_path)
+from .builder import MeshBuilder
+from .cache import cached_core
+from .adapter import core_to_object
+from ..geometry.cores import straight_wall_core, rectangular_floor_core
 
 def draw_cuboid(dimensions):
     """Draw a cuboid.
@@ -32,20 +39,20 @@ def draw_cuboid(dimensions):
     Returns:
         obj: bpy.types.Object
     """
-    bm, obj = create_turtle(name='cuboid')
-    add_vert(bm)
+    bm, obj, turtle = create_turtle(name='cuboid')
+    add_vert(bm, turtle)
     bm.select_mode = {'VERT'}
-    fd(bm, dimensions[1])
+    fd(bm, turtle, dimensions[1])
     bm.select_mode = {'EDGE'}
     bm_select_all(bm)
-    ri(bm, dimensions[0])
+    ri(bm, turtle, dimensions[0])
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, dimensions[2], False)
-    pu(bm)
+    up(bm, turtle, dimensions[2], False)
+    pu(bm, turtle)
 
-    home(obj)
-    finalise_turtle(bm, obj)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
 
@@ -78,16 +85,14 @@ def draw_tri_prism(dimensions, ret_dimensions=False):
     B = degrees(acos((c**2 + a**2 - (b**2)) / (2 * c * a)))
     C = 180 - A - B
 
-    turtle = bpy.context.scene.cursor
-
-    bm, obj = create_turtle(name='tri_prism')
-    add_vert(bm)
+    bm, obj, turtle = create_turtle(name='tri_prism')
+    add_vert(bm, turtle)
     bm.select_mode = {'VERT'}
     loc_A = turtle.location.copy()
-    fd(bm, c)
+    fd(bm, turtle, c)
     loc_B = turtle.location.copy()
-    rt(180 - B)
-    fd(bm, a)
+    rt(turtle, 180 - B)
+    fd(bm, turtle, a)
     loc_C = turtle.location.copy()
     bmesh.ops.contextual_create(
         bm,
@@ -96,9 +101,9 @@ def draw_tri_prism(dimensions, ret_dimensions=False):
         use_smooth=False)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, height, False)
-    home(obj)
-    finalise_turtle(bm, obj)
+    up(bm, turtle, height, False)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
 
     dimensions = {
         'a': a,
@@ -117,13 +122,16 @@ def draw_tri_prism(dimensions, ret_dimensions=False):
     return obj
 
 
-def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
+@cached_core
+def draw_tri_floor_core(dimensions, subdivs, margin=0.001, use_builder=False):
     """Draw a triangular floor core and create vertex groups
 
     Args:
         dimensions (dict{a, c, A, height}): dimensions
         subdivs (list): subdivs(edge, height)
         margin (float, optional): margin. Defaults to 0.001.
+        use_builder (bool, optional): Record the extrusion of the bottom in a MeshBuilder
+        and emit it in one go rather than extruding the bmesh step by step. Defaults to False.
 
     Returns:
         bpy.types.Object: core
@@ -144,24 +152,18 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
     B = degrees(acos((c**2 + a**2 - (b**2)) / (2 * c * a)))
     C = 180 - A - B
 
-    turtle = bpy.context.scene.cursor
-
     vert_groups = ['Side a', 'Side b', 'Side c', 'Top', 'Bottom']
 
-    bm, obj = create_turtle(name='tri_prism', vert_groups=vert_groups)
-
-    # create vertex group layer
-    bm.verts.layers.deform.verify()
-    deform_groups = bm.verts.layers.deform.active
+    bm, obj, turtle = create_turtle(name='tri_prism', vert_groups=vert_groups)
 
     # draw bottom
-    add_vert(bm)
+    add_vert(bm, turtle)
     bm.select_mode = {'VERT'}
     loc_A = turtle.location.copy()
-    fd(bm, c)
+    fd(bm, turtle, c)
     loc_B = turtle.location.copy()
-    rt(180 - B)
-    fd(bm, a)
+    rt(turtle, 180 - B)
+    fd(bm, turtle, a)
     loc_C = turtle.location.copy()
 
     bmesh.ops.contextual_create(
@@ -183,8 +185,25 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
     for f in faces:
         f.select_set(True)
 
+    if use_builder:
+        # bottom is built with bmesh ops so we only record the extrusion
+        draw = MeshBuilder.from_bmesh(bm)
+        bottom_vert_count = len(bottom_verts)
+        bm.clear()
+    else:
+        draw = bm
+
     for i in range(subdivs[1]):
-        up(bm, height / subdivs[1], False)
+        up(draw, turtle, height / subdivs[1], False)
+
+    if use_builder:
+        remap = draw.emit(bm, obj.data)
+        bm.verts.ensure_lookup_table()
+        bottom_verts = [bm.verts[remap[i]] for i in range(bottom_vert_count)]
+
+    # create vertex group layer
+    bm.verts.layers.deform.verify()
+    deform_groups = bm.verts.layers.deform.active
 
     faces = [f for f in bm.faces if f.select]
     bm.select_mode = {'VERT'}
@@ -209,12 +228,12 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
 
     # select side a and assign to vert group
     side_a_verts = []
-    pu(bm)
+    pu(bm, turtle)
     turtle.location = loc_A
     turtle.rotation_euler = (0, 0, 0)
 
-    fd(bm, c)
-    rt(180 - B)
+    fd(bm, turtle, c)
+    rt(turtle, 180 - B)
 
     i = 0
     while i <= subdivs[0]:
@@ -225,7 +244,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
             turtle.location[2] + height)
         selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
         side_a_verts.extend(selected_verts)
-        fd(bm, a / (subdivs[0] + 1))
+        fd(bm, turtle, a / (subdivs[0] + 1))
         i += 1
     lbound = turtle.location
     ubound = (
@@ -240,7 +259,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
 
     # select side b and assign verts
     side_b_verts = []
-    rt(180 - C)
+    rt(turtle, 180 - C)
 
     i = 0
     while i <= subdivs[0]:
@@ -251,7 +270,7 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
             turtle.location[2] + height)
         selected_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
         side_b_verts.extend(selected_verts)
-        fd(bm, b / (subdivs[0] + 1))
+        fd(bm, turtle, b / (subdivs[0] + 1))
         i += 1
     lbound = turtle.location
     ubound = (
@@ -281,8 +300,8 @@ def draw_tri_floor_core(dimensions, subdivs, margin=0.001):
     top_verts = [v for v in selected_verts if v not in side_verts]
 
     assign_verts_to_group(top_verts, obj, deform_groups, 'Top')
-    home(obj)
-    finalise_turtle(bm, obj)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
 
@@ -315,17 +334,17 @@ def draw_tri_slot_cutter(dimensions):
     a = sqrt((b**2 + c**2) - ((2 * b * c) * cos(radians(A))))
     B = degrees(acos((c**2 + a**2 - (b**2)) / (2 * c * a)))
 
-    bm, obj = create_turtle(name='Slot.')
+    bm, obj, turtle = create_turtle(name='Slot.')
 
-    dn(bm, 0.001)
+    dn(bm, turtle, 0.001)
 
-    add_vert(bm)
+    add_vert(bm, turtle)
     bm.select_mode = {'VERT'}
 
     # draw outer loop
-    fd(bm, c)
-    rt(180 - B)
-    fd(bm, a)
+    fd(bm, turtle, c)
+    rt(turtle, 180 - B)
+    fd(bm, turtle, a)
     bm.faces.ensure_lookup_table()
     bmesh.ops.contextual_create(
         bm,
@@ -357,14 +376,15 @@ def draw_tri_slot_cutter(dimensions):
 
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, cutter_h, False)
+    up(bm, turtle, cutter_h, False)
 
-    home(obj)
-    finalise_turtle(bm, obj)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
     return obj
 
 
-def draw_straight_wall_core(dims, subdivs, margin=0.001):
+@cached_core
+def draw_straight_wall_core(dims, subdivs, margin=0.001, use_builder=False):
     """Draws a Straight Wall Core and assigns Verts to appropriate groups
 
     Args:
@@ -372,124 +392,162 @@ def draw_straight_wall_core(dims, subdivs, margin=0.001):
         subdivs (tuple[3]): How many times to subdivide each face
         margin (float, optional): Margin to leave around textured areas to correct for displacement distortion.
         Defaults to 0.001.
+        use_builder (bool, optional): Record geometry in a MeshBuilder and emit it in one go
+        rather than extruding the bmesh step by step. Defaults to False.
 
     Returns:
         bpy.types.Object: Wall Core
     """
     vert_groups = ['Left', 'Right', 'Front', 'Back', 'Top', 'Bottom']
 
-    bm, obj = create_turtle('Straight Wall', vert_groups)
-
-    # create vertex group layer
-    bm.verts.layers.deform.verify()
-    deform_groups = bm.verts.layers.deform.active
-    bm.select_mode = {'VERT'}
+    bm, obj, turtle = create_turtle('Straight Wall', vert_groups)
+    draw = MeshBuilder() if use_builder else bm
+    draw.select_mode = {'VERT'}
 
     bottom_verts = []
     top_verts = []
 
     # Start drawing wall
-    pd(bm)
-    add_vert(bm)
-    bm.select_mode = {'VERT'}
+    pd(draw, turtle)
+    add_vert(draw, turtle)
+    draw.select_mode = {'VERT'}
 
     # Draw front bottom edges
-    ri(bm, margin)
+    ri(draw, turtle, margin)
 
     subdiv_x_dist = (dims[0] - (margin * 2)) / subdivs[0]
 
     i = 0
     while i < subdivs[0]:
-        ri(bm, subdiv_x_dist)
+        ri(draw, turtle, subdiv_x_dist)
         i += 1
 
-    ri(bm, margin)
+    ri(draw, turtle, margin)
 
     # Select edge and extrude to create bottom
-    bm.select_mode = {'EDGE'}
-    bm_select_all(bm)
-    fd(bm, margin)
+    draw.select_mode = {'EDGE'}
+    bm_select_all(draw)
+    fd(draw, turtle, margin)
 
     subdiv_y_dist = (dims[1] - (margin * 2)) / subdivs[1]
 
     i = 0
     while i < subdivs[1]:
-        fd(bm, subdiv_y_dist)
+        fd(draw, turtle, subdiv_y_dist)
         i += 1
 
-    fd(bm, margin)
+    fd(draw, turtle, margin)
 
     # Save verts to add to bottom vert group
-    for v in bm.verts:
-        bottom_verts.append(v)
+    if use_builder:
+        bottom_vert_count = len(draw.verts)
+    else:
+        for v in bm.verts:
+            bottom_verts.append(v)
 
     # select bottom and extrude up
-    bm.select_mode = {'FACE'}
-    bm_select_all(bm)
-    up(bm, margin, False)
+    draw.select_mode = {'FACE'}
+    bm_select_all(draw)
+    up(draw, turtle, margin, False)
 
     subdiv_z_dist = (dims[2] - (margin * 2)) / subdivs[2]
 
     i = 0
     while i < subdivs[2]:
-        up(bm, subdiv_z_dist)
+        up(draw, turtle, subdiv_z_dist)
         i += 1
 
-    up(bm, margin)
+    up(draw, turtle, margin)
+
+    if use_builder:
+        remap = draw.emit(bm, obj.data)
+        bm.verts.ensure_lookup_table()
+        bottom_verts = [bm.verts[remap[i]] for i in range(bottom_vert_count)]
+
+    # create vertex group layer
+    bm.verts.layers.deform.verify()
+    deform_groups = bm.verts.layers.deform.active
 
     # Save top verts to add to top vertex group
-    top_verts = [v for v in bm.verts if v.select]
+    bm.verts.index_update()
+    top_indices = np.array([v.index for v in bm.verts if v.select], dtype=int)
 
     # assign bottom verts to vertex groups
     assign_verts_to_group(bottom_verts, obj, deform_groups, 'Bottom')
 
     # home turtle
-    pu(bm)
+    pu(bm, turtle)
 
-    home(obj)
+    home(turtle, obj)
 
-    # select left side and assign to vert group
-    lbound = (0, 0, 0)
-    ubound = (0, dims[1], dims[2])
-    buffer = margin / 2
+    # find verts on each side in a single pass
+    bm.verts.ensure_lookup_table()
+    sides = classify_verts_in_bounds(
+        {
+            'Left': ((0, 0, 0), (0, dims[1], dims[2])),
+            'Right': ((dims[0], 0, 0), dims),
+            'Front': ((margin, 0, margin), (dims[0] - margin, 0, dims[2] - margin)),
+            'Back': ((margin, dims[1], margin), (dims[0] - margin, dims[1], dims[2] - margin))},
+        margin / 2,
+        bm_vert_coords(bm))
+
+    # left and right don't contain any top verts
+    for side in ('Left', 'Right'):
+        side_verts = [bm.verts[i] for i in np.setdiff1d(sides[side], top_indices)]
+        assign_verts_to_group(side_verts, obj, deform_groups, side)
+
+    # make sure top verts doesn't contain any verts from ends
+    ends = np.union1d(sides['Left'], sides['Right'])
+    top_verts = [bm.verts[i] for i in np.setdiff1d(top_indices, ends)]
+    assign_verts_to_group(top_verts, obj, deform_groups, 'Top')
 
-    left_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
-    left_verts = [v for v in left_verts_orig if v not in top_verts]
-    assign_verts_to_group(left_verts, obj, deform_groups, 'Left')
+    for side in ('Front', 'Back'):
+        side_verts = [bm.verts[i] for i in sides[side]]
+        assign_verts_to_group(side_verts, obj, deform_groups, side)
 
-    # select right side and assign to vert group
-    lbound = (dims[0], 0, 0)
-    ubound = dims
-    buffer = margin / 2
+    # finalise turtle and release bmesh
+    finalise_turtle(bm, obj, turtle)
 
-    right_verts_orig = select_verts_in_bounds(lbound, ubound, buffer, bm)
-    right_verts = [v for v in right_verts_orig if v not in top_verts]
-    assign_verts_to_group(right_verts, obj, deform_groups, 'Right')
+    return obj
 
-    # make sure top verts doesn;t contain any verts from ends
-    top_verts = [v for v in top_verts if v not in left_verts_orig and v not in right_verts_orig]
-    assign_verts_to_group(top_verts, obj, deform_groups, 'Top')
 
-    # select front side and assign to vert group
-    lbound = (margin, 0, margin)
-    ubound = (dims[0] - margin, 0, dims[2] - margin)
-    buffer = margin / 2
+@cached_core
+def generate_straight_wall_core(dims, subdivs, margin=0.001):
+    """Generates a Straight Wall Core directly from its dimensions and assigns Verts to groups
 
-    front_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
-    assign_verts_to_group(front_verts, obj, deform_groups, 'Front')
+    Produces the same mesh and vertex groups as draw_straight_wall_core without
+    extruding step by step.
 
-    # select back side and assign to vert group
-    lbound = (margin, dims[1], margin)
-    ubound = (dims[0] - margin, dims[1], dims[2] - margin)
-    buffer = margin / 2
+    Args:
+        dims (tuple[3]): X, Y, Z Dimensions
+        subdivs (tuple[3]): How many times to subdivide each face
+        margin (float, optional): Margin to leave around textured areas to correct for displacement distortion.
+        Defaults to 0.001.
+
+    Returns:
+        bpy.types.Object: Wall Core
+    """
+    return core_to_object('Straight Wall', *straight_wall_core(dims, subdivs, margin))
 
-    back_verts = select_verts_in_bounds(lbound, ubound, buffer, bm)
-    assign_verts_to_group(back_verts, obj, deform_groups, 'Back')
 
-    # finalise turtle and release bmesh
-    finalise_turtle(bm, obj)
+@cached_core
+def generate_rectangular_floor_core(dims, subdivs, margin=0.001):
+    """Generates a rectangular floor core directly from its dimensions and assigns Verts to groups
 
-    return obj
+    Produces the same mesh and vertex groups as draw_rectangular_floor_core without
+    extruding step by step.
+
+    Args:
+        dims (tuple[3]): Dimensions
+        subdivs (tuple[3]): How many times to subdivide each face
+        margin (float, optional): Margin to leave around textured areas
+        to correct for displacement distortion.
+        Defaults to 0.001.
+
+    Returns:
+        bpy.types.Object: Floor Core
+    """
+    return core_to_object('Rectangular Floor', *rectangular_floor_core(dims, subdivs, margin))
 
 
 def draw_corner_core(
@@ -534,8 +592,6 @@ def draw_corner_core(
     base_height = dimensions['base_height']
     height = dimensions['height']
 
-    turtle = bpy.context.scene.cursor
-    turtle_start_loc = turtle.location.copy()
     vert_groups = [
         'Leg 1 End',
         'Leg 2 End',
@@ -548,7 +604,7 @@ def draw_corner_core(
         'Leg 1 Bottom',
         'Leg 2 Bottom']
 
-    bm, obj = create_turtle('L_2D', vert_groups)
+    bm, obj, turtle = create_turtle('L_2D', vert_groups)
     # create vertex group layer
     bm.verts.layers.deform.verify()
     deform_groups = bm.verts.layers.deform.active
@@ -561,23 +617,23 @@ def draw_corner_core(
 
     # move turtle to core start loc
     orig_rot = turtle.rotation_euler.copy()
-    pu(bm)
-    up(bm, base_height)
-    rt(angle)
-    fd(bm, triangles_1['a_adj'])
-    lt(90)
-    fd(bm, thickness_diff / 2)
-    lt(90)
-    fd(bm, triangles_1['b_adj'])
+    pu(bm, turtle)
+    up(bm, turtle, base_height)
+    rt(turtle, angle)
+    fd(bm, turtle, triangles_1['a_adj'])
+    lt(turtle, 90)
+    fd(bm, turtle, thickness_diff / 2)
+    lt(turtle, 90)
+    fd(bm, turtle, triangles_1['b_adj'])
     turtle.rotation_euler = orig_rot
     turtle_start_loc = turtle.location.copy()
-    pd(bm)
+    pd(bm, turtle)
     # draw leg 1
     # outer edge
     subdiv_dist = (triangles_2['a_adj'] - margin) / native_subdivisions['leg 1']
 
-    add_vert(bm)
-    rt(angle)
+    add_vert(bm, turtle)
+    rt(turtle, angle)
     bm.verts.ensure_lookup_table()
     leg_1_outer_vert_locs.append(verts[-1].co.copy())
 
@@ -585,9 +641,9 @@ def draw_corner_core(
     bm.verts.ensure_lookup_table()
     start_index = verts[-1].index
     while i < native_subdivisions['leg 1']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
-    fd(bm, margin)
+    fd(bm, turtle, margin)
 
     i = start_index
     bm.verts.ensure_lookup_table()
@@ -601,23 +657,23 @@ def draw_corner_core(
     # end
     # we're going to bridge between inner and outer side
     # so we don't draw end edge
-    pu(bm)
-    lt(90)
-    fd(bm, thickness)
-    pd(bm)
-    add_vert(bm)
+    pu(bm, turtle)
+    lt(turtle, 90)
+    fd(bm, turtle, thickness)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
     bm.verts.ensure_lookup_table()
     leg_1_end_vert_locs.append(verts[-1].co.copy())
-    lt(90)
+    lt(turtle, 90)
 
     # inner
     subdiv_dist = (triangles_2['b_adj'] - margin) / native_subdivisions['leg 1']
     bm.verts.ensure_lookup_table()
     start_index = verts[-1].index
-    fd(bm, margin)
+    fd(bm, turtle, margin)
     i = 0
     while i < native_subdivisions['leg 1']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
 
     i = start_index
@@ -627,10 +683,10 @@ def draw_corner_core(
         i += 1
 
     # home
-    pu(bm)
-    home(obj)
+    pu(bm, turtle)
+    home(turtle, obj)
     turtle.location = turtle_start_loc
-    pd(bm)
+    pd(bm, turtle)
 
     # draw leg 2 #
     leg_2_outer_vert_locs = []
@@ -639,16 +695,16 @@ def draw_corner_core(
     subdiv_dist = (triangles_2['c_adj'] - margin) / native_subdivisions['leg 2']
 
     # outer
-    add_vert(bm)
+    add_vert(bm, turtle)
     bm.verts.ensure_lookup_table()
     leg_2_outer_vert_locs.append(verts[-1].co.copy())
     start_index = verts[-1].index
 
     i = 0
     while i < native_subdivisions['leg 2']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
-    fd(bm, margin)
+    fd(bm, turtle, margin)
 
     bm.verts.ensure_lookup_table()
     i = start_index + 1
@@ -657,26 +713,26 @@ def draw_corner_core(
         i += 1
 
     # end
-    pu(bm)
-    rt(90)
+    pu(bm, turtle)
+    rt(turtle, 90)
 
     bm.verts.ensure_lookup_table()
     leg_2_end_vert_locs.append(verts[-1].co.copy())
-    fd(bm, thickness)
-    pd(bm)
-    add_vert(bm)
+    fd(bm, turtle, thickness)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
     bm.verts.ensure_lookup_table()
     leg_2_end_vert_locs.append(verts[-1].co.copy())
-    rt(90)
+    rt(turtle, 90)
 
     # inner
     subdiv_dist = (triangles_2['d_adj'] - margin) / native_subdivisions['leg 2']
     bm.verts.ensure_lookup_table()
     start_index = verts[-1].index
-    fd(bm, margin)
+    fd(bm, turtle, margin)
     i = 0
     while i < native_subdivisions['leg 2']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
 
     i = start_index
@@ -700,15 +756,16 @@ def draw_corner_core(
     bm_select_all(bm)
     bm.select_mode = {'FACE'}
 
-    up(bm, margin, False)
+    up(bm, turtle, margin, False)
 
     i = 0
     while i < native_subdivisions['height']:
-        up(bm, subdiv_dist)
+        up(bm, turtle, subdiv_dist)
         i += 1
-    up(bm, margin)
+    up(bm, turtle, margin)
 
-    home(obj)
+    home(turtle, obj)
+    release_turtle(turtle, obj)
 
     vert_locs = {
         'Leg 1 Inner': leg_1_inner_vert_locs,
@@ -721,6 +778,7 @@ def draw_corner_core(
     return bm, obj, deform_groups, vert_locs
 
 
+@cached_core
 def draw_corner_floor_core(
         dimensions,
         native_subdivisions,
@@ -787,6 +845,7 @@ def draw_corner_floor_core(
     return core
 
 
+@cached_core
 def draw_corner_wall_core(
         dimensions,
         native_subdivisions,
@@ -1115,33 +1174,31 @@ def draw_corner_slot_cutter(dimensions):
     thickness = dimensions['thickness']
     thickness_diff = dimensions['thickness_diff']
 
-    turtle = bpy.context.scene.cursor
+    bm, obj, turtle = create_turtle('cutter')
     orig_rot = turtle.location.copy()
-
-    bm, obj = create_turtle('cutter')
     bm.select_mode = {'VERT'}
 
     # move turtle to slot start loc
-    pu(bm)
-    dn(bm, 0.01)
-    rt(angle)
-    fd(bm, triangles_1['a_adj'])
-    lt(90)
-    fd(bm, thickness_diff)
-    lt(90)
-    fd(bm, triangles_1['b_adj'])
+    pu(bm, turtle)
+    dn(bm, turtle, 0.01)
+    rt(turtle, angle)
+    fd(bm, turtle, triangles_1['a_adj'])
+    lt(turtle, 90)
+    fd(bm, turtle, thickness_diff)
+    lt(turtle, 90)
+    fd(bm, turtle, triangles_1['b_adj'])
     turtle.rotation_euler = orig_rot
     turtle_start_loc = turtle.location.copy()
-    pd(bm)
+    pd(bm, turtle)
 
     # draw leg_1
-    add_vert(bm)
-    rt(angle)
-    fd(bm, triangles_2['a_adj'])
-    lt(90)
-    fd(bm, thickness)
-    lt(90)
-    fd(bm, triangles_2['b_adj'])
+    add_vert(bm, turtle)
+    rt(turtle, angle)
+    fd(bm, turtle, triangles_2['a_adj'])
+    lt(turtle, 90)
+    fd(bm, turtle, thickness)
+    lt(turtle, 90)
+    fd(bm, turtle, triangles_2['b_adj'])
 
     bmesh.ops.contextual_create(
         bm,
@@ -1150,16 +1207,16 @@ def draw_corner_slot_cutter(dimensions):
         use_smooth=False
     )
     bm_deselect_all(bm)
-    home(obj)
+    home(turtle, obj)
     turtle.location = turtle_start_loc
 
     # draw leg 2
-    add_vert(bm)
-    fd(bm, triangles_2['c_adj'])
-    rt(90)
-    fd(bm, thickness)
-    rt(90)
-    fd(bm, triangles_2['d_adj'])
+    add_vert(bm, turtle)
+    fd(bm, turtle, triangles_2['c_adj'])
+    rt(turtle, 90)
+    fd(bm, turtle, thickness)
+    rt(turtle, 90)
+    fd(bm, turtle, triangles_2['d_adj'])
     bm.verts.ensure_lookup_table()
     verts = [v for v in bm.verts if v.index >= 3]
 
@@ -1173,10 +1230,10 @@ def draw_corner_slot_cutter(dimensions):
     bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, height, False)
+    up(bm, turtle, height, False)
 
-    home(obj)
-    finalise_turtle(bm, obj)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
 
@@ -1209,20 +1266,18 @@ def draw_corner_3D(triangles, dimensions):
     height = dimensions['height']
     thickness = dimensions['thickness']
 
-    turtle = bpy.context.scene.cursor
+    bm, obj, turtle = create_turtle('L_2D')
     orig_rot = turtle.location.copy()
-
-    bm, obj = create_turtle('L_2D')
     bm.select_mode = {'VERT'}
 
     # draw leg_1
-    add_vert(bm)
-    rt(angle)
-    fd(bm, triangles['a_adj'])
-    lt(90)
-    fd(bm, thickness)
-    lt(90)
-    fd(bm, triangles['b_adj'])
+    add_vert(bm, turtle)
+    rt(turtle, angle)
+    fd(bm, turtle, triangles['a_adj'])
+    lt(turtle, 90)
+    fd(bm, turtle, thickness)
+    lt(turtle, 90)
+    fd(bm, turtle, triangles['b_adj'])
 
     bmesh.ops.contextual_create(
         bm,
@@ -1231,16 +1286,16 @@ def draw_corner_3D(triangles, dimensions):
         use_smooth=False
     )
     bm_deselect_all(bm)
-    home(obj)
+    home(turtle, obj)
     turtle.rotation_euler = orig_rot
 
     # draw leg 2
-    add_vert(bm)
-    fd(bm, triangles['c_adj'])
-    rt(90)
-    fd(bm, thickness)
-    rt(90)
-    fd(bm, triangles['d_adj'])
+    add_vert(bm, turtle)
+    fd(bm, turtle, triangles['c_adj'])
+    rt(turtle, 90)
+    fd(bm, turtle, thickness)
+    rt(turtle, 90)
+    fd(bm, turtle, triangles['d_adj'])
     bm.verts.ensure_lookup_table()
     verts = [v for v in bm.verts if v.index >= 3]
 
@@ -1254,10 +1309,10 @@ def draw_corner_3D(triangles, dimensions):
     bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, height, False)
+    up(bm, turtle, height, False)
 
-    home(obj)
-    finalise_turtle(bm, obj)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
 
@@ -1276,23 +1331,24 @@ def draw_curved_cuboid(name, radius, segments, deg, height, width):
     Returns:
         bpy.types.Object: Object
     """
-    bm, obj = create_turtle(name)
+    bm, obj, turtle = create_turtle(name)
     bm.select_mode = {'VERT'}
-    arc(bm, radius, deg, segments)
+    arc(bm, turtle, radius, deg, segments)
     bm_deselect_all(bm)
-    arc(bm, radius + width, deg, segments)
+    arc(bm, turtle, radius + width, deg, segments)
     bmesh.ops.bridge_loops(bm, edges=bm.edges)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    pd(bm)
-    up(bm, height, False)
-    home(obj)
-    finalise_turtle(bm, obj)
+    pd(bm, turtle)
+    up(bm, turtle, height, False)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
 
 
-def draw_rectangular_floor_core(dims, subdivs, margin=0.001):
+@cached_core
+def draw_rectangular_floor_core(dims, subdivs, margin=0.001, use_builder=False):
     """Draws a rectangular floor core and assigns Verts to appropriate groups
 
     Args:
@@ -1301,127 +1357,92 @@ def draw_rectangular_floor_core(dims, subdivs, margin=0.001):
         margin (float, optional): Margin to leave around textured areas
         to correct for displacement distortion.
         Defaults to 0.001.
+        use_builder (bool, optional): Record geometry in a MeshBuilder and emit it in one go
+        rather than extruding the bmesh step by step. Defaults to False.
 
     Returns:
         bpy.types.Object: Floor Core
     """
     vert_groups = ['Left', 'Right', 'Front', 'Back', 'Top', 'Bottom']
-    bm, obj = create_turtle('Rectangular Floor', vert_groups)
-
-    # create vertex group layer
-    bm.verts.layers.deform.verify()
-    deform_groups = bm.verts.layers.deform.active
-    bm.select_mode = {'VERT'}
+    bm, obj, turtle = create_turtle('Rectangular Floor', vert_groups)
+    draw = MeshBuilder() if use_builder else bm
+    draw.select_mode = {'VERT'}
 
     # Start drawing core
-    pd(bm)
-    add_vert(bm)
-    bm.select_mode = {'VERT'}
+    pd(draw, turtle)
+    add_vert(draw, turtle)
+    draw.select_mode = {'VERT'}
 
     # Draw front bottom edges
-    ri(bm, margin)
+    ri(draw, turtle, margin)
 
     subdiv_x_dist = (dims[0] - (margin * 2)) / subdivs[0]
 
     i = 0
     while i < subdivs[0]:
-        ri(bm, subdiv_x_dist)
+        ri(draw, turtle, subdiv_x_dist)
         i += 1
 
-    ri(bm, margin)
+    ri(draw, turtle, margin)
 
     # Select edge and extrude to create bottom
-    bm.select_mode = {'EDGE'}
-    bm_select_all(bm)
-    fd(bm, margin)
+    draw.select_mode = {'EDGE'}
+    bm_select_all(draw)
+    fd(draw, turtle, margin)
 
     subdiv_y_dist = (dims[1] - (margin * 2)) / subdivs[1]
 
     i = 0
     while i < subdivs[1]:
-        fd(bm, subdiv_y_dist)
+        fd(draw, turtle, subdiv_y_dist)
         i += 1
 
-    fd(bm, margin)
+    fd(draw, turtle, margin)
 
     # select bottom and extrude up
-    bm.select_mode = {'FACE'}
-    bm_select_all(bm)
-    up(bm, margin, False)
+    draw.select_mode = {'FACE'}
+    bm_select_all(draw)
+    up(draw, turtle, margin, False)
 
     subdiv_z_dist = (dims[2] - (margin * 2)) / subdivs[2]
 
     i = 0
     while i < subdivs[2]:
-        up(bm, subdiv_z_dist)
+        up(draw, turtle, subdiv_z_dist)
         i += 1
 
-    up(bm, margin)
-
-    # home turtle
-    pu(bm)
-
-    home(obj)
-
-    # select left
-    left_verts = select_verts_in_bounds(
-        lbound=(0, 0, 0),
-        ubound=(0, dims[1], dims[2]),
-        buffer=margin / 2,
-        bm=bm)
-
-    assign_verts_to_group(left_verts, obj, deform_groups, 'Left')
-
-    # select Right
-    right_verts = select_verts_in_bounds(
-        lbound=(dims[1], 0, 0),
-        ubound=(dims[1], dims[1], dims[2]),
-        buffer=margin / 2,
-        bm=bm)
-
-    assign_verts_to_group(right_verts, obj, deform_groups, 'Right')
-
-    # Select Front
-    front_verts = select_verts_in_bounds(
-        lbound=(0, 0, 0),
-        ubound=(dims[0], 0, dims[2]),
-        buffer=margin / 2,
-        bm=bm
-    )
-
-    assign_verts_to_group(front_verts, obj, deform_groups, 'Front')
+    up(draw, turtle, margin)
 
-    # Select back
-    back_verts = select_verts_in_bounds(
-        lbound=(0, dims[1], 0),
-        ubound=(dims[0], dims[1], dims[2]),
-        buffer=margin / 2,
-        bm=bm
-    )
-
-    assign_verts_to_group(back_verts, obj, deform_groups, 'Back')
+    if use_builder:
+        draw.emit(bm, obj.data)
 
-    # Select top
-    top_verts = select_verts_in_bounds(
-        lbound=(0 + margin, 0 + margin, dims[2]),
-        ubound=(dims[0] - margin, dims[1] - margin, dims[2]),
-        buffer=margin / 2,
-        bm=bm
-    )
+    # create vertex group layer
+    bm.verts.layers.deform.verify()
+    deform_groups = bm.verts.layers.deform.active
 
-    assign_verts_to_group(top_verts, obj, deform_groups, 'Top')
+    # home turtle
+    pu(bm, turtle)
 
-    # Select bottom
-    bottom_verts = select_verts_in_bounds(
-        lbound=(0 + margin, 0 + margin, 0),
-        ubound=(dims[0] - margin, dims[1] - margin, 0),
-        buffer=margin / 2,
-        bm=bm
-    )
+    home(turtle, obj)
 
-    assign_verts_to_group(bottom_verts, obj, deform_groups, 'Bottom')
+    # find verts on each side in a single pass
+    bm.verts.ensure_lookup_table()
+    sides = classify_verts_in_bounds(
+        {
+            'Left': ((0, 0, 0), (0, dims[1], dims[2])),
+            'Right': ((dims[0], 0, 0), (dims[0], dims[1], dims[2])),
+            'Front': ((0, 0, 0), (dims[0], 0, dims[2])),
+            'Back': ((0, dims[1], 0), (dims[0], dims[1], dims[2])),
+            'Top': ((0 + margin, 0 + margin, dims[2]), (dims[0] - margin, dims[1] - margin, dims[2])),
+            'Bottom': ((0 + margin, 0 + margin, 0), (dims[0] - margin, dims[1] - margin, 0))},
+        margin / 2,
+        bm_vert_coords(bm))
+
+    for side, indices in sides.items():
+        side_verts = [bm.verts[i] for i in indices]
+        assign_verts_to_group(side_verts, obj, deform_groups, side)
 
     # finalise turtle and release bmesh
-    finalise_turtle(bm, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
@@ -0,0 +1,101 @@
+from math import radians
+from mathutils import Vector, Euler, Matrix
+
+
+class Turtle:
+    """Transform and pen state for bmturtle commands.
+
+    The turtle used to be the scene cursor, which meant every step of a draw
+    read and wrote the cursor through RNA. A Turtle keeps the same state in
+    plain mathutils types and is only synced with the cursor at the start and
+    end of a draw.
+
+    Args:
+        location (Vector[3], optional): start location. Defaults to (0, 0, 0).
+        rotation_euler (Euler, optional): start rotation. Defaults to (0, 0, 0).
+        penstate (bool, optional): Whether turtle draws when moved. Defaults to True.
+    """
+
+    def __init__(self, location=(0, 0, 0), rotation_euler=(0, 0, 0), penstate=True):
+        self._location = Vector(location)
+        self._rotation_euler = Euler(rotation_euler)
+        self._basis = None
+        self.penstate = penstate
+
+    @classmethod
+    def from_cursor(cls, cursor, penstate=True):
+        """Return a turtle that starts at the cursor's location and rotation.
+
+        Args:
+            cursor (bpy.types.View3DCursor): scene cursor
+            penstate (bool, optional): Whether turtle draws when moved. Defaults to True.
+
+        Returns:
+            Turtle: turtle
+        """
+        return cls(cursor.location, cursor.rotation_euler, penstate)
+
+    def to_cursor(self, cursor):
+        """Write turtle location and rotation to the cursor.
+
+        Args:
+            cursor (bpy.types.View3DCursor): scene cursor
+        """
+        cursor.location = self._location
+        cursor.rotation_euler = self._rotation_euler
+
+    @property
+    def location(self):
+        """Vector[3]: turtle location."""
+        return self._location
+
+    @location.setter
+    def location(self, value):
+        self._location = Vector(value)
+
+    @property
+    def rotation_euler(self):
+        """Euler: turtle rotation."""
+        return self._rotation_euler
+
+    @rotation_euler.setter
+    def rotation_euler(self, value):
+        self._rotation_euler = Euler(value)
+        self._basis = None
+
+    @property
+    def basis(self):
+        """Matrix[3x3]: turtle rotation matrix. Cached until the turtle turns."""
+        if self._basis is None:
+            self._basis = self._rotation_euler.to_matrix()
+        return self._basis
+
+    @property
+    def matrix(self):
+        """Matrix[4x4]: turtle world matrix."""
+        return Matrix.Translation(self._location) @ self.basis.to_4x4()
+
+    def translate(self, local_trans):
+        """Move turtle along its local axes.
+
+        Args:
+            local_trans (Vector[3]): Local transform vector
+
+        Returns:
+            Vector[3]: transform in world space
+        """
+        world_trans = self.basis @ Vector(local_trans)
+        self._location = self._location + world_trans
+        return world_trans
+
+    def turn(self, degrees):
+        """Rotate turtle around its Z axis.
+
+        Args:
+            degrees (float): degrees, positive turns left
+        """
+        self._rotation_euler = Euler((
+            self._rotation_euler[0],
+            self._rotation_euler[1],
+            self._rotation_euler[2] + radians(degrees)))
+        self._basis = None
@@ -0,0 +1,169 @@
+import numpy as np
+
+# Blender adds this to fit_length before dividing by the offset
+FIT_EPSILON = 1e-6
+
+
+def array_offset(coords, relative_offset=None, constant_offset=None):
+    """Return the offset between copies made by an array modifier.
+
+    Args:
+        coords (ndarray(n, 3)): vert coordinates
+        relative_offset (tuple[3], optional): offset as a factor of the mesh's dimensions. Defaults to None.
+        constant_offset (tuple[3], optional): offset in object space. Defaults to None.
+
+    Returns:
+        ndarray(3): offset
+    """
+    offset = np.zeros(3)
+    if relative_offset is not None and len(coords):
+        offset += np.asarray(relative_offset) * (coords.max(axis=0) - coords.min(axis=0))
+    if constant_offset is not None:
+        offset += np.asarray(constant_offset)
+    return offset
+
+
+def fit_count(fit_length, offset):
+    """Return how many copies an array modifier set to FIT_LENGTH makes.
+
+    Args:
+        fit_length (float): length to fill
+        offset (ndarray(3)): offset between copies
+
+    Returns:
+        int: count
+    """
+    distance = np.linalg.norm(offset)
+    if distance <= FIT_EPSILON:
+        return 1
+    return max(int((fit_length + FIT_EPSILON) / distance + 1), 1)
+
+
+def array_mesh(mesh, count, offset, merge_threshold=None, start_cap=None, end_cap=None):
+    """Repeat a mesh along an offset as an array modifier with constant or relative offset does.
+
+    Meshes are (coords, loop_verts, loop_totals) tuples.
+
+    Args:
+        mesh (tuple): mesh to repeat
+        count (int): number of copies
+        offset (ndarray(3)): offset between copies
+        merge_threshold (float, optional): merge verts of neighbouring copies closer than this. \
+        Defaults to None which doesn't merge.
+        start_cap (tuple, optional): mesh placed one offset before the first copy. Defaults to None.
+        end_cap (tuple, optional): mesh placed one offset after the last copy. Defaults to None.
+
+    Returns:
+        tuple: arrayed mesh
+    """
+    coords, loop_verts, loop_totals = (np.asarray(a) for a in mesh)
+    offset = np.asarray(offset, dtype=float)
+    vert_count = len(coords)
+
+    steps = np.arange(count)[:, np.newaxis, np.newaxis]
+    new_coords = (coords[np.newaxis] + steps * offset).reshape(-1, 3)
+    new_loops = (loop_verts[np.newaxis] + np.arange(count)[:, np.newaxis] * vert_count).ravel()
+    new_totals = np.tile(loop_totals, count)
+
+    if merge_threshold is not None and count > 1:
+        new_coords, new_loops = _merge_verts(
+            new_coords, new_loops, coords, offset, count, merge_threshold)
+
+    parts = [(new_coords, new_loops, new_totals)]
+    if start_cap is not None:
+        parts.append(_translated(start_cap, -offset))
+    if end_cap is not None:
+        parts.append(_translated(end_cap, offset * count))
+
+    return join_meshes(parts)
+
+
+def join_meshes(meshes):
+    """Join meshes into one without merging any verts.
+
+    Args:
+        meshes (list[tuple]): meshes
+
+    Returns:
+        tuple: joined mesh
+    """
+    coords, loops, totals = [], [], []
+    vert_count = 0
+    for mesh_coords, mesh_loops, mesh_totals in meshes:
+        coords.append(np.asarray(mesh_coords, dtype=float).reshape(-1, 3))
+        loops.append(np.asarray(mesh_loops) + vert_count)
+        totals.append(np.asarray(mesh_totals))
+        vert_count += len(coords[-1])
+    return np.concatenate(coords), np.concatenate(loops), np.concatenate(totals)
+
+
+def _translated(mesh, offset):
+    coords, loop_verts, loop_totals = mesh
+    return np.asarray(coords, dtype=float).reshape(-1, 3) + offset, loop_verts, loop_totals
+
+
+def _merge_verts(coords, loop_verts, copy_coords, offset, count, threshold):
+    """Merge each vert with the closest vert of the previous copy within threshold.
+
+    Like the array modifier only neighbouring copies are merged, so verts of the
+    same copy are never merged together. As every copy is the same, the pairs are
+    found once between a single copy and a copy moved by offset.
+    """
+    vert_count = len(copy_coords)
+    copy_coords = np.asarray(copy_coords, dtype=float).reshape(-1, 3)
+    pairs = _closest_pairs(copy_coords, copy_coords + offset, threshold)
+    if pairs is None:
+        return coords, loop_verts
+
+    prev_verts, next_verts = pairs
+    target = np.arange(count * vert_count)
+    for i in range(1, count):
+        target[i * vert_count + next_verts] = (i - 1) * vert_count + prev_verts
+
+    # a vert merged into one that was itself merged goes to the end of the chain
+    while True:
+        merged = target[target]
+        if np.array_equal(merged, target):
+            break
+        target = merged
+
+    keep = target == np.arange(len(target))
+    new_index = np.cumsum(keep) - 1
+    return coords[keep], new_index[target[loop_verts]]
+
+
+def _closest_pairs(prev_coords, next_coords, threshold, chunk_size=1024):
+    """Return the closest vert in prev_coords within threshold of each vert in next_coords.
+
+    Only verts near where the two copies overlap are compared.
+
+    Returns:
+        tuple(ndarray[int], ndarray[int]): indices into prev_coords and next_coords, or None if no verts are close enough
+    """
+    if not len(prev_coords):
+        return None
+
+    def near(points, others):
+        lower = others.min(axis=0) - threshold
+        upper = others.max(axis=0) + threshold
+        return np.flatnonzero(np.all((points >= lower) & (points <= upper), axis=1))
+
+    prev_near = near(prev_coords, next_coords)
+    next_near = near(next_coords, prev_coords)
+    if not len(prev_near) or not len(next_near):
+        return None
+
+    candidates = prev_coords[prev_near]
+    prev_verts, next_verts = [], []
+    for start in range(0, len(next_near), chunk_size):
+        chunk = next_near[start:start + chunk_size]
+        dist_sq = ((next_coords[chunk, np.newaxis] - candidates[np.newaxis]) ** 2).sum(axis=2)
+        closest = dist_sq.argmin(axis=1)
+        within = dist_sq[np.arange(len(chunk)), closest] <= threshold ** 2
+        prev_verts.append(prev_near[closest[within]])
+        next_verts.append(chunk[within])
+
+    prev_verts = np.concatenate(prev_verts)
+    if not len(prev_verts):
+        return None
+    return prev_verts, np.concatenate(next_verts)
@@ -0,0 +1,459 @@
+from math import sqrt, cos, acos, sin, radians, degrees
+import numpy as np
+from .grid import (
+    box_grid,
+    wall_core_groups,
+    floor_core_groups,
+    column_core_groups)
+from .prism import extrude_footprint, strip_footprint, wind_anticlockwise
+
+
+def straight_wall_core(dims, subdivs, margin=0.001):
+    """Return a straight wall core.
+
+    Args:
+        dims (tuple[3]): X, Y, Z Dimensions
+        subdivs (tuple[3]): How many times to subdivide each face
+        margin (float, optional): Margin to leave around textured areas. Defaults to 0.001.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        ndarray(m, 4): faces
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    coords, faces, lattice = box_grid(dims, subdivs, margin)
+    return coords, faces, wall_core_groups(lattice)
+
+
+def rectangular_floor_core(dims, subdivs, margin=0.001):
+    """Return a rectangular floor core.
+
+    Args:
+        dims (tuple[3]): X, Y, Z Dimensions
+        subdivs (tuple[3]): How many times to subdivide each face
+        margin (float, optional): Margin to leave around textured areas. Defaults to 0.001.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        ndarray(m, 4): faces
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    coords, faces, lattice = box_grid(dims, subdivs, margin)
+    return coords, faces, floor_core_groups(lattice)
+
+
+def column_core(dims, subdivs, margin=0.001):
+    """Return a column core with its generic vertex groups.
+
+    Args:
+        dims (tuple[3]): X, Y, Z Dimensions
+        subdivs (tuple[3]): How many times to subdivide along X, Y, Z dims
+        margin (float, optional): Margin to leave around textured areas. Defaults to 0.001.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        ndarray(m, 4): faces
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    coords, faces, lattice = box_grid(dims, subdivs, margin)
+    return coords, faces, column_core_groups(lattice)
+
+
+def corner_core(dimensions, native_subdivisions, margin=0.001, wall=True):
+    """Return an L shaped corner core.
+
+    Args:
+        dimensions (dict {
+            triangles_1: dict,
+            triangles_2: dict,
+            angle: float,
+            thickness: float,
+            thickness_diff: float,
+            base_height: float,
+            height: float}): dimensions
+        native_subdivisions (dict {
+            leg 1: int,
+            leg 2: int,
+            width: int,
+            height: int }): subdivisions
+        margin (float, optional): margin for texture. Defaults to 0.001.
+        wall (bool, optional): Whether to assign vertex groups for a wall (textured sides) \
+        or a floor (textured top). Defaults to True.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        list[tuple[int]]: faces
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    triangles_1 = dimensions['triangles_1']
+    triangles_2 = dimensions['triangles_2']
+    angle = dimensions['angle']
+    thickness = dimensions['thickness']
+    thickness_diff = dimensions['thickness_diff']
+    leg_1 = native_subdivisions['leg 1']
+    leg_2 = native_subdivisions['leg 2']
+
+    # outer corner
+    start = _walk((0, 0), -angle, [triangles_1['a_adj']])[-1]
+    start = _walk(start, 90 - angle, [thickness_diff / 2])[-1]
+    start = _walk(start, 180 - angle, [triangles_1['b_adj']])[-1]
+
+    # leg 1 is drawn outwards along its outer side and back along its inner side
+    leg_1_outer = _walk(start, -angle, _steps(triangles_2['a_adj'] - margin, leg_1) + [margin])
+    leg_1_end = _walk(leg_1_outer[-1], 90 - angle, [thickness])[-1]
+    leg_1_inner = _walk(leg_1_end, 180 - angle, [margin] + _steps(triangles_2['b_adj'] - margin, leg_1))
+
+    leg_2_outer = _walk(start, 0, _steps(triangles_2['c_adj'] - margin, leg_2) + [margin])
+    leg_2_end = _walk(leg_2_outer[-1], -90, [thickness])[-1]
+    leg_2_inner = _walk(leg_2_end, -180, [margin] + _steps(triangles_2['d_adj'] - margin, leg_2))
+
+    outer = np.vstack((leg_1_outer[::-1], leg_2_outer[1:]))
+    inner = np.vstack((leg_1_inner, leg_2_inner[::-1][1:]))
+
+    corner = len(leg_1_outer) - 1
+    segments = {
+        'Leg 1': (0, corner),
+        'Leg 2': (corner, len(outer) - 1)}
+
+    coords, faces, raw = _strip_core(
+        outer,
+        inner,
+        segments,
+        native_subdivisions['width'],
+        native_subdivisions['height'],
+        dimensions['base_height'],
+        dimensions['height'],
+        margin)
+
+    if wall:
+        return coords, faces, _wall_groups(raw, ['Leg 1', 'Leg 2'], [])
+    return coords, faces, _floor_groups(raw, ['Leg 1', 'Leg 2'])
+
+
+def u_wall_core(dimensions, subdivs, margin=0.001):
+    """Return a U shaped wall core.
+
+    Args:
+        dimensions (dict{
+            'leg_1_inner': float,
+            'leg_2_inner': float,
+            'base_height': float,
+            'height': float,
+            'x_inner': float,
+            'thickness': float,
+            'thickness_diff': float}): core dimensions
+        subdivs (dict{
+            leg_1: int,
+            leg_2: int,
+            x: int,
+            width: int,
+            height: int}): subdivisions
+        margin (float, optional): Margin to leave around textured areas. Defaults to 0.001.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        list[tuple[int]]: faces
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    thickness = dimensions['thickness']
+    thickness_diff = dimensions['thickness_diff']
+
+    leg_1_inner = dimensions['leg_1_inner'] + (thickness_diff / 2)
+    leg_2_inner = dimensions['leg_2_inner'] + (thickness_diff / 2)
+    leg_1_outer = leg_1_inner + thickness
+    leg_2_outer = leg_2_inner + thickness
+
+    x_inner = dimensions['x_inner'] + thickness_diff
+    x_outer = x_inner + (thickness * 2)
+
+    start = (thickness_diff / 2, thickness_diff / 2)
+
+    # both sides run from the end of leg 1, along the end wall to the end of leg 2
+    outer_leg_1 = _walk(start, 0, _steps(leg_1_outer - margin, subdivs['leg_1']) + [margin])[::-1]
+    outer_x = _walk(start, -90, _steps(x_outer, subdivs['x']))
+    outer_leg_2 = _walk(outer_x[-1], 0, _steps(leg_2_outer - margin, subdivs['leg_2']) + [margin])
+
+    inner_leg_1 = _walk(
+        _walk(outer_leg_1[0], -90, [thickness])[-1],
+        -180,
+        [margin] + _steps(leg_1_inner - margin, subdivs['leg_1']))
+    inner_x = _walk(inner_leg_1[-1], -90, _steps(x_inner, subdivs['x']))
+    inner_leg_2 = _walk(inner_x[-1], 0, _steps(leg_2_inner - margin, subdivs['leg_2']) + [margin])
+
+    outer = np.vstack((outer_leg_1, outer_x[1:], outer_leg_2[1:]))
+    inner = np.vstack((inner_leg_1, inner_x[1:], inner_leg_2[1:]))
+
+    corner_1 = len(outer_leg_1) - 1
+    corner_2 = corner_1 + len(outer_x) - 1
+    segments = {
+        'Leg 1': (0, corner_1),
+        'End Wall': (corner_1, corner_2),
+        'Leg 2': (corner_2, len(outer) - 1)}
+
+    coords, faces, raw = _strip_core(
+        outer,
+        inner,
+        segments,
+        subdivs['width'],
+        subdivs['height'],
+        dimensions['base_height'],
+        dimensions['height'],
+        margin)
+
+    return coords, faces, _wall_groups(raw, ['Leg 1', 'Leg 2'], ['End Wall'])
+
+
+def tri_floor_core(dimensions, subdivs, margin=0.001):
+    """Return a triangular floor core.
+
+    Args:
+        dimensions (dict{b, c, A, height}): dimensions
+        subdivs (list): subdivs(edge, height)
+        margin (float, optional): margin. Defaults to 0.001.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        list[tuple[int]]: faces
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    #      B
+    #      /\
+    #   c /  \ a
+    #    /    \
+    #   /______\
+    #  A    b    C
+    b = dimensions['b']
+    c = dimensions['c']
+    A = dimensions['A']
+
+    a = sqrt((b**2 + c**2) - ((2 * b * c) * cos(radians(A))))
+    B = degrees(acos((c**2 + a**2 - (b**2)) / (2 * c * a)))
+
+    loc_A = np.zeros(2)
+    loc_B = np.array((0, c))
+    loc_C = loc_B + a * np.array((sin(radians(B)), -cos(radians(B))))
+
+    cuts = subdivs[0] + 1
+    i, j = np.array([(i, j) for i in range(cuts + 1) for j in range(cuts + 1 - i)]).T
+    points = loc_A + np.outer(i / cuts, loc_B - loc_A) + np.outer(j / cuts, loc_C - loc_A)
+
+    index = {(p, q): n for n, (p, q) in enumerate(zip(i.tolist(), j.tolist()))}
+    polys = []
+    for p, q in index:
+        if p + q < cuts:
+            polys.append((index[p, q], index[p + 1, q], index[p, q + 1]))
+        if p + q < cuts - 1:
+            polys.append((index[p + 1, q], index[p + 1, q + 1], index[p, q + 1]))
+
+    polys = wind_anticlockwise(points, polys)
+    z_levels = np.linspace(0, dimensions['height'], subdivs[1] + 1)
+
+    sides = {
+        'Side a': i + j == cuts,
+        'Side b': i == 0,
+        'Side c': j == 0}
+
+    return _capped_core(points, polys, z_levels, margin, sides)
+
+
+def semi_circ_core(dimensions, subdivs, margin=0.001, curve_type='POS'):
+    """Return a semi circular core.
+
+    Args:
+        dimensions (dict{
+            radius: float,
+            angle: float,
+            height: float}): dimensions
+        subdivs (dict{
+            sides: float,
+            arc: float}): subdivisions
+        margin (float): margin between textured and blank area
+        curve_type (str, optional): 'POS' for a convex curved side, 'NEG' for concave. Defaults to 'POS'.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        list[tuple[int]]: faces
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    #   B
+    #   |\
+    # c |   \ a
+    #   |      \
+    #   |________ \
+    #  A    b    C
+    radius = dimensions['radius']
+    angle = radians(dimensions['angle'])
+    sides = int(subdivs['sides'])
+    arc = int(subdivs['arc'])
+
+    if curve_type == 'POS':
+        # arc is centred on A
+        centre = np.zeros(2)
+        start = np.pi / 2
+        end = np.pi / 2 - angle
+    else:
+        # arc is centred on the reflection of A in BC so it curves towards A
+        loc_B = np.array((0, radius))
+        loc_C = radius * np.array((sin(angle), cos(angle)))
+        centre = loc_B + loc_C
+        start = np.arctan2(*(loc_B - centre)[::-1])
+        end = np.arctan2(*(loc_C - centre)[::-1])
+        if end < start:
+            end += 2 * np.pi
+
+    theta = np.linspace(start, end, arc + 1)
+    arc_points = centre + radius * np.column_stack((np.cos(theta), np.sin(theta)))
+
+    # rays from A to each point on the arc, split into rings
+    k, j = np.divmod(np.arange(sides * (arc + 1)), arc + 1)
+    k = k + 1
+    points = np.vstack((np.zeros(2), np.outer(k / sides, np.ones(2)) * arc_points[j]))
+    k = np.concatenate(([0], k))
+    j = np.concatenate(([-1], j))
+
+    def ring(kk, jj):
+        return 0 if kk == 0 else 1 + (kk - 1) * (arc + 1) + jj
+
+    polys = [(0, ring(1, jj), ring(1, jj + 1)) for jj in range(arc)]
+    polys.extend(
+        (ring(kk, jj), ring(kk + 1, jj), ring(kk + 1, jj + 1), ring(kk, jj + 1))
+        for kk in range(1, sides) for jj in range(arc))
+
+    polys = wind_anticlockwise(points, polys)
+
+    groups = {
+        'Side a': k == sides,
+        'Side b': (j == arc) | (k == 0),
+        'Side c': (j == 0) | (k == 0)}
+
+    return _capped_core(points, polys, np.array((0, dimensions['height'])), margin, groups)
+
+
+def _steps(length, count):
+    return [length / count] * count
+
+
+def _walk(start, heading, distances):
+    """Return points visited by a turtle moving forward distances from start.
+
+    Args:
+        start (tuple[2]): start location
+        heading (float): degrees, 0 is along +Y, positive turns left
+        distances (list[float]): distance of each step
+
+    Returns:
+        ndarray(len(distances) + 1, 2): points including start
+    """
+    direction = np.array((-sin(radians(heading)), cos(radians(heading))))
+    travelled = np.concatenate(([0], np.cumsum(distances)))
+    return np.asarray(start, dtype=float) + np.outer(travelled, direction)
+
+
+def _z_levels(base_height, height, subdivs, margin):
+    return base_height + np.concatenate((
+        [0],
+        np.linspace(margin, height - margin, subdivs + 1),
+        [height]))
+
+
+def _strip_core(outer, inner, segments, width_subdivs, height_subdivs, base_height, height, margin):
+    """Extrude a strip between outer and inner and return raw per segment vertex groups.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        list[tuple[int]]: faces
+        dict{str: ndarray[bool]}: vert masks for '<segment> Inner', 'Outer', 'End', 'Top' and 'Bottom'
+    """
+    points, polys, column, row = strip_footprint(outer, inner, width_subdivs, margin)
+    z_levels = _z_levels(base_height, height, height_subdivs, margin)
+    coords, faces, point, level, _ = extrude_footprint(points, polys, z_levels)
+
+    column = column[point]
+    row = row[point]
+    last_row = row.max()
+    last_column = column.max()
+    top = len(z_levels) - 1
+
+    raw = {}
+    for name, (first, last) in segments.items():
+        in_segment = (column >= first) & (column <= last)
+        raw[name + ' Inner'] = in_segment & (row == last_row)
+        raw[name + ' Outer'] = in_segment & (row == 0)
+        raw[name + ' Top'] = in_segment & (level == top)
+        raw[name + ' Bottom'] = in_segment & (level == 0)
+        if first == 0:
+            raw[name + ' End'] = column == 0
+        if last == last_column:
+            raw[name + ' End'] = column == last_column
+
+    return coords, faces, raw
+
+
+def _wall_groups(raw, legs, walls):
+    """Vertex groups for a strip core with textured sides."""
+    blank = np.zeros(len(next(iter(raw.values()))), dtype=bool)
+    for name in legs:
+        blank |= raw[name + ' Top'] | raw[name + ' End'] | raw[name + ' Bottom']
+    for name in walls:
+        blank |= raw[name + ' Top'] | raw[name + ' Bottom']
+
+    groups = {}
+    for name in legs:
+        groups[name + ' End'] = raw[name + ' End'] & ~raw[name + ' Top']
+    for name in legs + walls:
+        groups[name + ' Inner'] = raw[name + ' Inner'] & ~blank
+    for name in walls:
+        groups[name + ' Outer'] = raw[name + ' Outer'] & ~blank
+    for name in legs:
+        groups[name + ' Outer'] = raw[name + ' Outer'] & ~blank
+    for name in legs:
+        groups[name + ' Top'] = raw[name + ' Top'] & ~raw[name + ' End']
+    for name in walls:
+        groups[name + ' Top'] = raw[name + ' Top']
+    for name in legs:
+        groups[name + ' Bottom'] = raw[name + ' Bottom'] & ~raw[name + ' End']
+    for name in walls:
+        groups[name + ' Bottom'] = raw[name + ' Bottom']
+
+    return {name: np.flatnonzero(mask) for name, mask in groups.items()}
+
+
+def _floor_groups(raw, legs):
+    """Vertex groups for a strip core with a textured top."""
+    sides = ['End', 'Inner', 'Outer']
+    blank = np.zeros(len(next(iter(raw.values()))), dtype=bool)
+    for name in legs:
+        for side in sides + ['Bottom']:
+            blank |= raw[name + ' ' + side]
+
+    groups = {}
+    for side in sides:
+        for name in legs:
+            groups[name + ' ' + side] = raw[name + ' ' + side]
+    for name in legs:
+        groups[name + ' Top'] = raw[name + ' Top'] & ~blank
+    for name in legs:
+        groups[name + ' Bottom'] = raw[name + ' Bottom']
+
+    return {name: np.flatnonzero(mask) for name, mask in groups.items()}
+
+
+def _capped_core(points, polys, z_levels, margin, sides):
+    """Extrude a footprint with an inset top and return side, top and bottom vertex groups.
+
+    Args:
+        sides (dict{str: ndarray[bool]}): footprint points on each side
+    """
+    coords, faces, point, level, in_ring = extrude_footprint(points, polys, z_levels, inset=margin)
+
+    groups = {}
+    on_side = np.zeros(len(coords), dtype=bool)
+    for name, on_footprint_side in sides.items():
+        groups[name] = on_footprint_side[point] & ~in_ring
+        on_side |= groups[name]
+
+    bottom = level == 0
+    groups['Top'] = ~(on_side | bottom)
+    groups['Bottom'] = bottom
+
+    return coords, faces, {name: np.flatnonzero(mask) for name, mask in groups.items()}
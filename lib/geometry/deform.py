@@ -0,0 +1,79 @@
+import numpy as np
+
+
+def bend_factor(coords, angle):
+    """Return the bend factor for bending coordinates through angle.
+
+    Args:
+        coords (ndarray(n, 3)): vert coordinates
+        angle (float): angle of arc in radians
+
+    Returns:
+        float: angle of arc per unit along X
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+    extent = coords[:, 0].max() - coords[:, 0].min() if len(coords) else 0
+    return angle / max(extent, np.finfo(np.float32).eps)
+
+
+def bend(coords, angle):
+    """Bend coordinates around the Z axis.
+
+    Gives the same result as a SIMPLE_DEFORM modifier with deform_method 'BEND' and
+    deform_axis 'Z'. The geometry's extent along X is wrapped onto an arc of angle radians
+    whose centre is on the Y axis at extent / angle. Negative angles bend towards -Y.
+
+    Args:
+        coords (ndarray(n, 3)): vert coordinates
+        angle (float): angle of arc in radians
+
+    Returns:
+        ndarray(n, 3): bent coordinates
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+    factor = bend_factor(coords, angle)
+
+    if abs(factor) <= 1e-7:
+        return coords.copy()
+
+    theta = coords[:, 0] * factor
+    radius = coords[:, 1] - 1 / factor
+
+    bent = coords.copy()
+    bent[:, 0] = -radius * np.sin(theta)
+    bent[:, 1] = radius * np.cos(theta) + 1 / factor
+    return bent
+
+
+def unbend(coords, factor, centre=0.0):
+    """Straighten coordinates bent by bend.
+
+    Angles around the bend's centre are measured from the middle of the arc so
+    any arc of less than 360 degrees straightens back to where it started.
+
+    Args:
+        coords (ndarray(n, 3)): bent vert coordinates
+        factor (float): bend factor returned by bend_factor
+        centre (float, optional): X coordinate of the middle of the straight geometry. Defaults to 0.0.
+
+    Returns:
+        ndarray(n, 3): straight coordinates
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+
+    if abs(factor) <= 1e-7:
+        return coords.copy()
+
+    dx = coords[:, 0]
+    dy = coords[:, 1] - 1 / factor
+    # verts lie on the opposite side of the bend's centre to the arc's centre of curvature
+    radius = -np.sign(factor) * np.hypot(dx, dy)
+
+    middle = centre * factor
+    theta = np.arctan2(-dx / radius, dy / radius)
+    theta = middle + (theta - middle + np.pi) % (2 * np.pi) - np.pi
+
+    straight = coords.copy()
+    straight[:, 0] = theta / factor
+    straight[:, 1] = radius + 1 / factor
+    return straight
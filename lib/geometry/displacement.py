@@ -0,0 +1,77 @@
+import numpy as np
+
+
+def vertex_uvs(loop_verts, loop_uvs, vert_count):
+    """Return a UV for each vert.
+
+    Verts on a UV seam have more than one UV. Like the Displace modifier the UV of
+    the first loop that uses the vert is taken.
+
+    Args:
+        loop_verts (ndarray[int]): vert index of each loop
+        loop_uvs (ndarray(l, 2)): UV of each loop
+        vert_count (int): number of verts
+
+    Returns:
+        ndarray(n, 2): UV of each vert. Verts not used by any loop get (0, 0)
+    """
+    loop_verts = np.asarray(loop_verts)
+    loop_uvs = np.asarray(loop_uvs, dtype=float).reshape(-1, 2)
+    uvs = np.zeros((vert_count, 2))
+    # with repeated indices the last assignment wins, so assign in reverse
+    uvs[loop_verts[::-1]] = loop_uvs[::-1]
+    return uvs
+
+
+def sample_bilinear(pixels, uvs):
+    """Sample an image at UVs with bilinear interpolation.
+
+    The image repeats outside the 0 - 1 UV square, as an image texture with
+    extension 'REPEAT' does.
+
+    Args:
+        pixels (ndarray(h, w)): single channel image with the bottom row first
+        uvs (ndarray(n, 2)): UVs
+
+    Returns:
+        ndarray(n): sampled values
+    """
+    pixels = np.asarray(pixels)
+    height, width = pixels.shape
+    uvs = np.asarray(uvs, dtype=float).reshape(-1, 2)
+
+    # pixel centres are at (i + 0.5) / size
+    x = uvs[:, 0] * width - 0.5
+    y = uvs[:, 1] * height - 0.5
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = x - x0
+    fy = y - y0
+
+    x0 = x0.astype(np.int64) % width
+    y0 = y0.astype(np.int64) % height
+    x1 = (x0 + 1) % width
+    y1 = (y0 + 1) % height
+
+    bottom = pixels[y0, x0] * (1 - fx) + pixels[y0, x1] * fx
+    top = pixels[y1, x0] * (1 - fx) + pixels[y1, x1] * fx
+    return bottom * (1 - fy) + top * fy
+
+
+def displace(coords, directions, heights, strength=1.0, mid_level=0.0):
+    """Move verts along directions by heights.
+
+    Args:
+        coords (ndarray(n, 3)): vert coordinates
+        directions (ndarray(n, 3)): direction to move each vert, scaled by its vertex group weight
+        heights (ndarray(n)): sampled height of each vert
+        strength (float, optional): height multiplier. Defaults to 1.0.
+        mid_level (float, optional): height that doesn't move verts. Defaults to 0.0.
+
+    Returns:
+        ndarray(n, 3): displaced coordinates
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+    directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+    offsets = (np.asarray(heights, dtype=float) - mid_level) * strength
+    return coords + directions * offsets[:, np.newaxis]
@@ -0,0 +1,174 @@
+import numpy as np
+
+
+def grid_axis(length, subdivs, margin):
+    """Return positions of grid lines along one side of a core.
+
+    Args:
+        length (float): length of side
+        subdivs (int): number of subdivisions between margins
+        margin (float): width of margin strip at each end
+
+    Returns:
+        ndarray(subdivs + 3): positions
+    """
+    return np.concatenate((
+        [0],
+        np.linspace(margin, length - margin, subdivs + 1),
+        [length]))
+
+
+def box_grid(dims, subdivs, margin):
+    """Compute the surface of a subdivided box with margin strips.
+
+    Produces the same mesh as extruding a vert along X, the resulting edges along Y
+    and the resulting face up Z, one subdivision at a time, but computes it directly.
+    Work is linear in the number of verts and faces produced.
+
+    Args:
+        dims (tuple[3]): X, Y, Z Dimensions
+        subdivs (tuple[3]): How many times to subdivide each face
+        margin (float): Margin to leave around textured areas
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        ndarray(m, 4): quads as vert indices, wound so normals face outwards
+        ndarray(n, 3): lattice position of each vert along X, Y and Z
+    """
+    axes = [grid_axis(dims[i], subdivs[i], margin) for i in range(3)]
+    nx, ny, nz = (len(axis) - 1 for axis in axes)
+    i, j, k = np.ix_(np.arange(nx + 1), np.arange(ny + 1), np.arange(nz + 1))
+
+    # only points on the outside of the lattice become verts
+    on_surface = (i == 0) | (i == nx) | (j == 0) | (j == ny) | (k == 0) | (k == nz)
+    lattice = np.argwhere(on_surface)
+
+    index = np.full(on_surface.shape, -1, dtype=int)
+    index[on_surface] = np.arange(len(lattice))
+
+    coords = np.stack([axes[axis][lattice[:, axis]] for axis in range(3)], axis=1)
+
+    # each slice is indexed by its two remaining axes in order, which winds
+    # the quads anticlockwise about +Z, -Y and +X respectively
+    faces = np.concatenate((
+        _grid_quads(index[:, :, 0])[:, ::-1],
+        _grid_quads(index[:, :, nz]),
+        _grid_quads(index[:, 0, :]),
+        _grid_quads(index[:, ny, :])[:, ::-1],
+        _grid_quads(index[0, :, :])[:, ::-1],
+        _grid_quads(index[nx, :, :])))
+
+    return coords, faces, lattice
+
+
+def resize_box_grid(coords, dims, new_dims, subdivs, margin, anchor=(0, 0, 0), tolerance=0.0001):
+    """Move the verts of an existing box_grid mesh so it has new dimensions.
+
+    Topology is unchanged so only vert coordinates are returned. Margin strips keep
+    their width and the subdivisions between them are spaced evenly.
+
+    Args:
+        coords (ndarray(n, 3)): current vert coordinates. These may be offset from \
+        the coordinates box_grid returned, e.g. by changing the object's origin
+        dims (tuple[3]): X, Y, Z Dimensions mesh was generated with
+        new_dims (tuple[3]): new X, Y, Z Dimensions
+        subdivs (tuple[3]): How many times each face was subdivided
+        margin (float): Margin mesh was generated with
+        anchor (tuple[3], optional): Point that stays fixed as a fraction of dims along \
+        each axis e.g. (0, 0.5, 0) keeps the mesh centred on Y. Defaults to (0, 0, 0).
+        tolerance (float, optional): Distance verts may be from where box_grid would put them. \
+        Defaults to 0.0001.
+
+    Returns:
+        ndarray(n, 3): new coordinates or None if coords weren't generated by box_grid \
+        with the same dims, subdivs and margin
+    """
+    old_coords, _, _ = box_grid(dims, subdivs, margin)
+    if old_coords.shape != coords.shape:
+        return None
+
+    # offset must be the same for every vert if only the origin has moved
+    offset = coords - old_coords
+    if np.abs(offset - offset[0]).max() > tolerance:
+        return None
+
+    new_coords, _, _ = box_grid(new_dims, subdivs, margin)
+    shift = np.asarray(anchor) * (np.asarray(dims) - np.asarray(new_dims))
+
+    return new_coords + offset[0] + shift
+
+
+def wall_core_groups(lattice):
+    """Return vertex group membership for a straight wall core.
+
+    Args:
+        lattice (ndarray(n, 3)): lattice positions returned by box_grid
+
+    Returns:
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    i, j, k = lattice.T
+    nx, ny, nz = lattice.max(axis=0)
+    ends = (i == 0) | (i == nx)
+    inner = (i > 0) & (i < nx) & (k > 0) & (k < nz)
+
+    return {
+        'Left': np.flatnonzero((i == 0) & (k != nz)),
+        'Right': np.flatnonzero((i == nx) & (k != nz)),
+        'Front': np.flatnonzero((j == 0) & inner),
+        'Back': np.flatnonzero((j == ny) & inner),
+        'Top': np.flatnonzero((k == nz) & ~ends),
+        'Bottom': np.flatnonzero(k == 0)}
+
+
+def floor_core_groups(lattice):
+    """Return vertex group membership for a rectangular floor core.
+
+    Args:
+        lattice (ndarray(n, 3)): lattice positions returned by box_grid
+
+    Returns:
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    i, j, k = lattice.T
+    nx, ny, nz = lattice.max(axis=0)
+    inner = (i > 0) & (i < nx) & (j > 0) & (j < ny)
+
+    return {
+        'Left': np.flatnonzero(i == 0),
+        'Right': np.flatnonzero(i == nx),
+        'Front': np.flatnonzero(j == 0),
+        'Back': np.flatnonzero(j == ny),
+        'Top': np.flatnonzero((k == nz) & inner),
+        'Bottom': np.flatnonzero((k == 0) & inner)}
+
+
+def column_core_groups(lattice):
+    """Return vertex group membership for a column core.
+
+    Args:
+        lattice (ndarray(n, 3)): lattice positions returned by box_grid
+
+    Returns:
+        dict{str: ndarray[int]}: vert indices in each vertex group
+    """
+    i, j, k = lattice.T
+    nx, ny, nz = lattice.max(axis=0)
+    ends = (i == 0) | (i == nx)
+    middle = (k > 0) & (k < nz)
+
+    return {
+        'Left': np.flatnonzero((i == 0) & middle),
+        'Right': np.flatnonzero((i == nx) & middle),
+        'Front': np.flatnonzero((j == 0) & ~ends & middle),
+        'Back': np.flatnonzero((j == ny) & ~ends & middle),
+        'Top': np.flatnonzero(k == nz),
+        'Bottom': np.array([], dtype=int)}
+
+
+def _grid_quads(index):
+    return np.stack((
+        index[:-1, :-1],
+        index[1:, :-1],
+        index[1:, 1:],
+        index[:-1, 1:]), axis=-1).reshape(-1, 4)
@@ -0,0 +1,194 @@
+from collections import Counter
+import numpy as np
+
+
+def extrude_footprint(points, polys, z_levels, inset=0):
+    """Extrude a 2D footprint into a closed prism.
+
+    Only the footprint's boundary is repeated at intermediate levels, the bottom and
+    top caps are copies of the whole footprint.
+
+    Args:
+        points (ndarray(m, 2)): footprint coordinates
+        polys (list[tuple[int]]): footprint polygons, wound anticlockwise
+        z_levels (ndarray(l)): height of each level, bottom first
+        inset (float, optional): Distance to inset the top cap from its edges by, \
+        like bmesh.ops.inset_region with use_even_offset. Defaults to 0.
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+        list[tuple[int]]: faces as vert indices, wound so normals face outwards
+        ndarray(n): index of footprint point each vert was made from
+        ndarray(n): index of level each vert is on
+        ndarray(n): bool, whether vert is part of the inset ring of the top cap
+    """
+    points = np.asarray(points, dtype=float)
+    m = len(points)
+    top = len(z_levels) - 1
+
+    boundary_next = _boundary_next(polys)
+    boundary = np.fromiter(boundary_next, dtype=int)
+
+    # vert index of each footprint point on each level, -1 where there isn't one
+    index = np.full((top + 1, m), -1, dtype=int)
+    point = []
+    level = []
+    for lvl in range(top + 1):
+        on_level = np.arange(m) if lvl in (0, top) else boundary
+        index[lvl, on_level] = np.arange(len(on_level)) + len(point)
+        point.extend(on_level)
+        level.extend([lvl] * len(on_level))
+
+    point = np.array(point, dtype=int)
+    level = np.array(level, dtype=int)
+    coords = np.column_stack((points[point], np.asarray(z_levels, dtype=float)[level]))
+    in_ring = np.zeros(len(point), dtype=bool)
+
+    faces = [tuple(index[0, p] for p in reversed(poly)) for poly in polys]
+
+    for lvl in range(top):
+        faces.extend(
+            (index[lvl, a], index[lvl, b], index[lvl + 1, b], index[lvl + 1, a])
+            for a, b in boundary_next.items())
+
+    top_index = index[top].copy()
+
+    if inset:
+        ring = inset_loop(points, boundary_next, inset)
+        ring_index = np.arange(len(boundary)) + len(point)
+        coords = np.vstack((coords, np.column_stack((ring[boundary], np.full(len(boundary), z_levels[top])))))
+        point = np.concatenate((point, boundary))
+        level = np.concatenate((level, np.full(len(boundary), top)))
+        in_ring = np.concatenate((in_ring, np.ones(len(boundary), dtype=bool)))
+
+        top_index[boundary] = ring_index
+        faces.extend(
+            (index[top, a], index[top, b], top_index[b], top_index[a])
+            for a, b in boundary_next.items())
+
+    faces.extend(tuple(top_index[p] for p in poly) for poly in polys)
+
+    faces = [tuple(int(v) for v in face) for face in faces]
+
+    return coords, faces, point, level, in_ring
+
+
+def inset_loop(points, boundary_next, distance):
+    """Return footprint points moved inwards along their boundary's mitre.
+
+    Args:
+        points (ndarray(m, 2)): footprint coordinates
+        boundary_next (dict{int: int}): next point along the anticlockwise boundary
+        distance (float): distance to move boundary points away from their edges
+
+    Returns:
+        ndarray(m, 2): copy of points with boundary points moved
+    """
+    inset = points.copy()
+    boundary_prev = {b: a for a, b in boundary_next.items()}
+
+    for p, nxt in boundary_next.items():
+        prev = boundary_prev[p]
+        n_prev = _left_normal(points[p] - points[prev])
+        n_next = _left_normal(points[nxt] - points[p])
+        mitre = n_prev + n_next
+        mitre /= np.linalg.norm(mitre)
+        inset[p] = points[p] + mitre * (distance / np.dot(mitre, n_prev))
+
+    return inset
+
+
+def strip_footprint(outer, inner, width_subdivs, margin):
+    """Return a footprint made by bridging two polylines with a strip of quads.
+
+    Equivalent to bmesh.ops.bridge_loops followed by subdividing the bridging
+    edges and insetting the result by margin along both polylines.
+
+    Args:
+        outer (ndarray(n, 2)): outer polyline
+        inner (ndarray(n, 2)): inner polyline, each point is bridged to the same point on outer
+        width_subdivs (int): number of cuts across the strip
+        margin (float): distance of margin rows from each polyline
+
+    Returns:
+        ndarray(n * r, 2): footprint coordinates
+        list[tuple[int]]: quads, wound anticlockwise
+        ndarray(n * r): index of each point along the polylines
+        ndarray(n * r): index of each point across the strip, 0 on outer
+    """
+    outer = np.asarray(outer, dtype=float)
+    inner = np.asarray(inner, dtype=float)
+    n = len(outer)
+
+    bridge = inner - outer
+    length = np.linalg.norm(bridge, axis=1)
+    bridge_dir = bridge / length[:, np.newaxis]
+
+    # margin is measured at right angles to the polylines so correct for bridges
+    # that meet them at an angle, e.g. at mitred corners
+    outer_margin = margin / np.abs(_cross(bridge_dir, _tangents(outer)))
+    inner_margin = margin / np.abs(_cross(bridge_dir, _tangents(inner)))
+
+    cuts = np.arange(1, width_subdivs + 1) / (width_subdivs + 1)
+    fractions = np.column_stack((
+        np.zeros(n),
+        outer_margin / length,
+        np.tile(cuts, (n, 1)),
+        1 - inner_margin / length,
+        np.ones(n)))
+    rows = fractions.shape[1]
+
+    points = outer[:, np.newaxis, :] + fractions[:, :, np.newaxis] * bridge[:, np.newaxis, :]
+    points = points.reshape(-1, 2)
+    column, row = np.divmod(np.arange(n * rows), rows)
+
+    polys = [
+        (c * rows + r, (c + 1) * rows + r, (c + 1) * rows + r + 1, c * rows + r + 1)
+        for c in range(n - 1) for r in range(rows - 1)]
+
+    return points, wind_anticlockwise(points, polys), column, row
+
+
+def wind_anticlockwise(points, polys):
+    """Reverse polys if they are wound clockwise.
+
+    All polys are assumed to be wound the same way.
+
+    Args:
+        points (ndarray(m, 2)): footprint coordinates
+        polys (list[tuple[int]]): polygons
+
+    Returns:
+        list[tuple[int]]: polygons wound anticlockwise
+    """
+    total = sum(_signed_area(points[list(poly)]) for poly in polys)
+    if total < 0:
+        return [tuple(reversed(poly)) for poly in polys]
+    return polys
+
+
+def _boundary_next(polys):
+    edges = Counter(frozenset(e) for poly in polys for e in zip(poly, poly[1:] + poly[:1]))
+    return {
+        a: b for poly in polys for a, b in zip(poly, poly[1:] + poly[:1])
+        if edges[frozenset((a, b))] == 1}
+
+
+def _left_normal(direction):
+    normal = np.array((-direction[1], direction[0]))
+    return normal / np.linalg.norm(normal)
+
+
+def _tangents(polyline):
+    tangents = np.diff(polyline, axis=0)
+    tangents = np.vstack((tangents[:1], tangents))
+    return tangents / np.linalg.norm(tangents, axis=1)[:, np.newaxis]
+
+
+def _cross(a, b):
+    return a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+
+
+def _signed_area(points):
+    x, y = points.T
+    return (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / 2
@@ -0,0 +1,196 @@
+import numpy as np
+
+# for faces facing along +X, -X, +Y, -Y, +Z, -Z, the coordinate axes and
+# signs that become U and V so that islands are not mirrored
+_BOX_AXES = (
+    ((1, 1), (2, 1)),
+    ((1, -1), (2, 1)),
+    ((0, -1), (2, 1)),
+    ((0, 1), (2, 1)),
+    ((0, 1), (1, 1)),
+    ((0, 1), (1, -1)))
+
+
+def box_project(coords, loop_verts, loop_starts, loop_totals, island_margin=0.01, arcs=()):
+    """Return UVs for a mesh unwrapped by box projection.
+
+    Each face is projected along the axis its normal is closest to. Connected faces
+    projected along the same axis form an island. Islands are packed into the 0 - 1
+    UV square keeping their relative size.
+
+    Unlike an angle based unwrap the cost is linear in the number of loops. Faces
+    that line up with an axis aren't distorted, but faces at an angle to their
+    projection axis are foreshortened, so texel density varies on the angled sides
+    of triangles and on curved sides that aren't in arcs, by up to about 1.3 - 1.4x
+    for faces close to 45 degrees.
+
+    Faces in arcs, such as the curved side of a semicircle, are unrolled around
+    the vertical axis of the circle their verts lie on instead, so they keep
+    the same texel density as the flat faces.
+
+    Args:
+        coords (ndarray(n, 3)): vert coordinates
+        loop_verts (ndarray[int]): vert index of each loop
+        loop_starts (ndarray[int]): index of first loop of each face, in ascending order
+        loop_totals (ndarray[int]): number of loops in each face
+        island_margin (float, optional): gap between islands in UV space. Defaults to 0.01.
+        arcs (list[ndarray[bool]], optional): faces on each curved side to unroll. Defaults to ().
+
+    Returns:
+        ndarray(l, 2): UV of each loop
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+    loop_verts = np.asarray(loop_verts)
+    loop_starts = np.asarray(loop_starts)
+    loop_totals = np.asarray(loop_totals)
+
+    if len(loop_starts) == 0:
+        return np.zeros((len(loop_verts), 2))
+
+    loop_faces = np.repeat(np.arange(len(loop_starts)), loop_totals)
+    next_loops = np.arange(len(loop_verts)) + 1
+    last_loops = loop_starts + loop_totals - 1
+    next_loops[last_loops] = loop_starts
+    next_verts = loop_verts[next_loops]
+
+    # Newell's method, works for non planar faces
+    normals = np.add.reduceat(
+        np.cross(coords[loop_verts], coords[next_verts]), loop_starts)
+    axes = np.argmax(np.abs(normals), axis=1)
+    directions = axes * 2 + (normals[np.arange(len(axes)), axes] < 0)
+
+    # each arc gets its own direction so it forms its own islands
+    arcs = [np.asarray(faces, dtype=bool) for faces in arcs]
+    for i, faces in enumerate(arcs):
+        directions[faces] = len(_BOX_AXES) + i
+
+    islands = _islands(loop_verts, next_verts, loop_faces, directions)
+
+    uvs = np.empty((len(loop_verts), 2))
+    loop_directions = directions[loop_faces]
+    for direction, ((u_axis, u_sign), (v_axis, v_sign)) in enumerate(_BOX_AXES):
+        loops = loop_directions == direction
+        verts = loop_verts[loops]
+        uvs[loops, 0] = coords[verts, u_axis] * u_sign
+        uvs[loops, 1] = coords[verts, v_axis] * v_sign
+
+    for i, faces in enumerate(arcs):
+        if faces.any():
+            loops = loop_directions == len(_BOX_AXES) + i
+            uvs[loops] = _unroll(coords, loop_verts[loops], normals[faces], np.unique(loop_verts[loops]))
+
+    return _pack_islands(uvs, islands[loop_faces], island_margin)
+
+
+def _unroll(coords, verts, normals, arc_verts):
+    """Unroll verts on a vertical cylinder around its axis.
+
+    Returns:
+        ndarray(len(verts), 2): arc length around the axis and height of each vert
+    """
+    centre, radius = _fit_circle(coords[arc_verts, :2])
+    offsets = coords[verts, :2] - centre
+    angles = np.arctan2(offsets[:, 1], offsets[:, 0])
+
+    # measure angles from the middle of the arc so they don't wrap at 180 degrees
+    middle = coords[arc_verts, :2].mean(axis=0) - centre
+    angles = (angles - np.arctan2(middle[1], middle[0]) + np.pi) % (2 * np.pi) - np.pi
+
+    # faces facing away from the axis are seen from outside, where anticlockwise is
+    # to the right, and faces facing it from inside, so islands are not mirrored
+    outwards = np.sum(normals[:, :2] @ middle) >= 0
+    sign = 1 if outwards else -1
+    return np.column_stack((sign * radius * angles, coords[verts, 2]))
+
+
+def _fit_circle(points):
+    """Fit a circle to 2D points by least squares.
+
+    Returns:
+        ndarray[2]: centre
+        float: radius
+    """
+    a = np.column_stack((2 * points, np.ones(len(points))))
+    b = np.sum(points ** 2, axis=1)
+    (x, y, c), *_ = np.linalg.lstsq(a, b, rcond=None)
+    return np.array((x, y)), np.sqrt(c + x ** 2 + y ** 2)
+
+
+def _islands(loop_verts, next_verts, loop_faces, directions):
+    """Label connected faces that share a projection direction.
+
+    Returns:
+        ndarray[int]: island of each face, numbered from 0
+    """
+    # faces either side of each edge are next to each other once edges are sorted
+    edges = np.sort(np.stack((loop_verts, next_verts), axis=1), axis=1)
+    order = np.lexsort((edges[:, 1], edges[:, 0]))
+    edges = edges[order]
+    faces = loop_faces[order]
+    shared = np.all(edges[1:] == edges[:-1], axis=1)
+    a = faces[:-1][shared]
+    b = faces[1:][shared]
+    joined = directions[a] == directions[b]
+    a = a[joined]
+    b = b[joined]
+
+    # propagate the lowest face index through each island
+    labels = np.arange(len(directions))
+    while True:
+        lowest = np.minimum(labels[a], labels[b])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, a, lowest)
+        np.minimum.at(new_labels, b, lowest)
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def _pack_islands(uvs, loop_islands, island_margin):
+    """Move islands into rows and scale them to fit the 0 - 1 UV square.
+
+    Returns:
+        ndarray(l, 2): packed UVs
+    """
+    count = loop_islands.max() + 1
+    mins = np.full((count, 2), np.inf)
+    maxs = np.full((count, 2), -np.inf)
+    np.minimum.at(mins, loop_islands, uvs)
+    np.maximum.at(maxs, loop_islands, uvs)
+    sizes = maxs - mins
+
+    # pack once without margins to find the scale, then leave room for margins at that scale
+    width, height = _shelf_pack(sizes, 0)[1:]
+    gap = island_margin * max(width, height)
+    offsets, width, height = _shelf_pack(sizes, gap)
+
+    scale = max(width, height, 1e-9)
+    return (uvs - mins[loop_islands] + offsets[loop_islands]) / scale
+
+
+def _shelf_pack(sizes, gap):
+    """Place rectangles in rows, tallest first, in a roughly square area.
+
+    Returns:
+        ndarray(n, 2): offset of each rectangle
+        float: width of packed area
+        float: height of packed area
+    """
+    padded = sizes + gap
+    row_width = max(np.sqrt(np.sum(padded[:, 0] * padded[:, 1])), padded[:, 0].max())
+
+    offsets = np.zeros_like(sizes)
+    x = y = row_height = width = 0
+    for i in np.argsort(-padded[:, 1], kind='stable'):
+        if x > 0 and x + padded[i, 0] > row_width:
+            y += row_height
+            x = row_height = 0
+        offsets[i] = (x + gap / 2, y + gap / 2)
+        x += padded[i, 0]
+        row_height = max(row_height, padded[i, 1])
+        width = max(width, x)
+
+    return offsets, width, y + row_height
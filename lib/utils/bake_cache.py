@@ -0,0 +1,215 @@
+import os
+import hashlib
+import numpy as np
+import bpy
+from ...utils.registration import get_prefs
+from ...utils.system import makedir
+
+# Bump this if the way displacement maps are baked changes so old bakes aren't reused
+BAKE_VERSION = 2
+
+# the image node baked into. Its image changes on every bake so isn't part of the key
+BAKE_TARGET_NODE = 'disp_texture_node'
+
+# properties every node has. Only the inputs of these affect what the node outputs
+_base_node_props = set()
+
+
+def bake_key(obj, resolution):
+    """Return a key identifying the displacement map baking obj would make.
+
+    The key is a hash of everything the bake depends on: the node trees of obj's
+    materials, including values such as the seed, the bake resolution, the UV
+    layout, the mesh and which material each face uses.
+
+    Args:
+        obj (bpy.types.Object): preview object
+        resolution (int): image resolution
+
+    Returns:
+        str: hex digest
+    """
+    digest = hashlib.sha256()
+    _update(digest, (BAKE_VERSION, resolution))
+
+    for slot in obj.material_slots:
+        material = slot.material
+        _update(digest, material.name if material else None)
+        if material is not None and material.node_tree is not None:
+            _hash_rna(digest, material.node_tree, set())
+
+    mesh = obj.data
+    _hash_array(digest, mesh.vertices, 'co', len(mesh.vertices) * 3, np.float32)
+    _hash_array(digest, mesh.loops, 'vertex_index', len(mesh.loops), np.int32)
+    _hash_array(digest, mesh.polygons, 'loop_total', len(mesh.polygons), np.int32)
+    _hash_array(digest, mesh.polygons, 'material_index', len(mesh.polygons), np.int32)
+
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        _hash_array(digest, uv_layer.data, 'uv', len(mesh.loops) * 2, np.float32)
+
+    _update(digest, [list(row) for row in obj.matrix_world])
+    return digest.hexdigest()
+
+
+def load_cached_bake(key, name):
+    """Load a baked displacement map from the cache.
+
+    Args:
+        key (str): key returned by bake_key
+        name (str): name of image
+
+    Returns:
+        bpy.types.Image: packed image or None if there isn't one
+    """
+    prefs = get_prefs()
+    path = os.path.join(prefs.bake_cache_path, key + '.exr')
+    if not prefs.bake_cache_size or not os.path.exists(path):
+        return None
+
+    # mark as recently used
+    os.utime(path)
+
+    image = bpy.data.images.load(path, check_existing=False)
+    image.name = name
+    image.colorspace_settings.is_data = True
+    # keep image in the blend file in case it's evicted from the cache
+    image.pack()
+    return image
+
+
+def store_bake(key, image):
+    """Save a baked displacement map to the cache.
+
+    Least recently used bakes are removed if the cache is bigger than
+    the size set in the MakeTile preferences.
+
+    Args:
+        key (str): key returned by bake_key
+        image (bpy.types.Image): baked image
+    """
+    prefs = get_prefs()
+    if not prefs.bake_cache_size:
+        return
+
+    cache_dir = makedir(prefs.bake_cache_path)
+    image.filepath_raw = os.path.join(cache_dir, key + '.exr')
+    image.file_format = 'OPEN_EXR'
+    image.save()
+
+    evict(cache_dir, prefs.bake_cache_size * 1024 * 1024)
+
+
+def evict(cache_dir, max_bytes):
+    """Remove least recently used bakes until the cache is no bigger than max_bytes.
+
+    Args:
+        cache_dir (str): cache directory
+        max_bytes (int): maximum size of cache
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.is_file() and entry.name.endswith('.exr'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    size = sum(entry[1] for entry in entries)
+    for mtime, nbytes, path in sorted(entries):
+        if size <= max_bytes:
+            break
+        os.remove(path)
+        size -= nbytes
+
+
+def _update(digest, value):
+    digest.update(repr(value).encode())
+
+
+def _hash_array(digest, collection, attr, size, dtype):
+    values = np.empty(size, dtype=dtype)
+    collection.foreach_get(attr, values)
+    digest.update(values.tobytes())
+
+
+def _hash_rna(digest, struct, seen, depth=0):
+    """Add the values of struct's properties to digest.
+
+    Pointers to other structs are followed a few levels deep. Node groups are
+    hashed in full, other datablocks by name.
+    """
+    if isinstance(struct, bpy.types.NodeTree):
+        if struct.name in seen:
+            _update(digest, struct.name)
+            return
+        seen.add(struct.name)
+        for node in sorted(struct.nodes, key=lambda node: node.name):
+            _hash_node(digest, node, seen)
+        for link in struct.links:
+            _update(digest, (
+                link.from_node.name, link.from_socket.identifier,
+                link.to_node.name, link.to_socket.identifier, link.is_muted))
+        return
+
+    for prop in struct.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier == 'rna_type':
+            continue
+        value = getattr(struct, identifier)
+        _update(digest, identifier)
+        _hash_value(digest, prop, value, seen, depth)
+
+
+def _hash_node(digest, node, seen):
+    if not _base_node_props:
+        _base_node_props.update(prop.identifier for prop in bpy.types.Node.bl_rna.properties)
+
+    _update(digest, (node.name, node.bl_idname, node.mute))
+
+    for socket in node.inputs:
+        if not socket.is_linked and hasattr(socket, 'default_value'):
+            _hash_socket(digest, socket)
+
+    # Value and RGB nodes such as the seed keep their value in their output
+    for socket in node.outputs:
+        if hasattr(socket, 'default_value'):
+            _hash_socket(digest, socket)
+
+    for prop in node.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier in _base_node_props:
+            continue
+        if node.name == BAKE_TARGET_NODE and identifier == 'image':
+            continue
+        _update(digest, identifier)
+        _hash_value(digest, prop, getattr(node, identifier), seen, 0)
+
+
+def _hash_socket(digest, socket):
+    value = socket.default_value
+    _update(digest, (
+        socket.is_output, socket.identifier, value[:] if hasattr(value, '__len__') else value))
+
+
+def _hash_value(digest, prop, value, seen, depth):
+    if prop.type == 'POINTER':
+        if value is None:
+            _update(digest, None)
+        elif isinstance(value, bpy.types.NodeTree):
+            _hash_rna(digest, value, seen)
+        elif isinstance(value, bpy.types.Object):
+            # texture coordinates can be taken from another object
+            _update(digest, (value.name, [list(row) for row in value.matrix_world]))
+        elif isinstance(value, bpy.types.Image):
+            _update(digest, (value.name, value.filepath, value.source))
+        elif isinstance(value, bpy.types.ID):
+            _update(digest, value.name)
+        elif depth < 3:
+            _hash_rna(digest, value, seen, depth + 1)
+    elif prop.type == 'COLLECTION':
+        if depth < 3:
+            for item in value:
+                _hash_rna(digest, item, seen, depth + 1)
+    elif getattr(prop, 'is_array', False):
+        _update(digest, value[:])
+    else:
+        _update(digest, value)
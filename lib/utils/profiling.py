@@ -0,0 +1,210 @@
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from time import perf_counter
+from ...utils.registration import get_prefs
+
+# StageTimers currently recording, innermost last
+_active_timers = []
+
+# returned by stage() when nothing is recording so disabled stages cost one list check
+_null_stage = nullcontext()
+
+# ring buffer of profiles of the most recent tile generations, newest last
+generation_profiles = deque(maxlen=50)
+
+
+class StageTimer:
+    """Accumulates the time spent in named stages of tile generation.
+
+    Stages can be nested. Each stage is credited with its own time only, time
+    spent in stages nested inside it is credited to those stages.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.counts = {}
+        self.events = []
+        self._stack = []
+
+    def start(self, name, category):
+        """Start timing a stage.
+
+        Args:
+            name (str): stage name
+            category (str): category totals are collected under
+        """
+        # [name, category, start time, time spent in nested stages]
+        self._stack.append([name, category, perf_counter(), 0.0])
+
+    def stop(self):
+        """Stop timing the innermost stage.
+
+        Returns:
+            float: total time spent in stage including nested stages
+        """
+        name, category, start, nested = self._stack.pop()
+        elapsed = perf_counter() - start
+        self.totals[category] = self.totals.get(category, 0.0) + elapsed - nested
+        self.counts[category] = self.counts.get(category, 0) + 1
+        self.events.append((name, category, start, elapsed, len(self._stack)))
+        if self._stack:
+            self._stack[-1][3] += elapsed
+        return elapsed
+
+
+class _Stage:
+    def __init__(self, name, category, timers):
+        self.name = name
+        self.category = category
+        self.timers = timers
+
+    def __enter__(self):
+        for timer in self.timers:
+            timer.start(self.name, self.category)
+
+    def __exit__(self, *exc):
+        for timer in self.timers:
+            timer.stop()
+
+
+@contextmanager
+def record_stages():
+    """Record the time spent in stages while the context is active.
+
+    Yields:
+        StageTimer: timer whose totals are filled in as stages complete
+    """
+    timer = StageTimer()
+    _active_timers.append(timer)
+    try:
+        yield timer
+    finally:
+        _active_timers.remove(timer)
+
+
+def stage(name, category=None):
+    """Time the enclosed block as a named stage of tile generation.
+
+    Does nothing unless stages are being recorded.
+
+    Args:
+        name (str): stage name, e.g. 'uv_project' or an operator bl_idname
+        category (str, optional): category to collect totals under, e.g. 'core_draw'. \
+        Defaults to name.
+
+    Returns:
+        context manager: stage
+    """
+    if not _active_timers:
+        return _null_stage
+    return _Stage(name, category or name, list(_active_timers))
+
+
+def timed(category):
+    """Decorator. Time each call of the decorated function as a stage.
+
+    The stage is named after the function's module and name.
+
+    Args:
+        category (str): category to collect totals under
+
+    Returns:
+        function: decorator
+    """
+    def decorator(func):
+        name = func.__module__.rsplit('.', 1)[-1] + '.' + func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _active_timers:
+                return func(*args, **kwargs)
+            with _Stage(name, category, list(_active_timers)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def profile_tile(bl_idname, label):
+    """Profile generating a tile if profiling is turned on in the MakeTile preferences.
+
+    The stages of the generation are recorded in generation_profiles.
+
+    Args:
+        bl_idname (str): bl_idname of the tile generator
+        label (str): bl_label of the tile generator
+    """
+    if not get_prefs().profile_generation:
+        yield
+        return
+
+    with record_stages() as timer:
+        with stage(bl_idname, 'generate'):
+            yield
+
+    # the generate stage finishes last
+    name, category, start, elapsed, depth = timer.events[-1]
+    generation_profiles.append({
+        'operator': bl_idname,
+        'label': label,
+        'start': start,
+        'duration': elapsed,
+        'totals': timer.totals,
+        'counts': timer.counts,
+        'events': timer.events})
+
+
+def profile_generation(execute):
+    """Decorator for tile generator execute methods.
+
+    If profiling is turned on in the MakeTile preferences the stages of each
+    generation are recorded in generation_profiles.
+
+    Args:
+        execute (function): operator execute method
+
+    Returns:
+        function: wrapped execute method
+    """
+    @wraps(execute)
+    def wrapper(self, context):
+        with profile_tile(self.bl_idname, self.bl_label):
+            return execute(self, context)
+    return wrapper
+
+
+def chrome_trace(profiles):
+    """Return profiles as a Chrome trace event format dict.
+
+    Load the JSON dump of this into chrome://tracing or https://ui.perfetto.dev
+
+    Args:
+        profiles (iterable[dict]): generation profiles
+
+    Returns:
+        dict: trace
+    """
+    profiles = list(profiles)
+    if not profiles:
+        return {'traceEvents': [], 'displayTimeUnit': 'ms'}
+
+    origin = min(profile['start'] for profile in profiles)
+    events = []
+    for profile in profiles:
+        for name, category, start, elapsed, depth in profile['events']:
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start - origin) * 1e6,
+                'dur': elapsed * 1e6,
+                'pid': 1,
+                'tid': 1}
+            if category == 'generate':
+                event['args'] = {
+                    'totals_ms': {k: v * 1000 for k, v in profile['totals'].items()},
+                    'counts': profile['counts']}
+            events.append(event)
+
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
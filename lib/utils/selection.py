@@ -1,3 +1,4 @@
+import numpy as np
 import bpy
 import bmesh
 from mathutils import Vector
@@ -71,6 +72,21 @@ def in_bbox(lbound, ubound, vert, buffer=0.001):
         lbound[2] - buffer <= vert[2] <= ubound[2] + buffer
 
 
+def in_bbox_array(lbound, ubound, coords, buffer=0.001):
+    """Checks which of an array of vertices are within a bounding cube
+    Keyword arguments:
+    lbound -- VECTOR lower left of cuboid
+    ubound -- VECTOR upper right of cuboid
+    coords -- ndarray(n, 3) vertex coordinates
+    buffer -- FLOAT buffer distance to add to cuboid. Useful when checking if single vert is at location
+
+    Returns ndarray(n) of bools
+    """
+    lbound = np.asarray(lbound, dtype=np.float32) - buffer
+    ubound = np.asarray(ubound, dtype=np.float32) + buffer
+    return np.all((coords >= lbound) & (coords <= ubound), axis=-1)
+
+
 def select_by_loc(
         lbound=(0, 0, 0),
         ubound=(0, 0, 0),
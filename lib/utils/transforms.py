@@ -0,0 +1,79 @@
+from mathutils import Matrix, Vector
+
+
+def world_matrix(obj):
+    """Return an object's world matrix calculated from its transform properties.
+
+    obj.matrix_world is only updated when the view layer is, so it is out of date
+    after changing an object's location, rotation or scale from a script.
+
+    Args:
+        obj (bpy.types.Object): object
+
+    Returns:
+        Matrix: world matrix
+    """
+    if obj.parent is None:
+        return obj.matrix_basis.copy()
+    return world_matrix(obj.parent) @ obj.matrix_parent_inverse @ obj.matrix_basis
+
+
+def set_origin(obj, location):
+    """Move an object's origin without moving its geometry.
+
+    Equivalent to bpy.ops.object.origin_set(type='ORIGIN_CURSOR') with the cursor at location.
+
+    Args:
+        obj (bpy.types.Object): mesh object
+        location (Vector[3]): new origin in world space
+    """
+    offset = world_matrix(obj).inverted() @ Vector(location)
+    obj.data.transform(Matrix.Translation(-offset))
+    obj.matrix_basis = obj.matrix_basis @ Matrix.Translation(offset)
+
+
+def rotate(objects, angle, axis='Z', center=(0, 0, 0)):
+    """Rotate objects about a point in world space.
+
+    Equivalent to bpy.ops.transform.rotate with orient_type='GLOBAL' and center_override.
+    Like the operator, positive angles rotate clockwise looking down the axis,
+    which is the opposite of Matrix.Rotation.
+
+    Args:
+        objects (list[bpy.types.Object]): unparented objects
+        angle (float): angle in radians
+        axis (str, optional): world axis to rotate around. Defaults to 'Z'.
+        center (Vector[3], optional): point to rotate around. Defaults to (0, 0, 0).
+    """
+    center = Vector(center)
+    rotation = Matrix.Translation(center) @ Matrix.Rotation(-angle, 4, axis) @ Matrix.Translation(-center)
+    for obj in objects:
+        obj.matrix_basis = rotation @ obj.matrix_basis
+
+
+def mirror(objects, axis='X'):
+    """Mirror objects along one of their local axes, keeping their origins in place.
+
+    Equivalent to bpy.ops.transform.mirror with orient_type='LOCAL' and a single constraint axis.
+
+    Args:
+        objects (list[bpy.types.Object]): objects
+        axis (str, optional): local axis to mirror along. Defaults to 'X'.
+    """
+    index = 'XYZ'.index(axis)
+    for obj in objects:
+        obj.scale[index] = -obj.scale[index]
+
+
+def apply_rotation(obj):
+    """Apply an object's rotation to its mesh so its rotation is zero.
+
+    Equivalent to bpy.ops.object.transform_apply(location=False, rotation=True, scale=False).
+
+    Args:
+        obj (bpy.types.Object): mesh object
+    """
+    location, rotation, scale = obj.matrix_basis.decompose()
+    scale_matrix = Matrix.Diagonal(scale).to_4x4()
+    obj.data.transform(scale_matrix.inverted() @ rotation.to_matrix().to_4x4() @ scale_matrix)
+    obj.matrix_basis = Matrix.Translation(location) @ scale_matrix
@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from functools import wraps
+import bpy
+
+# how many defer_updates blocks we're currently inside
+_depth = 0
+
+
+def updates_deferred():
+    """Return whether depsgraph updates are being deferred.
+
+    MakeTile's depsgraph handlers check this so they don't run part way
+    through assembling a tile.
+
+    Returns:
+        bool: True if inside a defer_updates block
+    """
+    return _depth > 0
+
+
+def update_view_layer():
+    """Update the view layer unless updates are being deferred."""
+    if not _depth:
+        bpy.context.view_layer.update()
+
+
+@contextmanager
+def defer_updates():
+    """Context manager that defers view layer updates until the block exits.
+
+    Inside the block update_view_layer does nothing and MakeTile's handlers
+    return straight away. The view layer is updated once when the outermost
+    block exits. Blocks can be nested.
+    """
+    global _depth
+    _depth += 1
+    try:
+        yield
+    finally:
+        _depth -= 1
+        if not _depth:
+            bpy.context.view_layer.update()
+
+
+def batch_updates(execute):
+    """Decorator for tile generator execute methods.
+
+    Assembles the whole tile inside a defer_updates block so generating a tile
+    evaluates the depsgraph once rather than every time an object is created.
+
+    Args:
+        execute (function): operator execute method
+
+    Returns:
+        function: wrapped execute method
+    """
+    @wraps(execute)
+    def wrapper(self, context):
+        with defer_updates():
+            return execute(self, context)
+    return wrapper
@@ -2,8 +2,9 @@ from math import radians, sqrt, cos, acos, degrees, isclose
 import bpy
 import bmesh
 from mathutils import Vector, Euler, Matrix
-from . selection import select, activate, deselect_all, select_all
+from . selection import select, select_all
 from . collections import add_object_to_collection
+from . transforms import set_origin
 
 
 def mode(mode_name):
@@ -61,14 +62,7 @@ def add_circle_array(obj, tile_name, circle_center, item_count, axis, degrees_of
     axis -- STR - X, Y, Z
     degrees_of_arc -- FLOAT
     '''
-    cursor = bpy.context.scene.cursor
-    cursor_orig_location = cursor.location.copy()
-
-    deselect_all()
-    select(obj.name)
-    activate(obj.name)
-    cursor.location = circle_center
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(obj, circle_center)
 
     # add an array modifier
     array_mod = obj.modifiers.new(type='ARRAY', name="circle_array")
@@ -88,8 +82,6 @@ def add_circle_array(obj, tile_name, circle_center, item_count, axis, degrees_of
     angle = degrees_of_arc
     circle_origin_empty.rotation_euler.rotate_axis(axis, radians(angle))
 
-    cursor.location = cursor_orig_location
-
     return array_mod.name, circle_origin_empty
 
 
@@ -99,42 +91,6 @@ def get_tile_props(obj):
     return tile_props
 
 
-def loopcut_and_add_deform_modifiers(obj, segments=8, degrees_of_arc=90, axis='Z', show_render=False):
-    # uses loopcut to subdivide a mesh and adds a deform modifier
-    deselect_all()
-    select(obj.name)
-    activate(obj.name)
-
-    # loopcut
-    mode('EDIT')
-    region, rv3d, v3d, area = view3d_find(True)
-
-    override = {
-        'scene': bpy.context.scene,
-        'region': region,
-        'area': area,
-        'space': v3d
-    }
-
-    bpy.ops.mesh.loopcut(
-        override,
-        number_cuts=segments - 2,
-        smoothness=0,
-        falloff='INVERSE_SQUARE',
-        object_index=0,
-        edge_index=2)
-
-    mode('OBJECT')
-
-    curve_mod = obj.modifiers.new("curve", "SIMPLE_DEFORM")
-    curve_mod.deform_method = 'BEND'
-    curve_mod.deform_axis = axis
-    curve_mod.show_render = show_render
-    curve_mod.angle = radians(degrees_of_arc)
-
-    return curve_mod
-
-
 def distance_between_two_verts(first, second):
     '''returns the distance between 2 verts'''
     locx = second[0] - first[0]
@@ -0,0 +1,109 @@
+import numpy as np
+import bpy
+from ..bmturtle.adapter import image_heights, mesh_vertex_uvs
+from ..geometry.displacement import sample_bilinear, displace
+
+
+def capture_variant_base(context, obj, subdivisions):
+    """Evaluate a preview object's modifiers once so variants can be made from the result.
+
+    The object is evaluated as it would be after Make 3D, i.e. subdivided then cut by
+    its booleans, but with its displacement turned off. It is then evaluated again
+    with no displacement texture and a strength of 1, which moves each vert along its
+    normal by its weight in the displacement vertex group. The difference between the
+    two is how far each vert moves per unit of height.
+
+    The object's modifiers are left as they were.
+
+    Args:
+        context (bpy.context): context
+        obj (bpy.types.Object): preview object
+        subdivisions (int): subsurf levels to use
+
+    Returns:
+        dict: variant base to pass to apply_variant
+    """
+    props = obj.mt_object_props
+    disp_mod = obj.modifiers[props.disp_mod_name]
+    subsurf = obj.modifiers[props.subsurf_mod_name]
+
+    orig_index = obj.modifiers.find(subsurf.name)
+    orig_levels = subsurf.levels
+    orig_texture = disp_mod.texture
+    orig_strength = disp_mod.strength
+    orig_mid_level = disp_mod.mid_level
+
+    subsurf.levels = subdivisions
+    move_modifier(obj, subsurf.name, 0)
+    try:
+        disp_mod.strength = 0
+        depsgraph = context.evaluated_depsgraph_get()
+        mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        base = evaluated_coords(context, obj)
+
+        disp_mod.texture = None
+        disp_mod.strength = 1
+        disp_mod.mid_level = 0
+        displaced = evaluated_coords(context, obj)
+    finally:
+        disp_mod.texture = orig_texture
+        disp_mod.strength = orig_strength
+        disp_mod.mid_level = orig_mid_level
+        subsurf.levels = orig_levels
+        move_modifier(obj, subsurf.name, orig_index)
+
+    return {
+        'mesh': mesh,
+        'base': base,
+        'directions': displaced - base,
+        'uvs': mesh_vertex_uvs(mesh)}
+
+
+def apply_variant(variant_base, image, strength):
+    """Displace a variant base's mesh by a baked displacement map.
+
+    Args:
+        variant_base (dict): variant base returned by capture_variant_base
+        image (bpy.types.Image): displacement map
+        strength (float): displacement strength
+    """
+    heights = sample_bilinear(image_heights(image), variant_base['uvs'])
+    coords = displace(variant_base['base'], variant_base['directions'], heights, strength)
+
+    mesh = variant_base['mesh']
+    mesh.vertices.foreach_set('co', coords.astype(np.float32).ravel())
+    mesh.update()
+
+
+def evaluated_coords(context, obj):
+    """Return the vert coordinates of an object with its modifiers applied.
+
+    Args:
+        context (bpy.context): context
+        obj (bpy.types.Object): mesh object
+
+    Returns:
+        ndarray(n, 3): vert coordinates
+    """
+    obj_eval = obj.evaluated_get(context.evaluated_depsgraph_get())
+    mesh = obj_eval.to_mesh()
+    coords = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    obj_eval.to_mesh_clear()
+    return coords.reshape(-1, 3)
+
+
+def move_modifier(obj, name, index):
+    """Move a modifier to index in an object's modifier stack.
+
+    Args:
+        obj (bpy.types.Object): object
+        name (str): modifier name
+        index (int): new index
+    """
+    ctx = {
+        'object': obj,
+        'active_object': obj,
+        'selected_objects': [obj],
+        'selected_editable_objects': [obj]}
+    bpy.ops.object.modifier_move_to_index(ctx, modifier=name, index=index)
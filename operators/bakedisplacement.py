@@ -8,6 +8,10 @@ from .. lib.utils.vertex_groups import (
     get_verts_with_material,
     clear_vert_group)
 from .. utils.registration import get_prefs
+from .. tile_creation.create_tile import get_subsurf_levels
+from .. lib.utils.bake_cache import bake_key, load_cached_bake, store_bake
+from .. lib.utils.variants import capture_variant_base, apply_variant
+from .. lib.bmturtle.adapter import unbent
 
 
 class MT_OT_Assign_Material_To_Vert_Group(bpy.types.Operator):
@@ -134,12 +138,18 @@ class MT_OT_Make_3D(bpy.types.Operator):
                 disp_image, obj = bake_displacement_map(obj)
                 disp_texture = obj_props.disp_texture
                 disp_texture.image = disp_image
+
+                if context.scene.mt_scene_props.apply_displacement:
+                    apply_displacement(context, obj, disp_image, disp_strength)
+                    obj_props.geometry_type = 'DISPLACEMENT'
+                    continue
+
                 disp_mod = obj.modifiers[obj_props.disp_mod_name]
                 disp_mod.texture = disp_texture
                 disp_mod.mid_level = 0
                 disp_mod.strength = disp_strength
                 subsurf_mod = obj.modifiers[obj_props.subsurf_mod_name]
-                subsurf_mod.levels = bpy.context.scene.mt_scene_props.subdivisions
+                subsurf_mod.levels = get_subsurf_levels(obj, bpy.context.scene.mt_scene_props.subdivisions)
                 bpy.ops.object.modifier_move_to_index(ctx, modifier=subsurf_mod.name, index=0)
 
                 obj_props.geometry_type = 'DISPLACEMENT'
@@ -147,6 +157,39 @@ class MT_OT_Make_3D(bpy.types.Operator):
         return {'FINISHED'}
 
 
+def apply_displacement(context, obj, disp_image, strength):
+    """Move the verts of obj's subdivided mesh by a displacement map.
+
+    Used instead of a displacement modifier. obj's modifiers are applied to a new
+    mesh which then has its verts in the displacement vertex group moved along
+    their normals. The new mesh replaces obj's mesh and obj's modifiers are hidden,
+    so obj exports and voxelises without any modifiers being evaluated.
+    set_to_preview undoes this.
+
+    Args:
+        context (bpy.context): context
+        obj (bpy.types.Object): preview object
+        disp_image (bpy.types.Image): baked displacement map
+        strength (float): displacement strength
+    """
+    obj_props = obj.mt_object_props
+    subdivisions = get_subsurf_levels(obj, context.scene.mt_scene_props.subdivisions)
+    variant_base = capture_variant_base(context, obj, subdivisions)
+    apply_variant(variant_base, disp_image, strength)
+
+    obj_props.preview_mesh = obj.data
+    obj.data = variant_base['mesh']
+
+    obj_props.modifier_states.clear()
+    for mod in obj.modifiers:
+        state = obj_props.modifier_states.add()
+        state.name = mod.name
+        state.show_viewport = mod.show_viewport
+        state.show_render = mod.show_render
+        mod.show_viewport = False
+        mod.show_render = False
+
+
 def set_cycles_to_bake_mode():
     context = bpy.context
     resolution = context.scene.mt_scene_props.tile_resolution
@@ -180,9 +223,61 @@ def reset_renderer_from_bake(orig_settings):
 
 
 def bake_displacement_map(obj):
+    """Bake the displacement of obj's preview materials to an image.
+
+    Bakes are cached on disk, so if nothing that affects the bake has
+    changed since obj was last baked the cached image is used and
+    Cycles isn't run.
+
+    Args:
+        obj (bpy.types.Object): preview object
+
+    Returns:
+        bpy.types.Image: displacement map
+        bpy.types.Object: obj
+    """
     context = bpy.context
     prefs = get_prefs()
     image_resolution = context.scene.mt_scene_props.tile_resolution
+
+    key = bake_key(obj, image_resolution)
+    disp_image = load_cached_bake(key, obj.name + '.image')
+    if disp_image is None:
+        disp_image = bake_emission(obj, image_resolution)
+        store_bake(key, disp_image)
+        # pack image
+        disp_image.pack()
+
+    preview_materials = obj.mt_object_props.preview_materials
+    preview_materials.clear()
+
+    # store which material is assigned to which vertex group
+    for group in obj.vertex_groups:
+        mat = preview_materials.add()
+        mat.vertex_group = group.name
+        mat.material = get_vert_group_material(group, obj)
+
+    # assign secondary material to entire mesh
+    # We do this because when the mesh is being displaced we want to see what the actual geometry is without any texture
+    sec_mat_index = get_material_index(obj, bpy.data.materials[prefs.secondary_material])
+
+    for poly in obj.data.polygons:
+        poly.material_index = sec_mat_index
+
+    return disp_image, obj
+
+
+def bake_emission(obj, image_resolution):
+    """Bake the displacement of obj's preview materials with Cycles.
+
+    Args:
+        obj (bpy.types.Object): preview object
+        image_resolution (int): image resolution
+
+    Returns:
+        bpy.types.Image: unpacked displacement map
+    """
+    context = bpy.context
     disp_image = bpy.data.images.new(
         obj.name + '.image',
         width=image_resolution,
@@ -233,11 +328,9 @@ def bake_displacement_map(obj):
         'object': obj
     }
 
-    # bake
-    bpy.ops.object.bake(ctx, type='EMIT')
-
-    # pack image
-    disp_image.pack()
+    # bake curved cores straight, as they were when bent by a modifier hidden at render time
+    with unbent(obj):
+        bpy.ops.object.bake(ctx, type='EMIT')
 
     # reset shaders
     for material in disp_materials:
@@ -248,20 +341,4 @@ def bake_displacement_map(obj):
         tree.links.new(surface_shader_node.outputs['BSDF'], mat_output_node.inputs['Surface'])
         tree.links.new(displacement_node.outputs['Displacement'], mat_output_node.inputs['Displacement'])
 
-    preview_materials = obj.mt_object_props.preview_materials
-    preview_materials.clear()
-
-    # store which material is assigned to which vertex group
-    for group in obj.vertex_groups:
-        mat = preview_materials.add()
-        mat.vertex_group = group.name
-        mat.material = get_vert_group_material(group, obj)
-
-    # assign secondary material to entire mesh
-    # We do this because when the mesh is being displaced we want to see what the actual geometry is without any texture
-    sec_mat_index = get_material_index(obj, bpy.data.materials[prefs.secondary_material])
-
-    for poly in obj.data.polygons:
-        poly.material_index = sec_mat_index
-
-    return disp_image, obj
+    return disp_image
@@ -1,5 +1,6 @@
 import bpy
 from .. lib.utils.collections import get_objects_owning_collections
+from .. tile_creation.create_tile import COMBINED_CUTTERS_COLLECTION
 
 
 class MT_OT_Delete_Tiles(bpy.types.Operator):
@@ -33,7 +34,16 @@ class MT_OT_Delete_Tiles(bpy.types.Operator):
                     objects.remove(objects[obj.name], do_unlink=True)
 
                 collections.remove(bpy.data.collections[collection], do_unlink=True)
-                
+
+        # clean up collections of combined booleans whose objects have been deleted
+        if COMBINED_CUTTERS_COLLECTION in collections:
+            in_use = {
+                mod.collection for obj in objects for mod in obj.modifiers
+                if mod.type == 'BOOLEAN' and getattr(mod, 'operand_type', None) == 'COLLECTION'}
+            for collection in list(collections[COMBINED_CUTTERS_COLLECTION].children):
+                if collection not in in_use:
+                    collections.remove(collection, do_unlink=True)
+
         # clean up orphan meshes
         for mesh in bpy.data.meshes:
             if mesh.users == 0:
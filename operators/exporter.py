@@ -10,6 +10,8 @@ from . bakedisplacement import (
     reset_renderer_from_bake,
     bake_displacement_map)
 from . return_to_preview import set_to_preview
+from .. lib.utils.variants import capture_variant_base, apply_variant
+from .. tile_creation.create_tile import get_subsurf_levels, get_unit_multiplier
 # TODO fix it so we don't reset to preview on exporting
 
 class MT_PT_Export_Panel(Panel):
@@ -67,13 +69,7 @@ class MT_OT_Export_Tile_Variants(bpy.types.Operator):
             os.mkdir(export_path)
 
         # Controls if we rescale on export
-        blend_units = scene_props.export_units
-        if blend_units == 'CM':
-            unit_multiplier = 10
-        elif blend_units == 'INCHES':
-            unit_multiplier = 25.4
-        else:
-            unit_multiplier = 1
+        unit_multiplier = get_unit_multiplier(context.scene)
 
         objects = bpy.data.objects
         visible_objects = []
@@ -104,6 +100,27 @@ class MT_OT_Export_Tile_Variants(bpy.types.Operator):
                     set_to_preview(obj)
                     displacement_obs.append(obj)
 
+            # Evaluate the modifiers of each displacement object once. Only the seed
+            # changes between variants, so each variant is made by baking a new
+            # height map and moving the verts of the evaluated mesh by it.
+            tile_props = collection.mt_tile_props
+            variant_bases = []
+            variant_obs = []
+            for obj in displacement_obs:
+                subdivisions = get_subsurf_levels(obj, scene_props.subdivisions)
+                variant_base = capture_variant_base(context, obj, subdivisions)
+                variant = objects.new(obj.name + '.variant', variant_base['mesh'])
+                variant.parent = obj.parent
+                variant.matrix_parent_inverse = obj.matrix_parent_inverse
+                variant.location = obj.location
+                variant.rotation_euler = obj.rotation_euler
+                variant.scale = obj.scale
+                collection.objects.link(variant)
+                variant_bases.append(variant_base)
+                variant_obs.append(variant)
+
+            export_obs = [obj for obj in visible_objects if obj not in displacement_obs] + variant_obs
+
             i = 0
             while i < num_variants:
                 # construct a random name for our variant
@@ -112,14 +129,7 @@ class MT_OT_Export_Tile_Variants(bpy.types.Operator):
                     collection.name + '.' + str(random()) + '.stl')
 
                 # generate a random variant for each displacement object
-                for obj in displacement_obs:
-                    obj_props = obj.mt_object_props
-                    ctx = {
-                        'selected_objects': [obj],
-                        'selected_editable_objects': [obj],
-                        'active_object': obj,
-                        'object': obj}
-
+                for obj, variant_base in zip(displacement_obs, variant_bases):
                     for item in obj.material_slots.items():
                         if item[0]:
                             material = bpy.data.materials[item[0]]
@@ -130,27 +140,16 @@ class MT_OT_Export_Tile_Variants(bpy.types.Operator):
                                 seed_node.outputs[0].default_value = rand * 1000
 
                     disp_image, obj = bake_displacement_map(obj)
-                    tile_props = collection.mt_tile_props
-                    disp_strength = tile_props.displacement_strength
-                    disp_texture = obj_props.disp_texture
-
-                    disp_texture.image = disp_image
-                    disp_mod = obj.modifiers[obj_props.disp_mod_name]
-                    # disp_mod = obj.modifiers[obj['disp_mod_name']]
-                    disp_mod.texture = disp_texture
-                    disp_mod.mid_level = 0
-                    disp_mod.strength = disp_strength
-                    subsurf_mod = obj.modifiers[obj_props.subsurf_mod_name]
-                    # subsurf_mod = obj.modifiers[obj['subsurf_mod_name']]
-                    subsurf_mod.levels = scene_props.subdivisions
-                    bpy.ops.object.modifier_move_to_index(ctx, modifier=subsurf_mod.name, index=0)
-                    obj_props.geometry_type = 'DISPLACEMENT'
+                    # baking assigns the secondary material to the whole object
+                    set_to_preview(obj)
+                    apply_variant(variant_base, disp_image, tile_props.displacement_strength)
+                    bpy.data.images.remove(disp_image)
 
                 if voxelise_on_export:
                     depsgraph = context.evaluated_depsgraph_get()
                     dupes = []
 
-                    for obj in visible_objects:
+                    for obj in export_obs:
                         object_eval = obj.evaluated_get(depsgraph)
                         mesh_from_eval = bpy.data.meshes.new_from_object(object_eval)
                         dup_obj = bpy.data.objects.new('dupe', mesh_from_eval)
@@ -196,10 +195,10 @@ class MT_OT_Export_Tile_Variants(bpy.types.Operator):
                             bpy.data.meshes.remove(mesh)
                 else:
                     ctx = {
-                        'object': visible_objects[0],
-                        'active_object': visible_objects[0],
-                        'selected_objects': visible_objects,
-                        'selected_editable_objects': visible_objects}
+                        'object': export_obs[0],
+                        'active_object': export_obs[0],
+                        'selected_objects': export_obs,
+                        'selected_editable_objects': export_obs}
 
                     # export our object
                     bpy.ops.export_mesh.stl(
@@ -211,10 +210,13 @@ class MT_OT_Export_Tile_Variants(bpy.types.Operator):
                         global_scale=unit_multiplier,
                         use_mesh_modifiers=True)
 
-                for obj in displacement_obs:
-                    set_to_preview(obj)
                 i += 1
 
+            for variant in variant_obs:
+                mesh = variant.data
+                objects.remove(variant, do_unlink=True)
+                bpy.data.meshes.remove(mesh)
+
         reset_renderer_from_bake(orig_settings)
 
         return {'FINISHED'}
@@ -250,13 +252,7 @@ class MT_OT_Export_Tile(bpy.types.Operator):
             os.mkdir(export_path)
 
         # Controls if we rescale on export
-        blend_units = scene_props.export_units
-        if blend_units == 'CM':
-            unit_multiplier = 10
-        elif blend_units == 'INCHES':
-            unit_multiplier = 25.4
-        else:
-            unit_multiplier = 1
+        unit_multiplier = get_unit_multiplier(context.scene)
 
         objects = bpy.data.objects
 
@@ -0,0 +1,255 @@
+import os
+import csv
+import json
+from itertools import chain
+from mathutils import Vector
+import bpy
+from bpy.props import StringProperty, FloatProperty
+from bpy_extras.io_utils import ImportHelper
+from ..tile_creation.create_tile import MT_Tile_Generator
+from ..lib.utils.utils import get_all_subclasses
+from ..lib.utils.updates import defer_updates
+from ..lib.utils.profiling import profile_tile
+
+# keys that can appear in a tile spec that aren't scene properties.
+# Entries in assets/data/tile_defaults.json are valid tile specs.
+spec_keys = (
+    'type',
+    'defaults',
+    'location',
+    'bl_idname',
+    'bl_label',
+    'blueprint',
+    'base_blueprints',
+    'main_part_blueprints')
+
+
+class MT_OT_Generate_Batch(bpy.types.Operator, ImportHelper):
+    """Generate a batch of tiles from a JSON or CSV file of tile specs.
+    Each spec has a tile type and the scene properties to use for that tile"""
+    bl_idname = "scene.mt_generate_batch"
+    bl_label = "Generate Batch"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filter_glob: StringProperty(
+        default="*.json;*.csv",
+        options={'HIDDEN'}
+    )
+
+    spacing: FloatProperty(
+        name="Spacing",
+        description="Gap to leave between tiles that don't have a location",
+        default=0.5,
+        min=0
+    )
+
+    @classmethod
+    def poll(cls, context):
+        if context.object is not None:
+            return context.object.mode == 'OBJECT'
+        return True
+
+    def execute(self, context):
+        try:
+            specs = load_tile_specs(self.filepath)
+            bases = generate_batch(context, specs, self.spacing)
+        except (OSError, ValueError) as err:
+            self.report({'ERROR'}, str(err))
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, "Generated " + str(len(bases)) + " tiles")
+        return {'FINISHED'}
+
+
+def load_tile_specs(filepath):
+    """Load tile specs from a JSON or CSV file.
+
+    A JSON file contains a list of specs, a single spec or an object with a 'tiles' list.
+    A CSV file has one spec per row and a column per key. Cells are parsed as JSON
+    where possible so numbers, booleans and lists keep their type.
+
+    Args:
+        filepath (str): path to file
+
+    Raises:
+        ValueError: if file is not .json or .csv
+
+    Returns:
+        list[dict]: tile specs
+    """
+    extension = os.path.splitext(filepath)[1].lower()
+
+    if extension == '.json':
+        with open(filepath) as json_file:
+            specs = json.load(json_file)
+        if isinstance(specs, dict):
+            specs = specs.get('tiles', [specs])
+        return specs
+
+    if extension == '.csv':
+        with open(filepath, newline='') as csv_file:
+            return [
+                {key: parse_cell(value) for key, value in row.items() if value not in ('', None)}
+                for row in csv.DictReader(csv_file)]
+
+    raise ValueError("Batch file must be .json or .csv")
+
+
+def parse_cell(value):
+    """Return the value of a CSV cell.
+
+    Args:
+        value (str): cell
+
+    Returns:
+        any: cell parsed as JSON or the cell if it isn't valid JSON
+    """
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def get_tile_generators():
+    """Return the tile generators shown in the tile type menu.
+
+    Returns:
+        dict{str: MT_Tile_Generator}: generators keyed by mt_type
+    """
+    return {
+        subclass.mt_type: subclass
+        for subclass in get_all_subclasses(MT_Tile_Generator)
+        if 'INTERNAL' not in subclass.bl_options}
+
+
+def get_spec_settings(spec):
+    """Return the scene properties a tile spec sets.
+
+    Args:
+        spec (dict): tile spec
+
+    Returns:
+        dict: scene property values
+    """
+    settings = dict(spec.get('defaults', {}))
+    settings.update({key: value for key, value in spec.items() if key not in spec_keys})
+    if 'material' in settings:
+        settings['tile_material_1'] = settings.pop('material')
+    return settings
+
+
+def validate_tile_spec(scene_props, spec, generators):
+    """Check a tile spec can be generated.
+
+    Args:
+        scene_props (MakeTile.properties.MT_Scene_Properties): maketile scene properties
+        spec (dict): tile spec
+        generators (dict{str: MT_Tile_Generator}): generators keyed by mt_type
+
+    Raises:
+        ValueError: if spec is invalid
+    """
+    if spec.get('type') not in generators:
+        raise ValueError("Unknown tile type " + str(spec.get('type')))
+
+    properties = scene_props.bl_rna.properties
+    for key in get_spec_settings(spec):
+        if key not in ('base_defaults', 'tile_defaults') and key not in properties:
+            raise ValueError("Unknown tile property " + key + " for " + spec['type'])
+
+    material = get_spec_settings(spec).get('tile_material_1')
+    if material is not None and material not in bpy.data.materials:
+        raise ValueError("Unknown material " + material)
+
+    if 'location' in spec and len(spec['location']) != 3:
+        raise ValueError("Tile location must be [x, y, z]")
+
+
+def apply_tile_spec(scene_props, spec):
+    """Set scene properties for a tile spec.
+
+    Tile type defaults are applied first, then blueprint defaults, then the values in spec.
+
+    Args:
+        scene_props (MakeTile.properties.MT_Scene_Properties): maketile scene properties
+        spec (dict): tile spec
+    """
+    settings = get_spec_settings(spec)
+
+    # the update callbacks of these apply the tile type's defaults
+    scene_props.tile_type = spec['type']
+    scene_props.tile_blueprint = settings.pop('tile_blueprint', 'CUSTOM')
+    for key in ('base_blueprint', 'main_part_blueprint'):
+        if key in settings:
+            setattr(scene_props, key, settings.pop(key))
+
+    base_defaults = settings.pop('base_defaults', {}).get(scene_props.base_blueprint, {})
+    tile_defaults = settings.pop('tile_defaults', {}).get(scene_props.main_part_blueprint, {})
+
+    for key, value in chain(base_defaults.items(), tile_defaults.items(), settings.items()):
+        setattr(scene_props, key, value)
+
+
+def generate_batch(context, specs, spacing=0.5):
+    """Generate a tile for each tile spec.
+
+    Tiles without a location are laid out in a row along X from the 3D cursor.
+    Scene properties and the cursor are restored afterwards. The view layer
+    is only updated once all the tiles are generated.
+
+    Args:
+        context (bpy.context): context
+        specs (list[dict]): tile specs
+        spacing (float, optional): gap between tiles laid out in a row. Defaults to 0.5.
+
+    Raises:
+        ValueError: if a spec is invalid. Raised before any tiles are generated
+
+    Returns:
+        list[bpy.types.Object]: the base of each tile
+    """
+    scene_props = context.scene.mt_scene_props
+    generators = get_tile_generators()
+
+    for spec in specs:
+        validate_tile_spec(scene_props, spec, generators)
+
+    cursor = context.scene.cursor
+    start_location = cursor.location.copy()
+
+    # restored by assigning ID properties directly so update callbacks don't run
+    saved_props = {
+        key: value.to_list() if hasattr(value, 'to_list') else value
+        for key, value in scene_props.items()
+        if key in scene_props.bl_rna.properties}
+
+    bases = []
+    offset = 0
+    try:
+        # the view layer is updated once after the last tile
+        with defer_updates():
+            for spec in specs:
+                apply_tile_spec(scene_props, spec)
+
+                if 'location' in spec:
+                    cursor.location = spec['location']
+                else:
+                    cursor.location = start_location + Vector((offset, 0, 0))
+                    offset += max(scene_props.tile_x, scene_props.base_x) + spacing
+
+                generator = generators[spec['type']]
+                # Call the spawn function directly rather than the operator
+                # through bpy.ops so the view layer isn't updated before and
+                # after every tile
+                with profile_tile(generator.bl_idname, generator.bl_label):
+                    generator.mt_spawn(context)
+                bases.append(context.active_object)
+    finally:
+        cursor.location = start_location
+        for key in list(scene_props.keys()):
+            if key in scene_props.bl_rna.properties and key not in saved_props:
+                del scene_props[key]
+        for key, value in saved_props.items():
+            scene_props[key] = value
+
+    return bases
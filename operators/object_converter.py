@@ -54,6 +54,7 @@ class MT_OT_Convert_To_MT_Obj(bpy.types.Operator):
         obj_props = obj.mt_object_props
         obj_props.is_mt_object = True
         obj_props.is_converted = True
+        obj_props.is_resizable = False
 
         # Yeah it might not be a tile technically. Deal with it :P
         obj_props.tile_name = new_collection.name
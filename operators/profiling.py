@@ -0,0 +1,45 @@
+import json
+import bpy
+from bpy.props import StringProperty
+from bpy_extras.io_utils import ExportHelper
+from ..lib.utils.profiling import generation_profiles, chrome_trace
+
+
+class MT_OT_Export_Generation_Trace(bpy.types.Operator, ExportHelper):
+    """Save recorded tile generation profiles as a Chrome trace file.
+    Open it in chrome://tracing or ui.perfetto.dev"""
+    bl_idname = "scene.mt_export_generation_trace"
+    bl_label = "Export Trace"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".json"
+
+    filter_glob: StringProperty(
+        default="*.json",
+        options={'HIDDEN'}
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return len(generation_profiles) > 0
+
+    def execute(self, context):
+        with open(self.filepath, 'w') as trace_file:
+            json.dump(chrome_trace(generation_profiles), trace_file)
+        self.report({'INFO'}, "Saved trace to " + self.filepath)
+        return {'FINISHED'}
+
+
+class MT_OT_Clear_Generation_Profiles(bpy.types.Operator):
+    """Clear recorded tile generation profiles"""
+    bl_idname = "scene.mt_clear_generation_profiles"
+    bl_label = "Clear Profiles"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return len(generation_profiles) > 0
+
+    def execute(self, context):
+        generation_profiles.clear()
+        return {'FINISHED'}
@@ -0,0 +1,124 @@
+import numpy as np
+import bpy
+from ..lib.geometry.grid import resize_box_grid
+
+
+# tile types whose cores are box grids and the fraction of each dimension that stays fixed
+# when they are resized. Straight wall cores are centred on their base along Y.
+resizable_tiles = {
+    'STRAIGHT_WALL': (0, 0.5, 0),
+    'RECTANGULAR_FLOOR': (0, 0, 0)}
+
+
+class MT_OT_Resize_Tile_Core(bpy.types.Operator):
+    """Resize the core of the selected tile in place to the current tile size.
+    Vertex groups, UVs, materials and modifiers are kept. Tiles with a base or cutters must be regenerated instead"""
+    bl_idname = "object.mt_resize_tile_core"
+    bl_label = "Resize Tile Core"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        if obj is None or obj.mode != 'OBJECT':
+            return False
+        obj_props = obj.mt_object_props
+        if obj_props.is_mt_object is not True or obj_props.tile_name not in bpy.data.collections:
+            return False
+        tile_props = bpy.data.collections[obj_props.tile_name].mt_tile_props
+        return tile_props.tile_type in resizable_tiles
+
+    def execute(self, context):
+        scene_props = context.scene.mt_scene_props
+        tile = bpy.data.collections[context.object.mt_object_props.tile_name]
+        tile_props = tile.mt_tile_props
+
+        subdivs = (
+            tile_props.x_native_subdivisions,
+            tile_props.y_native_subdivisions,
+            tile_props.z_native_subdivisions)
+
+        new_subdivs = (
+            scene_props.x_native_subdivisions,
+            scene_props.y_native_subdivisions,
+            scene_props.z_native_subdivisions)
+
+        if subdivs != new_subdivs:
+            self.report({'ERROR'}, "Native subdivisions have changed. Regenerate the tile instead.")
+            return {'CANCELLED'}
+
+        base_height = tile_props.base_size[2]
+        dims = (
+            tile_props.tile_size[0],
+            tile_props.tile_size[1],
+            tile_props.tile_size[2] - base_height)
+        new_dims = (
+            scene_props.tile_x,
+            scene_props.tile_y,
+            scene_props.tile_z - base_height)
+
+        cores = [obj for obj in tile.objects
+                 if obj.type == 'MESH'
+                 and obj.mt_object_props.geometry_type in ('PREVIEW', 'DISPLACEMENT')]
+
+        # the base and cutters are sized to the old core so would no longer fit
+        has_base = any(
+            obj.type == 'MESH' and obj.mt_object_props.geometry_type == 'BASE'
+            for obj in tile.objects)
+        has_cutters = any(
+            obj.mt_object_props.geometry_type == 'CUTTER' for obj in tile.objects) or any(
+            len(core.mt_object_props.cutters_collection) for core in cores)
+        if has_base or has_cutters:
+            self.report({'ERROR'}, "Tile has a base or cutters. Regenerate the tile instead.")
+            return {'CANCELLED'}
+
+        for core in cores:
+            core_props = core.mt_object_props
+            if not core_props.is_resizable:
+                self.report(
+                    {'ERROR'},
+                    core.name + " was subdivided or converted so can't be resized. Regenerate the tile instead.")
+                return {'CANCELLED'}
+            if core_props.preview_mesh is not None:
+                self.report({'ERROR'}, "Return " + core.name + " to preview before resizing it.")
+                return {'CANCELLED'}
+
+        anchor = resizable_tiles[tile_props.tile_type]
+
+        for core in cores:
+            if not resize_core(core, dims, new_dims, subdivs, anchor):
+                self.report(
+                    {'ERROR'},
+                    core.name + " has been edited since it was generated. Regenerate the tile instead.")
+                return {'CANCELLED'}
+
+        tile_props.tile_size = (scene_props.tile_x, scene_props.tile_y, scene_props.tile_z)
+
+        return {'FINISHED'}
+
+
+def resize_core(core, dims, new_dims, subdivs, anchor, margin=0.001):
+    """Move the verts of a core generated with box_grid so it has new dimensions.
+
+    Args:
+        core (bpy.types.Object): core
+        dims (tuple[3]): dimensions core was generated with
+        new_dims (tuple[3]): new dimensions
+        subdivs (tuple[3]): native subdivisions core was generated with
+        anchor (tuple[3]): fraction of each dimension that stays fixed
+        margin (float, optional): margin core was generated with. Defaults to 0.001.
+
+    Returns:
+        bool: Whether core could be resized
+    """
+    mesh = core.data
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+
+    new_coords = resize_box_grid(coords.reshape(-1, 3), dims, new_dims, subdivs, margin, anchor)
+    if new_coords is None:
+        return False
+
+    mesh.vertices.foreach_set('co', new_coords.ravel().astype(np.float32))
+    mesh.update()
+    return True
@@ -34,6 +34,10 @@ def set_to_preview(obj):
     prefs = get_prefs()
     secondary_material = bpy.data.materials[prefs.secondary_material]
     props = obj.mt_object_props
+
+    if props.preview_mesh is not None:
+        restore_preview_mesh(obj)
+
     disp_mod = obj.modifiers[props.disp_mod_name]
     #disp_mod = obj.modifiers[obj['disp_mod_name']]
     disp_mod.strength = 0
@@ -60,3 +64,24 @@ def set_to_preview(obj):
     bpy.ops.object.modifier_move_to_index(ctx, modifier=props.subsurf_mod_name, index=new_index)
     obj.cycles.use_adaptive_subdivision = True
     obj.mt_object_props.geometry_type = 'PREVIEW'
+
+
+def restore_preview_mesh(obj):
+    """Give an object that has had its displacement applied back its preview mesh and modifiers.
+
+    Args:
+        obj (bpy.types.Object): object
+    """
+    props = obj.mt_object_props
+    displaced_mesh = obj.data
+    obj.data = props.preview_mesh
+    props.preview_mesh = None
+    if displaced_mesh.users == 0:
+        bpy.data.meshes.remove(displaced_mesh)
+
+    for state in props.modifier_states:
+        if state.name in obj.modifiers:
+            mod = obj.modifiers[state.name]
+            mod.show_viewport = state.show_viewport
+            mod.show_render = state.show_render
+    props.modifier_states.clear()
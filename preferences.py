@@ -1,10 +1,11 @@
 import os
 import shutil
 import bpy
-from bpy.props import StringProperty, EnumProperty
+from bpy.props import StringProperty, EnumProperty, IntProperty, BoolProperty
 from . utils.registration import get_path
 from . utils.system import makedir, abspath
 from . enums.enums import tile_blueprints, units
+from .tile_creation.create_tile import clear_cutter_templates
 from .properties import (
     create_tile_type_enums,
     create_base_blueprint_enums,
@@ -18,6 +19,7 @@ class MT_MakeTilePreferences(bpy.types.AddonPreferences):
     user_path = os.path.expanduser('~')
     export_path = os.path.join(user_path, 'MakeTile')
     user_assets_path = os.path.join(user_path, 'MakeTile', 'UserAssets')
+    bake_cache_path = os.path.join(user_path, 'MakeTile', 'BakeCache')
 
     # asset libraries
     def update_assetspath(self, context):
@@ -110,6 +112,47 @@ class MT_MakeTilePreferences(bpy.types.AddonPreferences):
         name="Default Tile Type"
     )
 
+    core_cache_size: IntProperty(
+        name="Core Cache Size (MB)",
+        description="Memory to use for caching generated core meshes so identical cores are not redrawn",
+        default=64,
+        min=0
+    )
+
+    bake_cache_path: StringProperty(
+        name="Bake Cache",
+        subtype='DIR_PATH',
+        description="Folder to keep baked displacement maps in so unchanged tiles aren't baked again",
+        default=bake_cache_path,
+    )
+
+    bake_cache_size: IntProperty(
+        name="Bake Cache Size (MB)",
+        description="Disk space to use for cached displacement maps. 0 turns off the cache",
+        default=512,
+        min=0
+    )
+
+    bake_cutter_arrays: BoolProperty(
+        name="Precompute Cutter Arrays",
+        description="Replace the array modifiers on pegs and cutters with the geometry they make when a tile is generated. "
+        "Booleans then evaluate faster but arrays can no longer be adjusted afterwards",
+        default=False
+    )
+
+    combine_cutters: BoolProperty(
+        name="Combine Cutters",
+        description="Give each part of a tile one boolean per operation that cuts with all of its cutters at once "
+        "instead of one boolean per cutter. Needs Blender 2.91 or later",
+        default=False
+    )
+
+    profile_generation: BoolProperty(
+        name="Profile Tile Generation",
+        description="Record how long each stage of tile generation takes. Results are shown in the Profiling panel",
+        default=False
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.prop(self, 'assets_path')
@@ -120,8 +163,16 @@ class MT_MakeTilePreferences(bpy.types.AddonPreferences):
         layout.prop(self, 'default_tile_main_system')
         layout.prop(self, 'default_base_system')
         layout.prop(self, 'secondary_material')
+        layout.prop(self, 'core_cache_size')
+        layout.prop(self, 'bake_cache_path')
+        layout.prop(self, 'bake_cache_size')
+        layout.prop(self, 'bake_cutter_arrays')
+        layout.prop(self, 'combine_cutters')
+        layout.prop(self, 'profile_generation')
 
 
 # TODO: Stub - reload_asset_libraries
 def reload_asset_libraries():
     print('reload_asset_libraries')
+    # cutter templates were read from the old asset libraries
+    clear_cutter_templates()
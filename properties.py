@@ -2,7 +2,7 @@ import os
 import bpy
 from bpy.types import PropertyGroup
 from .utils.registration import get_prefs
-from .tile_creation.create_tile import MT_Tile_Generator
+from .tile_creation.create_tile import MT_Tile_Generator, get_subsurf_levels
 from . enums.enums import (
     tile_main_systems,
     base_systems,
@@ -17,6 +17,7 @@ from . enums.enums import (
 
 from .app_handlers import load_material_libraries
 from .lib.utils.utils import get_all_subclasses
+from .lib.bmturtle.adapter import project_uvs
 
 
 class MT_Preview_Materials(PropertyGroup):
@@ -40,6 +41,29 @@ class MT_Preview_Materials(PropertyGroup):
     )
 
 
+class MT_Modifier_State(PropertyGroup):
+    """Used to store whether a modifier was shown before displacement was applied.
+
+    When displacement is applied the evaluated mesh replaces the object's mesh so its
+    modifiers are hidden. We store their state here so Return to Preview can show them again.
+
+    Args:
+        PropertyGroup (bpy.types.PropertyGroup): Parent class
+    """
+
+    name: bpy.props.StringProperty(
+        name="Modifier Name"
+    )
+
+    show_viewport: bpy.props.BoolProperty(
+        name="Show in Viewport"
+    )
+
+    show_render: bpy.props.BoolProperty(
+        name="Show in Render"
+    )
+
+
 # Radio buttons used in menus
 class MT_Radio_Buttons(PropertyGroup):
     def update_mapping_axis(self, context):
@@ -78,6 +102,15 @@ class MT_Radio_Buttons(PropertyGroup):
 class MT_Cutter_Item(PropertyGroup):
     def update_use_cutter(self, context):
         if self.parent is not "":
+            if self.operands:
+                # cutter is one of the objects a combined boolean cuts with
+                operands = bpy.data.collections[self.operands]
+                cutter = bpy.data.objects[self.name]
+                if self.value and cutter.name not in operands.objects:
+                    operands.objects.link(cutter)
+                elif not self.value and cutter.name in operands.objects:
+                    operands.objects.unlink(cutter)
+                return
             parent_obj = bpy.data.objects[self.parent]
             bool_mod = parent_obj.modifiers[self.name + '.bool']
             bool_mod.show_viewport = self.value
@@ -90,6 +123,9 @@ class MT_Cutter_Item(PropertyGroup):
         update=update_use_cutter)
     parent: bpy.props.StringProperty(
         name="")
+    operands: bpy.props.StringProperty(
+        name="",
+        description="Collection of cutters the cutter is in if its parent uses a combined boolean")
 
 
 def create_tile_type_enums(self, context):
@@ -156,14 +192,17 @@ def create_base_blueprint_enums(self, context):
 
 
 def update_tile_blueprint(self, context):
-    blueprint = context.scene.mt_scene_props.tile_blueprint
+    scene_props = context.scene.mt_scene_props
+    blueprint = scene_props.tile_blueprint
     subclasses = get_all_subclasses(MT_Tile_Generator)
 
-    for subclass in subclasses:
-        if hasattr(subclass, 'mt_blueprint'):
-            if subclass.mt_blueprint == blueprint and 'INTERNAL' not in subclass.bl_options:
-                context.scene.mt_scene_props.tile_type = subclass.bl_idname
-                break
+    generators = [subclass for subclass in subclasses
+                  if getattr(subclass, 'mt_blueprint', None) == blueprint
+                  and 'INTERNAL' not in subclass.bl_options]
+
+    # keep the current tile type if it can be made with this blueprint
+    if generators and scene_props.tile_type not in [gen.mt_type for gen in generators]:
+        scene_props.tile_type = generators[0].mt_type
 
 
 def update_scene_defaults(self, context):
@@ -311,7 +350,7 @@ class MT_Scene_Properties(PropertyGroup):
             subsurf_mod = obj_props.subsurf_mod_name
             if subsurf_mod in obj.modifiers:
                 modifier = obj.modifiers[subsurf_mod]
-                modifier.levels = context.scene.mt_scene_props.subdivisions
+                modifier.levels = get_subsurf_levels(obj, context.scene.mt_scene_props.subdivisions)
 
     def update_material_mapping(self, context):
         '''updates which mapping method to use for a material'''
@@ -350,7 +389,7 @@ class MT_Scene_Properties(PropertyGroup):
                     mapping_node.inputs['Vector'])
 
     def update_UV_island_margin(self, context):
-        '''Reruns UV smart project for preview and displacement object'''
+        '''Reruns UV projection for preview and displacement object'''
 
         if len(bpy.context.selected_editable_objects) > 0:
             obj = bpy.context.object
@@ -365,13 +404,17 @@ class MT_Scene_Properties(PropertyGroup):
                     UV_island_margin = scene_props.UV_island_margin
                     tile_props.UV_island_margin = UV_island_margin
 
-                    ctx = {
-                        'object': obj,
-                        'active_object': obj,
-                        'selected_objects': [obj],
-                        'selected_editable_objects': [obj]}
+                    if obj_props.is_converted:
+                        # converted meshes can be any shape so need an angle based unwrap
+                        ctx = {
+                            'object': obj,
+                            'active_object': obj,
+                            'selected_objects': [obj],
+                            'selected_editable_objects': [obj]}
 
-                    bpy.ops.uv.smart_project(ctx, island_margin=UV_island_margin)
+                        bpy.ops.uv.smart_project(ctx, island_margin=UV_island_margin)
+                    else:
+                        project_uvs(obj, UV_island_margin)
 
     mt_is_just_activated: bpy.props.BoolProperty(
         description="Has the add-on just been activated. Used to populate materials list first time round",
@@ -516,6 +559,24 @@ class MT_Scene_Properties(PropertyGroup):
         update=update_disp_subdivisions
     )
 
+    displacement_density: bpy.props.FloatProperty(
+        name="Displacement Density",
+        description="Longest edge in mm of the textured faces of new tiles. Only textured faces are subdivided, "
+        "instead of subdividing the whole core with a subsurf modifier. 0 uses the subsurf modifier",
+        default=0,
+        min=0,
+        soft_max=5,
+        precision=2
+    )
+
+    apply_displacement: bpy.props.BoolProperty(
+        name="Apply Displacement",
+        description="Make 3D moves the verts of the subdivided mesh by the displacement map instead of adding "
+        "a displacement modifier. The result exports and voxelises without evaluating any modifiers "
+        "but strength and subdivisions can't be changed until you return to preview",
+        default=False
+    )
+
     texture_margin: bpy.props.FloatProperty(
         name="Texture Margin",
         description="Margin around displacement texture. Used for correcting distortion",
@@ -797,6 +858,41 @@ class MT_Object_Properties(PropertyGroup):
         type=MT_Preview_Materials
     )
 
+    is_subdivided: bpy.props.BoolProperty(
+        name="Is Subdivided",
+        description="Textured faces were subdivided when the object was made so it doesn't need subsurf",
+        default=False
+    )
+
+    preview_mesh: bpy.props.PointerProperty(
+        name="Preview Mesh",
+        type=bpy.types.Mesh,
+        description="Mesh to return to if displacement has been applied to the object's mesh"
+    )
+
+    modifier_states: bpy.props.CollectionProperty(
+        name="Modifier States",
+        type=MT_Modifier_State
+    )
+
+    is_resizable: bpy.props.BoolProperty(
+        name="Is Resizable",
+        description="Mesh is a box grid core whose verts Resize Core can move",
+        default=False
+    )
+
+    bend_factor: bpy.props.FloatProperty(
+        name="Bend Factor",
+        description="Angle per unit length the object's mesh was bent through. 0 if it isn't bent",
+        default=0
+    )
+
+    bend_centre: bpy.props.FloatProperty(
+        name="Bend Centre",
+        description="X coordinate of the middle of the object's mesh before it was bent",
+        default=0
+    )
+
 
 class MT_Tile_Properties(PropertyGroup):
     is_mt_collection: bpy.props.BoolProperty(
@@ -0,0 +1,31 @@
+# lib/geometry and the recording side of lib/bmturtle/builder.py don't need
+# Blender. Putting lib on sys.path lets their tests import them as top level
+# packages under plain CPython without running the add-on's __init__.
+import os
+import sys
+from pathlib import Path
+import pytest
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR = os.path.join(ADDON_DIR, 'lib')
+
+if LIB_DIR not in sys.path:
+    sys.path.insert(0, LIB_DIR)
+
+
+class AddonRootAsDir:
+    """Collect the add-on's directory as a plain directory rather than a package.
+
+    pytest imports a package's __init__ before running the tests in it, and the
+    add-on's __init__ imports bpy.
+    """
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collect_directory(self, path, parent):
+        if path == Path(ADDON_DIR):
+            return pytest.Dir.from_parent(parent, path=path)
+        return None
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(AddonRootAsDir(), 'addon_root_as_dir')
@@ -0,0 +1,75 @@
+# Tests for baking cutter array modifiers.
+#
+# These need Blender's Python module. Run them with the bpy module installed or
+# from Blender's bundled Python:
+#
+#   python -m pytest tests
+import os
+import sys
+import importlib
+import pytest
+
+bpy = pytest.importorskip('bpy')
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+
+@pytest.fixture
+def adapter():
+    parent_dir = os.path.dirname(ADDON_DIR)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    return importlib.import_module(ADDON_NAME + '.lib.bmturtle.adapter')
+
+
+def new_quad(name):
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [], [(0, 1, 2, 3)])
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+@pytest.fixture
+def cutter():
+    """Quad arrayed 3 times along X with a start cap that is itself arrayed along Y."""
+    cutter = new_quad('bake_arrays_cutter')
+    cap = new_quad('bake_arrays_cap')
+
+    cap_array = cap.modifiers.new('Array', 'ARRAY')
+    cap_array.count = 2
+    cap_array.relative_offset_displace = (0, 1, 0)
+
+    array = cutter.modifiers.new('Array', 'ARRAY')
+    array.count = 3
+    array.start_cap = cap
+    yield cutter
+
+    for obj in (cutter, cap):
+        mesh = obj.data
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+
+
+def evaluated_vert_count(obj):
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    return len(obj.evaluated_get(depsgraph).to_mesh().vertices)
+
+
+def test_baked_caps_match_modifier(adapter, cutter):
+    expected = evaluated_vert_count(cutter)
+    assert adapter.bake_arrays(cutter)
+    assert len(cutter.data.vertices) == expected
+
+
+def test_key_changes_with_cap_settings(adapter, cutter):
+    key = adapter.evaluate_arrays(cutter)[0]
+    cutter.modifiers['Array'].start_cap.modifiers['Array'].count = 3
+    assert adapter.evaluate_arrays(cutter)[0] != key
+
+
+def test_cap_with_other_modifiers_is_not_baked(adapter, cutter):
+    cutter.modifiers['Array'].start_cap.modifiers.new('Bevel', 'BEVEL')
+    assert not adapter.bake_arrays(cutter)
+    assert len(cutter.modifiers) == 1
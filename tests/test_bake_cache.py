@@ -0,0 +1,62 @@
+# Tests for the displacement bake cache key.
+#
+# These need Blender's Python module. Run them with the bpy module installed or
+# from Blender's bundled Python:
+#
+#   python -m pytest tests
+import os
+import sys
+import importlib
+import pytest
+
+bpy = pytest.importorskip('bpy')
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+
+@pytest.fixture
+def bake_cache():
+    parent_dir = os.path.dirname(ADDON_DIR)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    return importlib.import_module(ADDON_NAME + '.lib.utils.bake_cache')
+
+
+@pytest.fixture
+def preview_obj():
+    mesh = bpy.data.meshes.new('bake_cache_test')
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], [], [(0, 1, 2, 3)])
+    mesh.uv_layers.new(name='UVMap')
+
+    material = bpy.data.materials.new('bake_cache_test')
+    material.use_nodes = True
+    tree = material.node_tree
+    seed = tree.nodes.new('ShaderNodeValue')
+    seed.name = 'Seed'
+    seed.outputs[0].default_value = 1
+    noise = tree.nodes.new('ShaderNodeTexNoise')
+    tree.links.new(seed.outputs[0], noise.inputs['Scale'])
+    mesh.materials.append(material)
+
+    obj = bpy.data.objects.new('bake_cache_test', mesh)
+    yield obj
+
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+    bpy.data.materials.remove(material)
+
+
+def test_key_is_stable(bake_cache, preview_obj):
+    assert bake_cache.bake_key(preview_obj, 256) == bake_cache.bake_key(preview_obj, 256)
+
+
+def test_key_changes_with_seed(bake_cache, preview_obj):
+    key = bake_cache.bake_key(preview_obj, 256)
+    seed = preview_obj.material_slots[0].material.node_tree.nodes['Seed']
+    seed.outputs[0].default_value = 2
+    assert bake_cache.bake_key(preview_obj, 256) != key
+
+
+def test_key_changes_with_resolution(bake_cache, preview_obj):
+    assert bake_cache.bake_key(preview_obj, 256) != bake_cache.bake_key(preview_obj, 512)
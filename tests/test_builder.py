@@ -0,0 +1,103 @@
+import os
+import sys
+import importlib
+import numpy as np
+import pytest
+from bmturtle.builder import MeshBuilder
+from geometry.cores import straight_wall_core
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+
+def face_set(coords, faces):
+    """Return faces as sets of rounded vert coordinates so meshes can be compared
+    regardless of vert order, face order and winding."""
+    coords = np.round(np.asarray(coords, dtype=float), 6)
+    return {frozenset(tuple(coords[v]) for v in face) for face in faces}
+
+
+def record_box(dims, subdivs, margin):
+    """Record a box the way draw_straight_wall_core draws it."""
+    def steps(length, count):
+        return [margin] + [(length - margin * 2) / count] * count + [margin]
+
+    builder = MeshBuilder()
+    builder.add_vert((0, 0, 0))
+    for distance in steps(dims[0], subdivs[0]):
+        builder.extrude((distance, 0, 0))
+
+    builder.select_mode = {'EDGE'}
+    builder.select_all()
+    for distance in steps(dims[1], subdivs[1]):
+        builder.extrude((0, distance, 0))
+
+    builder.select_mode = {'FACE'}
+    builder.select_all()
+    for i, distance in enumerate(steps(dims[2], subdivs[2])):
+        builder.extrude((0, 0, distance), del_original=i > 0)
+
+    live = [i for i, f in enumerate(builder.faces) if f is not None]
+    return builder.verts, [builder.faces[i] for i in live]
+
+
+@pytest.mark.parametrize('dims, subdivs', [
+    ((2, 0.5, 1), (1, 1, 1)),
+    ((2, 0.5, 1), (4, 2, 3))])
+def test_recorded_box_matches_box_grid(dims, subdivs):
+    verts, faces = record_box(dims, subdivs, 0.001)
+    coords, grid_faces, _ = straight_wall_core(dims, subdivs, 0.001)
+    assert face_set(verts, faces) == face_set(coords, grid_faces)
+
+
+def test_recorded_box_is_closed():
+    _, faces = record_box((2, 0.5, 1), (3, 2, 2), 0.001)
+    edges = {}
+    for face in faces:
+        for a, b in zip(face, face[1:] + face[:1]):
+            key = (min(a, b), max(a, b))
+            edges[key] = edges.get(key, 0) + 1
+    assert set(edges.values()) == {2}
+
+
+def test_delete_faces_removes_unused_verts():
+    builder = MeshBuilder()
+    builder.add_vert((0, 0, 0))
+    builder.extrude((1, 0, 0))
+    builder.select_mode = {'EDGE'}
+    builder.select_all()
+    builder.extrude((0, 1, 0))
+    builder.delete_faces([0])
+    assert builder.faces == [None]
+    assert builder._dead_verts == {0, 1, 2, 3}
+
+
+@pytest.mark.parametrize('draw_name, args', [
+    ('draw_straight_wall_core', ((2, 0.5, 1), (4, 2, 3))),
+    ('draw_rectangular_floor_core', ((2, 2, 0.3), (4, 4, 1))),
+    ('draw_tri_floor_core', ({'b': 2, 'c': 2, 'A': 60, 'height': 0.3}, [15, 2]))])
+def test_builder_gives_same_mesh(draw_name, args):
+    bpy = pytest.importorskip('bpy')
+    parent_dir = os.path.dirname(ADDON_DIR)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    scripts = importlib.import_module(ADDON_NAME + '.lib.bmturtle.scripts')
+    draw = getattr(scripts, draw_name)
+
+    meshes = []
+    for use_builder in (False, True):
+        bpy.context.scene.cursor.location = (0, 0, 0)
+        bpy.context.scene.cursor.rotation_euler = (0, 0, 0)
+        obj = draw(*[list(a) if isinstance(a, list) else a for a in args], use_builder=use_builder)
+        mesh = obj.data
+        coords = [v.co[:] for v in mesh.vertices]
+        faces = [tuple(p.vertices) for p in mesh.polygons]
+        groups = {
+            group.name: {
+                tuple(np.round(coords[v.index], 6)) for v in mesh.vertices
+                if group.index in [g.group for g in v.groups]}
+            for group in obj.vertex_groups}
+        meshes.append((face_set(coords, faces), groups))
+        bpy.data.objects.remove(obj)
+
+    assert meshes[0] == meshes[1]
@@ -0,0 +1,296 @@
+from math import tan, radians
+import numpy as np
+import pytest
+from geometry import cores
+from geometry.arrays import array_mesh
+from geometry.deform import bend, bend_factor, unbend
+from geometry.displacement import sample_bilinear
+from geometry.uv import box_project
+
+MARGIN = 0.001
+
+
+def corner_dimensions(leg_1, leg_2, thickness, angle, base_height, height):
+    """Return corner_core dimensions the way L_Tiles works them out."""
+    def adjacent(leg):
+        opp = leg * tan(radians(angle / 2))
+        return leg, (opp - thickness) * tan(radians(90 - angle / 2))
+
+    a_adj, b_adj = adjacent(leg_1)
+    c_adj, d_adj = adjacent(leg_2)
+    triangles = {'a_adj': a_adj, 'b_adj': b_adj, 'c_adj': c_adj, 'd_adj': d_adj}
+    return {
+        'triangles_1': triangles,
+        'triangles_2': triangles,
+        'angle': angle,
+        'thickness': thickness,
+        'thickness_diff': 0,
+        'base_height': base_height,
+        'height': height}
+
+
+CORNER_SUBDIVS = {'leg 1': 3, 'leg 2': 2, 'width': 1, 'height': 2}
+
+SHAPES = {
+    'straight_wall': lambda: cores.straight_wall_core((2, 0.3, 1.5), (4, 1, 3), MARGIN),
+    'rectangular_floor': lambda: cores.rectangular_floor_core((2, 2, 0.3), (4, 4, 1), MARGIN),
+    'column': lambda: cores.column_core((0.5, 0.5, 2), (2, 2, 4), MARGIN),
+    'corner_wall': lambda: cores.corner_core(
+        corner_dimensions(2, 2, 0.3, 90, 0.2, 1.5), CORNER_SUBDIVS, MARGIN),
+    'corner_floor': lambda: cores.corner_core(
+        corner_dimensions(2, 1.5, 0.5, 90, 0.2, 0.3), CORNER_SUBDIVS, MARGIN, wall=False),
+    'u_wall': lambda: cores.u_wall_core(
+        {'leg_1_inner': 1, 'leg_2_inner': 1.5, 'base_height': 0.2, 'height': 1.5,
+         'x_inner': 1, 'thickness': 0.3, 'thickness_diff': 0},
+        {'leg_1': 2, 'leg_2': 3, 'x': 2, 'width': 1, 'height': 2},
+        MARGIN),
+    'tri_floor': lambda: cores.tri_floor_core(
+        {'b': 2, 'c': 1.5, 'A': 60, 'height': 0.3}, [3, 1], MARGIN),
+    'semi_circ_pos': lambda: cores.semi_circ_core(
+        {'radius': 1, 'angle': 90, 'height': 0.3}, {'sides': 3, 'arc': 8}, MARGIN, 'POS'),
+    'semi_circ_neg': lambda: cores.semi_circ_core(
+        {'radius': 1, 'angle': 90, 'height': 0.3}, {'sides': 3, 'arc': 8}, MARGIN, 'NEG')}
+
+EXPECTED_GROUPS = {
+    'straight_wall': {'Left', 'Right', 'Front', 'Back', 'Top', 'Bottom'},
+    'rectangular_floor': {'Left', 'Right', 'Front', 'Back', 'Top', 'Bottom'},
+    'column': {'Left', 'Right', 'Front', 'Back', 'Top', 'Bottom'},
+    'corner_wall': {
+        'Leg 1 End', 'Leg 2 End', 'Leg 1 Inner', 'Leg 2 Inner', 'Leg 1 Outer',
+        'Leg 2 Outer', 'Leg 1 Top', 'Leg 2 Top', 'Leg 1 Bottom', 'Leg 2 Bottom'},
+    'corner_floor': {
+        'Leg 1 End', 'Leg 2 End', 'Leg 1 Inner', 'Leg 2 Inner', 'Leg 1 Outer',
+        'Leg 2 Outer', 'Leg 1 Top', 'Leg 2 Top', 'Leg 1 Bottom', 'Leg 2 Bottom'},
+    'u_wall': {
+        'Leg 1 End', 'Leg 2 End', 'Leg 1 Inner', 'Leg 2 Inner', 'End Wall Inner',
+        'End Wall Outer', 'Leg 1 Outer', 'Leg 2 Outer', 'Leg 1 Top', 'Leg 2 Top',
+        'End Wall Top', 'Leg 1 Bottom', 'Leg 2 Bottom', 'End Wall Bottom'},
+    'tri_floor': {'Side a', 'Side b', 'Side c', 'Top', 'Bottom'},
+    'semi_circ_pos': {'Side a', 'Side b', 'Side c', 'Top', 'Bottom'},
+    'semi_circ_neg': {'Side a', 'Side b', 'Side c', 'Top', 'Bottom'}}
+
+
+def directed_edges(faces):
+    return [(face[i], face[(i + 1) % len(face)]) for face in faces for i in range(len(face))]
+
+
+def signed_volume(coords, faces):
+    """Volume enclosed by faces, positive if their normals face outwards."""
+    volume = 0
+    for face in faces:
+        a = coords[face[0]]
+        for b, c in zip(coords[list(face[1:-1])], coords[list(face[2:])]):
+            volume += np.dot(a, np.cross(b, c)) / 6
+    return volume
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_core_is_closed_and_consistently_wound(shape):
+    coords, faces, _ = SHAPES[shape]()
+    faces = [tuple(int(v) for v in face) for face in faces]
+    edges = directed_edges(faces)
+
+    # every edge is used once in each direction
+    assert len(edges) == len(set(edges))
+    assert set(edges) == {(b, a) for a, b in edges}
+
+    # no degenerate faces or unused verts
+    assert all(len(set(face)) == len(face) for face in faces)
+    assert {v for face in faces for v in face} == set(range(len(coords)))
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_core_faces_outwards(shape):
+    coords, faces, _ = SHAPES[shape]()
+    assert signed_volume(np.asarray(coords, dtype=float), faces) > 0
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_core_groups(shape):
+    coords, _, groups = SHAPES[shape]()
+    assert set(groups) == EXPECTED_GROUPS[shape]
+
+    for name, indices in groups.items():
+        indices = np.asarray(indices)
+        assert indices.dtype.kind == 'i'
+        assert len(np.unique(indices)) == len(indices)
+        assert ((indices >= 0) & (indices < len(coords))).all()
+        # the column's bottom sits on its base so isn't textured
+        if not (shape == 'column' and name == 'Bottom'):
+            assert len(indices), name
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_top_and_bottom_groups_are_on_top_and_bottom(shape):
+    coords, _, groups = SHAPES[shape]()
+    z = np.asarray(coords)[:, 2]
+    for name, indices in groups.items():
+        if name.endswith('Top') and len(indices):
+            assert np.allclose(z[indices], z.max()), name
+        if name.endswith('Bottom') and len(indices):
+            assert np.allclose(z[indices], z.min()), name
+
+
+def test_straight_wall_groups():
+    dims = (2, 0.3, 1.5)
+    coords, _, groups = cores.straight_wall_core(dims, (4, 1, 3), MARGIN)
+    assert np.allclose(coords[groups['Left'], 0], 0)
+    assert np.allclose(coords[groups['Right'], 0], dims[0])
+    assert np.allclose(coords[groups['Front'], 1], 0)
+    assert np.allclose(coords[groups['Back'], 1], dims[1])
+    # textured sides stop a margin from the edges
+    front = coords[groups['Front']]
+    assert front[:, 0].min() >= MARGIN - 1e-9
+    assert front[:, 2].max() <= dims[2] - MARGIN + 1e-9
+
+
+def test_straight_wall_volume():
+    dims = (2, 0.3, 1.5)
+    coords, faces, _ = cores.straight_wall_core(dims, (4, 1, 3), MARGIN)
+    assert signed_volume(coords, faces) == pytest.approx(np.prod(dims))
+
+
+def test_tri_floor_sides_are_on_their_edges():
+    dims = {'b': 2, 'c': 1.5, 'A': 60, 'height': 0.3}
+    coords, _, groups = cores.tri_floor_core(dims, [3, 1], MARGIN)
+    # side c runs from A along Y, side b from A at angle A to it
+    assert np.allclose(coords[groups['Side c'], 0], 0)
+    side_b = coords[groups['Side b'], :2]
+    direction = (np.sin(radians(dims['A'])), np.cos(radians(dims['A'])))
+    assert np.allclose(side_b[:, 0] * direction[1] - side_b[:, 1] * direction[0], 0)
+
+
+def test_array_mesh_merges_neighbouring_copies():
+    coords = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.0005, 0.5, 0]], dtype=float)
+    loops = np.array([0, 1, 2, 3])
+    totals = np.array([4])
+
+    merged, merged_loops, merged_totals = array_mesh((coords, loops, totals), 3, (1, 0, 0), 0.001)
+
+    # the two shared edges merge, but the verts close together within a copy don't
+    assert len(merged) == 5 * 3 - 2 * 2
+    assert len(merged_totals) == 3
+    assert merged_loops.max() < len(merged)
+    second = merged[merged_loops[4:8]]
+    assert np.allclose(second, [[1, 0, 0], [2, 0, 0], [2, 1, 0], [1, 1, 0]])
+
+
+def test_array_mesh_merges_across_grid_cells():
+    coords = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    loops = np.array([0, 1, 2, 3])
+    totals = np.array([4])
+
+    # copies 0.0009 apart would fall in different cells of a grid the size of the threshold
+    near, _, _ = array_mesh((coords, loops, totals), 2, (1.0009, 0, 0), 0.001)
+    far, _, _ = array_mesh((coords, loops, totals), 2, (1.0011, 0, 0), 0.001)
+    assert len(near) == 6
+    assert len(far) == 8
+
+
+def test_array_mesh_without_merge():
+    coords = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=float)
+    result, loops, totals = array_mesh((coords, [0, 1, 2], [3]), 4, (1, 0, 0))
+    assert len(result) == 12
+    assert list(loops[-3:]) == [9, 10, 11]
+
+
+@pytest.mark.parametrize('degrees', [-359.9, -90, 30, 300])
+def test_bend_unbend_round_trip(degrees):
+    rng = np.random.default_rng(0)
+    coords = rng.random((200, 3)) * (4, 0.5, 1)
+    coords[0, 0] = 0
+    coords[1, 0] = 4
+
+    angle = radians(degrees)
+    factor = bend_factor(coords, angle)
+    bent = bend(coords, angle)
+    centre = (coords[:, 0].min() + coords[:, 0].max()) / 2
+
+    assert not np.allclose(bent, coords)
+    assert np.allclose(unbend(bent, factor, centre), coords)
+
+
+def test_bend_wraps_onto_arc():
+    coords = np.array([[x, 0, 0] for x in np.linspace(0, 2, 5)])
+    angle = radians(-90)
+    factor = bend_factor(coords, angle)
+    bent = bend(coords, angle)
+
+    # verts on the X axis end up on a circle around (0, 1 / factor) whose arc is 2 long
+    radius = np.linalg.norm(bent[:, :2] - (0, 1 / factor), axis=1)
+    assert np.allclose(radius, abs(1 / factor))
+    assert abs(1 / factor) * abs(angle) == pytest.approx(2)
+
+
+def test_sample_bilinear_at_pixel_centres():
+    pixels = np.arange(12, dtype=float).reshape(3, 4)
+    uvs = [((x + 0.5) / 4, (y + 0.5) / 3) for y in range(3) for x in range(4)]
+    assert np.allclose(sample_bilinear(pixels, uvs), pixels.ravel())
+
+
+def test_sample_bilinear_interpolates_and_repeats():
+    pixels = np.array([[0.0, 1.0], [2.0, 3.0]])
+    # halfway between the four pixel centres
+    assert sample_bilinear(pixels, [(0.5, 0.5)])[0] == pytest.approx(1.5)
+    # halfway between the last column and the first, as the image repeats
+    assert sample_bilinear(pixels, [(1.0, 0.25)])[0] == pytest.approx(0.5)
+    # UVs outside 0 - 1 wrap around
+    assert np.allclose(
+        sample_bilinear(pixels, [(0.25, 0.25), (1.25, 2.25)]),
+        sample_bilinear(pixels, [(0.25, 0.25), (0.25, 0.25)]))
+
+
+def polygon_area(points):
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def test_box_project_keeps_texel_density_on_boxes():
+    coords, faces, _ = cores.straight_wall_core((2, 0.3, 1.5), (4, 1, 3), MARGIN)
+    faces = np.asarray(faces)
+    loop_verts = faces.ravel()
+    loop_totals = np.full(len(faces), 4)
+    loop_starts = np.arange(len(faces)) * 4
+
+    uvs = box_project(coords, loop_verts, loop_starts, loop_totals)
+
+    assert uvs.shape == (len(loop_verts), 2)
+    assert uvs.min() >= 0 and uvs.max() <= 1
+
+    ratios = []
+    for face, start in zip(faces, loop_starts):
+        face_coords = coords[face]
+        normal = np.abs(np.cross(face_coords[1] - face_coords[0], face_coords[2] - face_coords[0]))
+        area_3d = polygon_area(np.delete(face_coords, normal.argmax(), axis=1))
+        ratios.append(polygon_area(uvs[start:start + 4]) / area_3d)
+    assert np.allclose(ratios, ratios[0])
+
+
+@pytest.mark.parametrize('curve_type', ['POS', 'NEG'])
+def test_box_project_unrolls_arcs(curve_type):
+    coords, faces, groups = cores.semi_circ_core(
+        {'radius': 2, 'angle': 90, 'height': 0.3}, {'sides': 2, 'arc': 16}, MARGIN, curve_type)
+    loop_verts = np.concatenate(faces)
+    loop_totals = np.array([len(face) for face in faces])
+    loop_starts = np.concatenate(([0], np.cumsum(loop_totals)[:-1]))
+    in_arc = np.zeros(len(coords), dtype=bool)
+    in_arc[groups['Side a']] = True
+    arc_faces = np.array([in_arc[list(face)].all() for face in faces])
+    assert arc_faces.sum() == 16
+
+    uvs = box_project(coords, loop_verts, loop_starts, loop_totals, arcs=[arc_faces])
+
+    # arc faces are as dense as the flat top rather than foreshortened, and not mirrored
+    top_face = next(i for i, face in enumerate(faces) if set(face) <= set(groups['Top']))
+
+    def density(i):
+        face_coords = coords[list(faces[i])]
+        normal = np.cross(face_coords[1] - face_coords[0], face_coords[2] - face_coords[0])
+        if len(faces[i]) == 4:
+            normal += np.cross(face_coords[2] - face_coords[0], face_coords[3] - face_coords[0])
+        face_uvs = uvs[loop_starts[i]:loop_starts[i] + loop_totals[i]]
+        x, y = face_uvs[:, 0], face_uvs[:, 1]
+        return 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / (0.5 * np.linalg.norm(normal))
+
+    densities = [density(i) for i in np.flatnonzero(arc_faces)]
+    assert np.allclose(densities, density(top_face), rtol=1e-2)
@@ -0,0 +1,80 @@
+# Tests for the cutter templates kept by load_objects.
+#
+# These need Blender's Python module. Run them with the bpy module installed or
+# from Blender's bundled Python:
+#
+#   python -m pytest tests
+import os
+import sys
+import importlib
+import pytest
+
+bpy = pytest.importorskip('bpy')
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+
+@pytest.fixture
+def create_tile():
+    parent_dir = os.path.dirname(ADDON_DIR)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    module = importlib.import_module(ADDON_NAME + '.tile_creation.create_tile')
+    yield module
+    module.clear_cutter_templates()
+
+
+@pytest.fixture
+def blend_path(tmp_path):
+    """Write a blend file holding a cutter whose array caps are other objects."""
+    objects = []
+    for name in ('cutter', 'start_cap', 'end_cap'):
+        mesh = bpy.data.meshes.new(name)
+        mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+        objects.append(bpy.data.objects.new(name, mesh))
+    cutter, start_cap, end_cap = objects
+    array = cutter.modifiers.new('Array', 'ARRAY')
+    array.start_cap = start_cap
+    array.end_cap = end_cap
+
+    path = str(tmp_path / 'cutters.blend')
+    bpy.data.libraries.write(path, set(objects))
+
+    for obj in objects:
+        mesh = obj.data
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+    return path
+
+
+def test_caps_point_at_copies(create_tile, blend_path):
+    cutter, start_cap, end_cap = create_tile.load_objects(
+        blend_path, ['cutter', 'start_cap', 'end_cap'])
+    array = cutter.modifiers['Array']
+    assert array.start_cap == start_cap
+    assert array.end_cap == end_cap
+
+
+def test_each_load_gets_its_own_caps(create_tile, blend_path):
+    names = ['cutter', 'start_cap', 'end_cap']
+    first = create_tile.load_objects(blend_path, names)
+    second = create_tile.load_objects(blend_path, names)
+    assert first[0].modifiers['Array'].start_cap != second[0].modifiers['Array'].start_cap
+
+
+def test_clear_keeps_templates_in_use(create_tile, blend_path):
+    names = ['cutter', 'start_cap', 'end_cap']
+    cutter = create_tile.load_objects(blend_path, names)[0]
+    bpy.context.scene.collection.objects.link(cutter)
+    templates = create_tile.get_templates(blend_path, names)
+    # as left by tiles made when copies still pointed at the templates
+    cutter.modifiers['Array'].start_cap = templates['start_cap']
+    unused_template = templates['end_cap'].name
+
+    create_tile.clear_cutter_templates()
+
+    assert cutter.modifiers['Array'].start_cap.name in bpy.data.objects
+    assert 'mt_template_name' not in cutter.modifiers['Array'].start_cap
+    assert unused_template not in bpy.data.objects
+    bpy.data.objects.remove(cutter)
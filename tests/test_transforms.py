@@ -0,0 +1,68 @@
+# Tests for the transform helpers that replace bpy.ops.transform operators.
+#
+# These need Blender's Python module. Run them with the bpy module installed or
+# from Blender's bundled Python:
+#
+#   python -m pytest tests
+import os
+import sys
+import importlib
+from math import radians, degrees, acos
+import numpy as np
+import pytest
+from geometry import cores
+
+bpy = pytest.importorskip('bpy')
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = os.path.basename(ADDON_DIR)
+
+TRI = {'b': 2, 'c': 1.5, 'A': 60, 'height': 0.3}
+
+
+@pytest.fixture
+def transforms():
+    parent_dir = os.path.dirname(ADDON_DIR)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    return importlib.import_module(ADDON_NAME + '.lib.utils.transforms')
+
+
+@pytest.fixture
+def empty():
+    obj = bpy.data.objects.new('rotate_test', None)
+    yield obj
+    bpy.data.objects.remove(obj)
+
+
+def x_axis(obj):
+    return np.array(obj.matrix_basis.col[0][:2])
+
+
+def is_along(points, direction):
+    offsets = points - points[0]
+    return np.allclose(offsets[:, 0] * direction[1] - offsets[:, 1] * direction[0], 0)
+
+
+def test_positive_angle_is_clockwise(transforms, empty):
+    empty.location = (2, 2, 0)
+    transforms.rotate([empty], radians(90), 'Z', (1, 2, 0))
+    assert np.allclose(empty.matrix_basis.translation[:], (1, 1, 0))
+    assert np.allclose(x_axis(empty), (0, -1))
+
+
+def test_tri_side_b_clip_cutter_follows_side_b(transforms, empty):
+    # clip cutters array along X and are turned onto each side by Triangular_Tiles
+    A = TRI['A']
+    coords, _, groups = cores.tri_floor_core(TRI, [3, 1], 0.001)
+    transforms.rotate([empty], radians(A - 90), 'Z')
+    assert is_along(coords[groups['Side b'], :2], x_axis(empty))
+
+
+def test_tri_side_a_clip_cutter_follows_side_a(transforms, empty):
+    b, c, A = TRI['b'], TRI['c'], radians(TRI['A'])
+    a = np.sqrt(b ** 2 + c ** 2 - 2 * b * c * np.cos(A))
+    B = degrees(acos((a ** 2 + c ** 2 - b ** 2) / (2 * a * c)))
+    coords, _, groups = cores.tri_floor_core(TRI, [3, 1], 0.001)
+    transforms.rotate([empty], radians(-90 - B), 'Z')
+    assert is_along(coords[groups['Side a'], :2], x_axis(empty))
@@ -3,15 +3,20 @@ from math import radians
 import bpy
 from bpy.types import Operator, Panel
 from .. utils.registration import get_prefs
-from .. lib.utils.utils import get_all_subclasses
+from .. lib.utils.profiling import timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin
 from .. lib.utils.selection import activate
 from .. lib.utils.collections import (
     add_object_to_collection,
     create_collection,
     activate_collection)
 from .create_tile import (
+    load_objects,
+    load_meshes,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     convert_to_displacement_core,
     spawn_prefab,
     set_bool_obj_props,
@@ -28,6 +33,7 @@ from .Rectangular_Tiles import (
 from ..lib.bmturtle.commands import (
     create_turtle,
     finalise_turtle,
+    release_turtle,
     add_vert,
     fd,
     ri,
@@ -103,6 +109,88 @@ class MT_PT_Connecting_Column_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_openlock_connecting_column_base(context):
+    """Spawn an OpenLOCK connecting column base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_connecting_column_base(context):
+    """Spawn a plain connecting column base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_connecting_column_base(context):
+    """Spawn an empty connecting column base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_connecting_column_core(context):
+    """Spawn a plain connecting column core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_connecting_column_core(tile_props)
+
+
+def make_openlock_connecting_column_core(context):
+    """Spawn an openlock connecting column core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    spawn_openlock_connecting_column_core(base, tile_props)
+
+
+def make_connecting_column(context):
+    """Generate a connecting column tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'CONNECTING_COLUMN_BASE'
+    core_type = 'CONNECTING_COLUMN_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_column_creator(
+        context,
+        scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
 class MT_OT_Make_Openlock_Connecting_Column_Base(MT_Tile_Generator, Operator):
     """Internal Operator. Generate an OpenLOCK connecting column base."""
 
@@ -111,13 +199,7 @@ class MT_OT_Make_Openlock_Connecting_Column_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "CONNECTING_COLUMN_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_connecting_column_base)
 
 
 class MT_OT_Make_Plain_Connecting_Column_Base(MT_Tile_Generator, Operator):
@@ -128,13 +210,7 @@ class MT_OT_Make_Plain_Connecting_Column_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "CONNECTING_COLUMN_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_connecting_column_base)
 
 
 class MT_OT_Make_Empty_Connecting_Column_Base(MT_Tile_Generator, Operator):
@@ -145,13 +221,7 @@ class MT_OT_Make_Empty_Connecting_Column_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "CONNECTING_COLUMN_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_connecting_column_base)
 
 
 class MT_OT_Make_Plain_Connecting_Column_Core(MT_Tile_Generator, Operator):
@@ -162,13 +232,7 @@ class MT_OT_Make_Plain_Connecting_Column_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "CONNECTING_COLUMN_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_connecting_column_core(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_connecting_column_core)
 
 
 class MT_OT_Make_Openlock_Connecting_Column_Core(MT_Tile_Generator, Operator):
@@ -179,14 +243,7 @@ class MT_OT_Make_Openlock_Connecting_Column_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "CONNECTING_COLUMN_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        spawn_openlock_connecting_column_core(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_connecting_column_core)
 
 
 class MT_OT_Make_Empty_Connecting_Column_Core(MT_Tile_Generator, Operator):
@@ -197,10 +254,7 @@ class MT_OT_Make_Empty_Connecting_Column_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "CONNECTING_COLUMN_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 class MT_OT_Make_Connecting_Column_Tile(MT_Tile_Generator, Operator):
@@ -211,31 +265,13 @@ class MT_OT_Make_Connecting_Column_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "CONNECTING_COLUMN"
+    mt_spawn = staticmethod(make_connecting_column)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'CONNECTING_COLUMN_BASE'
-        core_type = 'CONNECTING_COLUMN_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_column_creator(
-            context,
-            scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
-
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -279,6 +315,7 @@ def initialise_column_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -297,13 +334,7 @@ def spawn_plain_base(tile_props):
     base.name = tile_name + '.base'
     add_object_to_collection(base, tile_name)
 
-    ctx = {
-        'object': base,
-        'active_object': base,
-        'selected_objects': [base]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(base, bpy.context.scene.cursor.location)
 
     obj_props = base.mt_object_props
     obj_props.is_mt_object = True
@@ -314,6 +345,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('core_draw')
 def spawn_plain_connecting_column_core(tile_props):
     """Return the column core.
 
@@ -352,6 +384,7 @@ def spawn_plain_connecting_column_core(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_openlock_connecting_column_core(base, tile_props):
     """Return the column core.
 
@@ -429,6 +462,7 @@ def spawn_openlock_connecting_column_core(base, tile_props):
     return core
 
 
+@timed('cutters')
 def spawn_openlock_L_cutters(core, tile_props):
     """Return openlock cutter objects.
 
@@ -451,10 +485,9 @@ def spawn_openlock_L_cutters(core, tile_props):
         "openlock.blend")
 
     # load side cutter and add to collection
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
-    bottom_right_cutter = data_to.objects[0].copy()
+    bottom_right_cutter = loaded_objects[0].copy()
     bottom_right_cutter.name = 'Right Bottom.' + tile_name
 
     add_object_to_collection(bottom_right_cutter, tile_name)
@@ -523,6 +556,7 @@ def spawn_openlock_L_cutters(core, tile_props):
     return cutters
 
 
+@timed('cutters')
 def spawn_openlock_T_cutters(core, tile_props):
     """Return openlock cutter objects.
 
@@ -545,10 +579,9 @@ def spawn_openlock_T_cutters(core, tile_props):
         "openlock.blend")
 
     # load side cutter and add to collection
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
-    bottom_left_cutter = data_to.objects[0].copy()
+    bottom_left_cutter = loaded_objects[0].copy()
     bottom_left_cutter.name = 'Left Bottom.' + tile_name
 
     add_object_to_collection(bottom_left_cutter, tile_name)
@@ -641,6 +674,7 @@ def spawn_openlock_T_cutters(core, tile_props):
     return cutters
 
 
+@timed('cutters')
 def spawn_openlock_X_cutters(core, tile_props):
     """Return openlock cutter objects.
 
@@ -663,10 +697,9 @@ def spawn_openlock_X_cutters(core, tile_props):
         "openlock.blend")
 
     # load side cutter and add to collection
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
-    bottom_left_cutter = data_to.objects[0].copy()
+    bottom_left_cutter = loaded_objects[0].copy()
     bottom_left_cutter.name = 'Left Bottom.' + tile_name
 
     add_object_to_collection(bottom_left_cutter, tile_name)
@@ -789,6 +822,7 @@ def spawn_openlock_X_cutters(core, tile_props):
     return cutters
 
 
+@timed('cutters')
 def spawn_socket_buffers(cutters):
     """Spawn buffer objects (basically flat plates so tiles sit flush) \
     to use for boolean union on columns with wrap around textures.
@@ -808,21 +842,18 @@ def spawn_socket_buffers(cutters):
         "booleans",
         "openlock.blend")
 
-    # load buffer mesh
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.meshes = ['socket_buffer']
-
     buffers = []
 
     for cutter in cutters:
         buffer = cutter.copy()
-        buffer.data = data_to.meshes[0].copy()
+        buffer.data = load_meshes(booleans_path, ['socket_buffer'])[0]
         buffer.name = 'Buffer ' + cutter.name
         buffers.append(buffer)
 
     return buffers
 
 
+@timed('cutters')
 def spawn_openlock_I_cutters(core, tile_props):
     """Return openlock cutter objects.
 
@@ -845,10 +876,9 @@ def spawn_openlock_I_cutters(core, tile_props):
         "openlock.blend")
 
     # load side cutter and add to collection
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
-    bottom_left_cutter = data_to.objects[0].copy()
+    bottom_left_cutter = loaded_objects[0].copy()
     bottom_left_cutter.name = 'Left Bottom.' + tile_name
 
     add_object_to_collection(bottom_left_cutter, tile_name)
@@ -905,6 +935,7 @@ def spawn_openlock_I_cutters(core, tile_props):
     return cutters
 
 
+@timed('cutters')
 def spawn_openlock_O_cutters(core, tile_props):
     """Return openlock cutter objects.
 
@@ -927,10 +958,9 @@ def spawn_openlock_O_cutters(core, tile_props):
         "openlock.blend")
 
     # load side cutter and add to collection
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
-    bottom_cutter = data_to.objects[0].copy()
+    bottom_cutter = loaded_objects[0].copy()
     bottom_cutter.name = 'Bottom.' + tile_name
 
     add_object_to_collection(bottom_cutter, tile_name)
@@ -969,6 +999,7 @@ def spawn_openlock_O_cutters(core, tile_props):
     return cutters
 
 
+@timed('core_draw')
 def spawn_generic_core(tile_props):
     """Spawn column core.
 
@@ -1018,6 +1049,7 @@ def spawn_generic_core(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_I_core(tile_props):
     """Spawn column core.
 
@@ -1067,6 +1099,7 @@ def spawn_I_core(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_L_core(tile_props):
     """Spawn column core.
 
@@ -1116,6 +1149,7 @@ def spawn_L_core(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_O_core(tile_props):
     """Spawn column core.
 
@@ -1165,6 +1199,7 @@ def spawn_O_core(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_T_core(tile_props):
     """Spawn column core.
 
@@ -1214,6 +1249,7 @@ def spawn_T_core(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_X_core(tile_props):
     """Spawn column core.
 
@@ -1245,7 +1281,7 @@ def draw_column_core(dims, subdivs, margin=0.001):
     """
     vert_groups = ['Left', 'Right', 'Front', 'Back', 'Top', 'Bottom']
 
-    bm, obj = create_turtle('Straight Wall', vert_groups)
+    bm, obj, turtle = create_turtle('Straight Wall', vert_groups)
 
     # create vertex group layer
     bm.verts.layers.deform.verify()
@@ -1256,35 +1292,35 @@ def draw_column_core(dims, subdivs, margin=0.001):
     top_verts = []
 
     # Start drawing column
-    pd(bm)
-    add_vert(bm)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
     bm.select_mode = {'VERT'}
 
     # Draw front bottom edges
-    ri(bm, margin)
+    ri(bm, turtle, margin)
 
     subdiv_x_dist = (dims[0] - (margin * 2)) / subdivs[0]
 
     i = 0
     while i < subdivs[0]:
-        ri(bm, subdiv_x_dist)
+        ri(bm, turtle, subdiv_x_dist)
         i += 1
 
-    ri(bm, margin)
+    ri(bm, turtle, margin)
 
     # Select edge and extrude to create bottom
     bm.select_mode = {'EDGE'}
     bm_select_all(bm)
-    fd(bm, margin)
+    fd(bm, turtle, margin)
 
     subdiv_y_dist = (dims[1] - (margin * 2)) / subdivs[1]
 
     i = 0
     while i < subdivs[1]:
-        fd(bm, subdiv_y_dist)
+        fd(bm, turtle, subdiv_y_dist)
         i += 1
 
-    fd(bm, margin)
+    fd(bm, turtle, margin)
 
     # Save verts to add to bottom vert group
     for v in bm.verts:
@@ -1293,16 +1329,16 @@ def draw_column_core(dims, subdivs, margin=0.001):
     # select bottom and extrude up
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, margin, False)
+    up(bm, turtle, margin, False)
 
     subdiv_z_dist = (dims[2] - (margin * 2)) / subdivs[2]
 
     i = 0
     while i < subdivs[2]:
-        up(bm, subdiv_z_dist)
+        up(bm, turtle, subdiv_z_dist)
         i += 1
 
-    up(bm, margin)
+    up(bm, turtle, margin)
 
     # Save top verts to add to top vertex group
     top_verts = [v for v in bm.verts if v.select]
@@ -1311,9 +1347,10 @@ def draw_column_core(dims, subdivs, margin=0.001):
     assign_verts_to_group(bottom_verts, obj, deform_groups, 'Bottom')
 
     # home turtle
-    pu(bm)
+    pu(bm, turtle)
 
-    home(obj)
+    home(turtle, obj)
+    release_turtle(turtle, obj)
 
     return obj, bm, top_verts, bottom_verts, deform_groups
 
@@ -9,20 +9,23 @@ from .. lib.utils.collections import (
     activate_collection)
 from .. utils.registration import get_prefs
 from ..lib.bmturtle.scripts import (
-    draw_straight_wall_core,
-    draw_rectangular_floor_core,
+    generate_straight_wall_core,
+    generate_rectangular_floor_core,
     draw_curved_cuboid)
 from .. lib.utils.selection import (
     deselect_all,
-    select,
     activate)
-from .. lib.utils.utils import (
-    add_circle_array,
-    get_all_subclasses)
+from .. lib.utils.utils import add_circle_array
+from .. lib.utils.profiling import stage, timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin, rotate, apply_rotation
+from .. lib.bmturtle.adapter import project_uvs, bend_object
 from .create_tile import (
+    load_objects,
     convert_to_displacement_core,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     spawn_prefab,
     set_bool_obj_props,
     set_bool_props,
@@ -89,6 +92,136 @@ class MT_PT_Curved_Wall_Tile_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_curved_wall(context):
+    """Generate a curved wall tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'CURVED_BASE'
+    core_type = 'CURVED_WALL_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(
+        context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_curved_floor(context):
+    """Generate a curved floor tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'CURVED_BASE'
+    core_type = 'CURVED_FLOOR_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
+        context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_openlock_curved_base(context):
+    """Spawn an OpenLOCK curved base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_curved_base(context):
+    """Spawn a plain curved base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_curved_base(context):
+    """Spawn an empty curved base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_curved_wall_core(context):
+    """Spawn a plain curved wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_wall_cores(tile_props)
+
+
+def make_openlock_curved_wall_core(context):
+    """Spawn an openlock curved wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    spawn_openlock_wall_cores(base, tile_props)
+
+
+def make_plain_curved_floor_core(context):
+    """Spawn a plain curved wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    spawn_plain_floor_cores(base, tile_props)
+
+
+def make_openlock_curved_floor_core(context):
+    """Spawn an openlock curved wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    spawn_plain_floor_cores(base, tile_props)
+
+
 class MT_OT_Make_Curved_Wall_Tile(MT_Tile_Generator, Operator):
     """Create a Curved Wall Tile."""
 
@@ -97,29 +230,13 @@ class MT_OT_Make_Curved_Wall_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "CURVED_WALL"
+    mt_spawn = staticmethod(make_curved_wall)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'CURVED_BASE'
-        core_type = 'CURVED_WALL_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(
-            context, scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -131,29 +248,13 @@ class MT_OT_Make_Curved_Floor_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "CURVED_FLOOR"
+    mt_spawn = staticmethod(make_curved_floor)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'CURVED_BASE'
-        core_type = 'CURVED_FLOOR_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
-            context, scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -165,13 +266,7 @@ class MT_OT_Make_Openlock_Curved_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "CURVED_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_curved_base)
 
 
 class MT_OT_Make_Plain_Curved_Base(MT_Tile_Generator, Operator):
@@ -182,13 +277,7 @@ class MT_OT_Make_Plain_Curved_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "CURVED_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_curved_base)
 
 
 class MT_OT_Make_Empty_Curved_Base(MT_Tile_Generator, Operator):
@@ -199,13 +288,7 @@ class MT_OT_Make_Empty_Curved_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "CURVED_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_curved_base)
 
 
 class MT_OT_Make_Plain_Curved_Wall_Core(MT_Tile_Generator, Operator):
@@ -216,13 +299,7 @@ class MT_OT_Make_Plain_Curved_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "CURVED_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_wall_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_curved_wall_core)
 
 
 class MT_OT_Make_Openlock_Curved_Wall_Core(MT_Tile_Generator, Operator):
@@ -233,14 +310,7 @@ class MT_OT_Make_Openlock_Curved_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "CURVED_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        spawn_openlock_wall_cores(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_curved_wall_core)
 
 
 class MT_OT_Make_Empty_Curved_Wall_Core(MT_Tile_Generator, Operator):
@@ -251,10 +321,7 @@ class MT_OT_Make_Empty_Curved_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "CURVED_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 class MT_OT_Make_Plain_Curved_Floor_Core(MT_Tile_Generator, Operator):
@@ -265,14 +332,7 @@ class MT_OT_Make_Plain_Curved_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "CURVED_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        spawn_plain_floor_cores(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_curved_floor_core)
 
 
 class MT_OT_Make_Openlock_Curved_Floor_Core(MT_Tile_Generator, Operator):
@@ -283,14 +343,7 @@ class MT_OT_Make_Openlock_Curved_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "CURVED_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        spawn_plain_floor_cores(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_curved_floor_core)
 
 
 class MT_OT_Make_Empty_Curved_Floor_Core(MT_Tile_Generator, Operator):
@@ -301,10 +354,7 @@ class MT_OT_Make_Empty_Curved_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "CURVED_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 def initialise_wall_creator(context, scene_props):
@@ -389,6 +439,7 @@ def initialise_floor_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('core_draw')
 def spawn_plain_wall_cores(tile_props):
     """Spawn plain wall cores into scene.
 
@@ -410,6 +461,7 @@ def spawn_plain_wall_cores(tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_openlock_wall_cores(base, tile_props):
     """Spawn OpenLOCK wall cores into scene.
 
@@ -451,6 +503,7 @@ def spawn_openlock_wall_cores(base, tile_props):
     return core
 
 
+@timed('cutters')
 def spawn_openlock_top_pegs(base, tile_props):
     """Spawn top peg(s) for stacking wall tiles and position it.
 
@@ -487,23 +540,12 @@ def spawn_openlock_top_pegs(base, tile_props):
                 base_location[1] + base_radius + (base_size[1] / 2) - 0.075,
                 base_location[2] + tile_size[2])
 
-    ctx = {
-        'object': peg,
-        'active_object': peg,
-        'selected_objects': [peg],
-        'selected_editable_objects':[peg]
-    }
-
-    bpy.ops.transform.rotate(
-        ctx,
-        value=radians(tile_props.degrees_of_arc / 2),
-        orient_axis='Z',
-        orient_type='GLOBAL',
-        center_override=base_location)
+    rotate([peg], radians(tile_props.degrees_of_arc / 2), 'Z', base_location)
 
     return peg
 
 
+@timed('cutters')
 def spawn_openlock_wall_cutters(core, base_location, tile_props):
     """Spawn OpenLOCK wall cutters into scene and position them.
 
@@ -527,15 +569,14 @@ def spawn_openlock_wall_cutters(core, base_location, tile_props):
         "openlock.blend")
 
     # load side cutter
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
     core_location = core.location.copy()
 
     cutters = []
 
     # left side cutters
-    left_cutter_bottom = data_to.objects[0].copy()
+    left_cutter_bottom = loaded_objects[0].copy()
     left_cutter_bottom.name = 'X Neg Bottom.' + tile_name
 
     add_object_to_collection(left_cutter_bottom, tile_props.tile_name)
@@ -575,14 +616,7 @@ def spawn_openlock_wall_cutters(core, base_location, tile_props):
 
     right_cutter_bottom.name = 'X Pos Bottom.' + tile_name
     circle_center = base_location
-    select(right_cutter_bottom.name)
-    activate(right_cutter_bottom.name)
-
-    bpy.ops.transform.rotate(
-        value=radians(tile_props.degrees_of_arc),
-        orient_axis='Z',
-        orient_type='GLOBAL',
-        center_override=circle_center)
+    rotate([right_cutter_bottom], radians(tile_props.degrees_of_arc), 'Z', circle_center)
 
     right_cutter_top = right_cutter_bottom.copy()
     add_object_to_collection(right_cutter_top, tile_props.tile_name)
@@ -598,6 +632,7 @@ def spawn_openlock_wall_cutters(core, base_location, tile_props):
     return cutters
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -630,6 +665,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('cutters')
 def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
     """Spawns an openlock base slot cutter into the scene and positions it correctly
 
@@ -672,19 +708,12 @@ def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
     slot_cutter.location[2] = slot_cutter.location[2] - bool_overlap
     slot_cutter.rotation_euler[2] = slot_cutter.rotation_euler[2] - radians((base_degrees - central_angle) / 2)
 
-    ctx = {
-        'object': slot_cutter,
-        'active_object': slot_cutter,
-        'selected_editable_objects': [slot_cutter],
-        'selected_objects': [slot_cutter]
-    }
-
-    base.select_set(False)
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(slot_cutter, bpy.context.scene.cursor.location)
 
     return slot_cutter
 
 
+@timed('base_draw')
 def spawn_openlock_base(tile_props):
     """Spawn OpenLOCK base into scene.
 
@@ -725,6 +754,7 @@ def spawn_openlock_base(tile_props):
     return base
 
 
+@timed('cutters')
 def spawn_openlock_base_clip_cutter(base, tile_props):
     """Spawn base clip cutter into scene.
 
@@ -747,14 +777,11 @@ def spawn_openlock_base_clip_cutter(base, tile_props):
         "booleans",
         "openlock.blend")
 
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.base.cutter.clip_single']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.base.cutter.clip_single'])
 
-    clip_cutter = data_to.objects[0]
+    clip_cutter = loaded_objects[0]
     add_object_to_collection(clip_cutter, tile_props.tile_name)
 
-    deselect_all()
-    select(clip_cutter.name)
     radius = tile_props.base_radius + (tile_props.base_size[1] / 2)
 
     clip_cutter.location[1] = radius
@@ -771,16 +798,8 @@ def spawn_openlock_base_clip_cutter(base, tile_props):
     else:
         initial_rot = 22.5
 
-    bpy.ops.transform.rotate(
-        value=radians(initial_rot),
-        orient_axis='Z',
-        center_override=circle_center)
-
-    bpy.ops.object.transform_apply(
-        location=False,
-        scale=False,
-        rotation=True,
-        properties=False)
+    rotate([clip_cutter], radians(initial_rot), 'Z', circle_center)
+    apply_rotation(clip_cutter)
 
     array_name, empty = add_circle_array(
         clip_cutter,
@@ -800,6 +819,7 @@ def spawn_openlock_base_clip_cutter(base, tile_props):
     return clip_cutter
 
 
+@timed('core_draw')
 def spawn_plain_floor_cores(base, tile_props):
     """Spawn preview and displacement cores into scene.
 
@@ -821,6 +841,7 @@ def spawn_plain_floor_cores(base, tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_floor_core(tile_props):
     """Spawn core into scene.
 
@@ -843,12 +864,10 @@ def spawn_floor_core(tile_props):
         tile_props.z_native_subdivisions
     )
 
-    # Rather than creating our cores as curved objects we create them as straight cuboids
-    # and then add a deform modifier. This allows us to not use the modifier when baking the
-    # displacement texture by disabling it in render and thus being able to use
-    # standard projections
+    # We draw our cores as straight cuboids, UV project them and then bend them.
+    # Projecting before bending unrolls the curved faces so their UVs aren't distorted
 
-    core = draw_rectangular_floor_core(
+    core = generate_rectangular_floor_core(
         (floor_length,
          width,
          height),
@@ -857,15 +876,9 @@ def spawn_floor_core(tile_props):
     core.name = tile_name + '.core'
     add_object_to_collection(core, tile_props.tile_name)
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_editable_objects': [core],
-        'selected_objects': [core]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    set_origin(core, bpy.context.scene.cursor.location)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
 
     tile_props.tile_size[0] = floor_length
 
@@ -874,11 +887,7 @@ def spawn_floor_core(tile_props):
         core.location[1] + radius,
         core.location[2] + tile_props.base_size[2])
 
-    mod = core.modifiers.new('Simple_Deform', type='SIMPLE_DEFORM')
-    mod.deform_method = 'BEND'
-    mod.deform_axis = 'Z'
-    mod.angle = radians(-angle)
-    mod.show_render = False
+    bend_object(core, radians(-angle))
     core.name = tile_props.tile_name + '.core'
 
     obj_props = core.mt_object_props
@@ -888,6 +897,7 @@ def spawn_floor_core(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_wall_core(tile_props):
     """Spawn core into scene.
 
@@ -910,12 +920,10 @@ def spawn_wall_core(tile_props):
         tile_props.z_native_subdivisions
     )
 
-    # Rather than creating our cores as curved objects we create them as straight cuboids
-    # and then add a deform modifier. This allows us to not use the modifier when baking the
-    # displacement texture by disabling it in render and thus being able to use
-    # standard projections
+    # We draw our cores as straight cuboids, UV project them and then bend them.
+    # Projecting before bending unrolls the curved faces so their UVs aren't distorted
 
-    core = draw_straight_wall_core(
+    core = generate_straight_wall_core(
         (wall_length,
          width,
          height),
@@ -924,15 +932,9 @@ def spawn_wall_core(tile_props):
     core.name = tile_name + '.core'
     add_object_to_collection(core, tile_props.tile_name)
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_editable_objects': [core],
-        'selected_objects': [core]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    set_origin(core, bpy.context.scene.cursor.location)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
 
     tile_props.tile_size[0] = wall_length
 
@@ -941,11 +943,7 @@ def spawn_wall_core(tile_props):
         core.location[1] + radius,
         core.location[2] + tile_props.base_size[2])
 
-    mod = core.modifiers.new('Simple_Deform', type='SIMPLE_DEFORM')
-    mod.deform_method = 'BEND'
-    mod.deform_axis = 'Z'
-    mod.angle = radians(-angle)
-    mod.show_render = False
+    bend_object(core, radians(-angle))
     core.name = tile_props.tile_name + '.core'
 
     obj_props = core.mt_object_props
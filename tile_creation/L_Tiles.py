@@ -7,11 +7,13 @@ from .. lib.utils.collections import (
     add_object_to_collection,
     create_collection,
     activate_collection)
-from .. lib.utils.utils import mode, get_all_subclasses
+from .. lib.utils.utils import mode
+from .. lib.utils.profiling import stage, timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin, rotate, mirror, apply_rotation
+from .. lib.bmturtle.adapter import project_uvs
 from .. utils.registration import get_prefs
-from .. lib.utils.selection import (
-    deselect_all,
-    select)
+from .. lib.utils.selection import deselect_all
 
 from ..lib.bmturtle.scripts import (
     draw_corner_3D as draw_corner_3D_bm,
@@ -22,9 +24,11 @@ from ..lib.bmturtle.scripts import (
 from ..lib.bmturtle.helpers import calculate_corner_wall_triangles
 
 from . create_tile import (
+    load_objects,
     convert_to_displacement_core,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     spawn_prefab,
     set_bool_props,
     set_bool_obj_props,
@@ -91,6 +95,134 @@ class MT_PT_L_Tile_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_l_wall_tile(context):
+    """Generate an L wall tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'L_BASE'
+    core_type = 'L_WALL_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(
+        context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_l_floor_tile(context):
+    """Generate an L floor tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'L_BASE'
+    core_type = 'L_FLOOR_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
+        context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_openlock_l_base(context):
+    """Spawn an OpenLOCK L base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_l_base(context):
+    """Spawn a plain L base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_l_base(context):
+    """Spawn an empty L base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_l_wall_core(context):
+    """Spawn a plain L wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_wall_cores(tile_props)
+
+
+def make_openlock_l_wall_core(context):
+    """Spawn an openlock L wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    spawn_openlock_wall_cores(base, tile_props)
+
+
+def make_plain_l_floor_core(context):
+    """Spawn a plain L wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_floor_cores(tile_props)
+
+
+def make_openlock_l_floor_core(context):
+    """Spawn an openlock L floor core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_floor_cores(tile_props)
+
+
 class MT_OT_Make_L_Wall_Tile(MT_Tile_Generator, Operator):
     """Create an L Wall Tile."""
 
@@ -99,29 +231,13 @@ class MT_OT_Make_L_Wall_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "L_WALL"
+    mt_spawn = staticmethod(make_l_wall_tile)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'L_BASE'
-        core_type = 'L_WALL_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(
-            context, scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -133,29 +249,13 @@ class MT_OT_Make_L_Floor_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "L_FLOOR"
+    mt_spawn = staticmethod(make_l_floor_tile)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'L_BASE'
-        core_type = 'L_FLOOR_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
-            context, scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -167,13 +267,7 @@ class MT_OT_Make_Openlock_L_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "L_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_l_base)
 
 
 class MT_OT_Make_Plain_L_Base(MT_Tile_Generator, Operator):
@@ -184,13 +278,7 @@ class MT_OT_Make_Plain_L_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "L_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_l_base)
 
 
 class MT_OT_Make_Empty_L_Base(MT_Tile_Generator, Operator):
@@ -201,13 +289,7 @@ class MT_OT_Make_Empty_L_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "L_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_l_base)
 
 
 class MT_OT_Make_Plain_L_Wall_Core(MT_Tile_Generator, Operator):
@@ -218,13 +300,7 @@ class MT_OT_Make_Plain_L_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "L_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_wall_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_l_wall_core)
 
 
 class MT_OT_Make_Openlock_L_Wall_Core(MT_Tile_Generator, Operator):
@@ -235,14 +311,7 @@ class MT_OT_Make_Openlock_L_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "L_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        spawn_openlock_wall_cores(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_l_wall_core)
 
 
 class MT_OT_Make_Empty_L_Wall_Core(MT_Tile_Generator, Operator):
@@ -253,10 +322,7 @@ class MT_OT_Make_Empty_L_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "L_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 class MT_OT_Make_Plain_L_Floor_Core(MT_Tile_Generator, Operator):
@@ -267,13 +333,7 @@ class MT_OT_Make_Plain_L_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "L_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_floor_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_l_floor_core)
 
 
 class MT_OT_Make_Openlock_L_Floor_Core(MT_Tile_Generator, Operator):
@@ -284,13 +344,7 @@ class MT_OT_Make_Openlock_L_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "L_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_floor_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_l_floor_core)
 
 
 class MT_OT_Make_Empty_L_Floor_Core(MT_Tile_Generator, Operator):
@@ -301,10 +355,7 @@ class MT_OT_Make_Empty_L_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "L_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 def initialise_wall_creator(context, scene_props):
@@ -391,6 +442,7 @@ def initialise_floor_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('core_draw')
 def spawn_plain_wall_cores(tile_props):
     """Spawn plain wall cores into scene.
 
@@ -410,6 +462,7 @@ def spawn_plain_wall_cores(tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_plain_floor_cores(tile_props):
     """Spawn plain floor cores into scene.
 
@@ -430,6 +483,7 @@ def spawn_plain_floor_cores(tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_floor_core(tile_props):
     """Spawn core into scene.
 
@@ -488,18 +542,14 @@ def spawn_floor_core(tile_props):
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_objects': [core],
-        'selected_editable_objects': [core]}
-
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
     bpy.context.scene.cursor.location = (0, 0, 0)
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(core, bpy.context.scene.cursor.location)
     return core
 
 
+@timed('core_draw')
 def spawn_openlock_wall_cores(base, tile_props):
     """Spawn openlock wall cores into scene.
 
@@ -538,6 +588,7 @@ def spawn_openlock_wall_cores(base, tile_props):
     return core
 
 
+@timed('cutters')
 def spawn_openlock_top_pegs(core, tile_props):
     """Spawn top peg(s) for stacking wall tiles and position it.
 
@@ -582,36 +633,14 @@ def spawn_openlock_top_pegs(core, tile_props):
             array_mod.fit_type = 'FIT_LENGTH'
             array_mod.fit_length = leg_1_len - 1.3
 
-        ctx = {
-            'object': peg,
-            'active_object': peg,
-            'selected_objects': [peg]
-        }
-        bpy.ops.transform.rotate(
-            ctx,
-            value=radians(tile_props.angle - 90),
-            orient_axis='Z',
-            center_override=cursor.location)
+        rotate([peg], radians(tile_props.angle - 90), 'Z', cursor.location)
         pegs.append(peg)
 
     # leg 2
     if leg_2_len >= 1:
         peg_2 = load_openlock_top_peg(tile_props)
         peg_2.rotation_euler[2] = radians(-90)
-        ctx = {
-            'object': peg_2,
-            'active_object': peg_2,
-            'selected_objects': [peg_2],
-            'selectable_objects': [peg_2],
-            'selected_editable_objects': [peg_2]
-        }
-
-        bpy.ops.object.transform_apply(
-            ctx,
-            location=False,
-            rotation=True,
-            scale=False,
-            properties=True)
+        apply_rotation(peg_2)
 
         peg_2.location = (
             core_location[0] + (base_size[1] / 2) + 0.08,
@@ -638,6 +667,7 @@ def spawn_openlock_top_pegs(core, tile_props):
     return pegs
 
 
+@timed('cutters')
 def spawn_openlock_wall_cutters(core, tile_props):
     """Create the cutters for the wall and position them correctly.
 
@@ -661,14 +691,13 @@ def spawn_openlock_wall_cutters(core, tile_props):
         "openlock.blend")
 
     # load side cutter
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
     core_location = core.location.copy()
 
     cutters = []
     # left side cutters
-    left_cutter_bottom = data_to.objects[0].copy()
+    left_cutter_bottom = loaded_objects[0].copy()
     left_cutter_bottom.name = 'Leg 2 Bottom.' + tile_name
 
     add_object_to_collection(left_cutter_bottom, tile_name)
@@ -704,7 +733,7 @@ def spawn_openlock_wall_cutters(core, tile_props):
 
     # right side cutters
 
-    right_cutter_bottom = data_to.objects[0].copy()
+    right_cutter_bottom = loaded_objects[0].copy()
     right_cutter_bottom.name = 'Leg 1 Bottom.' + tile_name
 
     add_object_to_collection(right_cutter_bottom, tile_name)
@@ -742,18 +771,8 @@ def spawn_openlock_wall_cutters(core, tile_props):
     left_cutters = [cutters[0], cutters[1]]
     right_cutters = [cutters[2], cutters[3]]
 
-    deselect_all()
     cursor = bpy.context.scene.cursor
-
-    for cutter in right_cutters:
-        select(cutter.name)
-    bpy.ops.transform.rotate(
-        value=radians(tile_props.angle - 90),
-        orient_type='GLOBAL',
-        orient_axis='Z',
-        center_override=cursor.location)
-
-    deselect_all()
+    rotate(right_cutters, radians(tile_props.angle - 90), 'Z', cursor.location)
 
     for cutter in left_cutters:
         cutter.location = (
@@ -765,6 +784,7 @@ def spawn_openlock_wall_cutters(core, tile_props):
     return cutters
 
 
+@timed('core_draw')
 def spawn_wall_core(tile_props):
     """Spawn core into scene.
 
@@ -823,20 +843,15 @@ def spawn_wall_core(tile_props):
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_objects': [core],
-        'selected_editable_objects': [core]
-    }
-
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
     bpy.context.scene.cursor.location = (0, 0, 0)
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(core, bpy.context.scene.cursor.location)
 
     return core
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -875,6 +890,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('base_draw')
 def spawn_openlock_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -907,19 +923,7 @@ def spawn_openlock_base(tile_props):
     clip_cutter_1 = create_openlock_base_clip_cutter(leg_len, corner_loc, 0.25, tile_props)
     clip_cutter_1.name = 'Clip Leg 1.' + base.name
 
-    ctx = {
-        'object': clip_cutter_1,
-        'active_object': clip_cutter_1,
-        'selected_editable_objects': [clip_cutter_1],
-        'selected_objects': [clip_cutter_1]
-    }
-
-    bpy.ops.transform.rotate(
-        ctx,
-        value=radians(tile_props.angle - 90),
-        orient_axis='Z',
-        orient_type='GLOBAL',
-        center_override=corner_loc)
+    rotate([clip_cutter_1], radians(tile_props.angle - 90), 'Z', corner_loc)
 
     # clip cutters - leg 2
     leg_len = base_triangles['c_adj']
@@ -931,24 +935,8 @@ def spawn_openlock_base(tile_props):
         tile_props)
     clip_cutter_2.name = 'Clip Leg 2.' + base.name
 
-    ctx = {
-        'object': clip_cutter_2,
-        'active_object': clip_cutter_2,
-        'selected_editable_objects': [clip_cutter_2],
-        'selected_objects': [clip_cutter_2]
-    }
-
-    bpy.ops.transform.rotate(
-        ctx,
-        value=radians(-90),
-        orient_axis='Z',
-        orient_type='GLOBAL',
-        center_override=corner_loc)
-
-    bpy.ops.transform.mirror(
-        ctx,
-        orient_type='LOCAL',
-        constraint_axis=(False, True, False))
+    rotate([clip_cutter_2], radians(-90), 'Z', corner_loc)
+    mirror([clip_cutter_2], 'Y')
 
     clip_cutter_2.location[0] = clip_cutter_2.location[0] + 0.5
 
@@ -963,6 +951,7 @@ def spawn_openlock_base(tile_props):
     return base
 
 
+@timed('cutters')
 def create_openlock_base_clip_cutter(
         leg_len,
         corner_loc,
@@ -992,18 +981,17 @@ def create_openlock_base_clip_cutter(
         "openlock.blend")
 
     # load base cutters
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = [
-            'openlock.wall.base.cutter.clip',
-            'openlock.wall.base.cutter.clip.cap.start',
-            'openlock.wall.base.cutter.clip.cap.end']
+    loaded_objects = load_objects(booleans_path, [
+        'openlock.wall.base.cutter.clip',
+        'openlock.wall.base.cutter.clip.cap.start',
+        'openlock.wall.base.cutter.clip.cap.end'])
 
-    for obj in data_to.objects:
+    for obj in loaded_objects:
         add_object_to_collection(obj, tile_props.tile_name)
 
-    clip_cutter = data_to.objects[0]
-    cutter_start_cap = data_to.objects[1]
-    cutter_end_cap = data_to.objects[2]
+    clip_cutter = loaded_objects[0]
+    cutter_start_cap = loaded_objects[1]
+    cutter_end_cap = loaded_objects[2]
 
     cutter_start_cap.hide_viewport = True
     cutter_end_cap.hide_viewport = True
@@ -1025,6 +1013,7 @@ def create_openlock_base_clip_cutter(
     return clip_cutter
 
 
+@timed('cutters')
 def create_openlock_base_slot_cutter(tile_props):
     """Creates the base slot cutter for OpenLOCK tiles
 
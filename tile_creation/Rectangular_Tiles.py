@@ -4,18 +4,24 @@ import bpy
 
 from bpy.types import Operator, Panel
 
-from ..lib.bmturtle.scripts import draw_cuboid, draw_rectangular_floor_core
+from ..lib.bmturtle.scripts import draw_cuboid, generate_rectangular_floor_core
 from .. lib.utils.collections import (
     add_object_to_collection,
     create_collection,
     activate_collection)
-from .. lib.utils.utils import mode, get_all_subclasses
+from .. lib.utils.utils import mode
+from .. lib.utils.profiling import stage, timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin
+from .. lib.bmturtle.adapter import project_uvs
 from .. utils.registration import get_prefs
 
 from .create_tile import (
+    load_objects,
     convert_to_displacement_core,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     spawn_prefab,
     set_bool_obj_props,
     set_bool_props,
@@ -79,6 +85,84 @@ class MT_PT_Rect_Floor_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_openlock_rect_base(context):
+    """Spawn an OpenLOCK rectangular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_rect_base(context):
+    """Spawn a plain rectangular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_rect_base(context):
+    """Spawn an empty rectangular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_rect_floor_core(context):
+    """Spawn a plain rectangular core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    create_plain_rect_floor_cores(tile_props)
+
+
+def make_openlock_rect_floor_core(context):
+    """Spawn an openlock rectangular floor core.
+
+    Args:
+        context (bpy.context): context
+    """
+    spawn_prefab(context, 'PLAIN', 'RECT_FLOOR_CORE')
+
+
+def make_rect_floor(context):
+    """Generate a rectangular floor tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'RECT_BASE'
+    core_type = 'RECT_FLOOR_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
+        context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        core = None
+    else:
+        core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, core, cursor_orig_loc, cursor_orig_rot)
+
+
 class MT_OT_Make_Openlock_Rect_Base(MT_Tile_Generator, Operator):
     """Internal Operator. Generate an OpenLOCK rectangular base."""
 
@@ -87,13 +171,7 @@ class MT_OT_Make_Openlock_Rect_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "RECT_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_rect_base)
 
 
 class MT_OT_Make_Plain_Rect_Base(MT_Tile_Generator, Operator):
@@ -104,13 +182,7 @@ class MT_OT_Make_Plain_Rect_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "RECT_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_rect_base)
 
 
 class MT_OT_Make_Empty_Rect_Base(MT_Tile_Generator, Operator):
@@ -121,13 +193,7 @@ class MT_OT_Make_Empty_Rect_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "RECT_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_rect_base)
 
 
 class MT_OT_Make_Plain_Rect_Floor_Core(MT_Tile_Generator, Operator):
@@ -138,13 +204,7 @@ class MT_OT_Make_Plain_Rect_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "RECT_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        create_plain_rect_floor_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_rect_floor_core)
 
 
 class MT_OT_Make_Openlock_Rect_Floor_Core(MT_Tile_Generator, Operator):
@@ -155,11 +215,7 @@ class MT_OT_Make_Openlock_Rect_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "RECT_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        bpy.ops.object.make_plain_rect_floor_core()
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_rect_floor_core)
 
 
 class MT_OT_Make_Empty_Rect_Floor_Core(MT_Tile_Generator, Operator):
@@ -170,10 +226,7 @@ class MT_OT_Make_Empty_Rect_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "RECT_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 class MT_OT_Make_Rect_Floor_Tile(MT_Tile_Generator, Operator):
@@ -184,30 +237,13 @@ class MT_OT_Make_Rect_Floor_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "RECT_FLOOR"
+    mt_spawn = staticmethod(make_rect_floor)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'RECT_BASE'
-        core_type = 'RECT_FLOOR_CORE'
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-
-        cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
-            context, scene_props)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            core = None
-        else:
-            core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
-
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -247,6 +283,7 @@ def initialise_floor_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('core_draw')
 def create_plain_rect_floor_cores(tile_props):
     """Create preview and displacement cores.
 
@@ -268,6 +305,7 @@ def create_plain_rect_floor_cores(tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_floor_core(tile_props):
     """Spawn the core (top part) of a floor tile.
 
@@ -286,7 +324,7 @@ def spawn_floor_core(tile_props):
         tile_props.z_native_subdivisions
     )
 
-    core = draw_rectangular_floor_core(
+    core = generate_rectangular_floor_core(
         [tile_size[0],
          tile_size[1],
          tile_size[2] - base_size[2]],
@@ -297,24 +335,21 @@ def spawn_floor_core(tile_props):
 
     core.location[2] = core.location[2] + base_size[2]
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_editable_objects': [core],
-        'selected_objects': [core]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    set_origin(core, bpy.context.scene.cursor.location)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
 
     obj_props = core.mt_object_props
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
+    # generated by box_grid so can be resized in place
+    obj_props.is_resizable = True
     bpy.context.view_layer.objects.active = core
 
     return core
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -332,12 +367,7 @@ def spawn_plain_base(tile_props):
     base.name = tile_name + '.base'
     add_object_to_collection(base, tile_name)
 
-    ctx = {
-        'object': base,
-        'active_object': base,
-        'selected_objects': [base]}
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(base, bpy.context.scene.cursor.location)
 
     obj_props = base.mt_object_props
     obj_props.is_mt_object = True
@@ -348,6 +378,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('base_draw')
 def spawn_openlock_base(tile_props):
     """Spawn an openlock base into the scene.
 
@@ -381,6 +412,7 @@ def spawn_openlock_base(tile_props):
     return base
 
 
+@timed('cutters')
 def spawn_openlock_base_slot_cutter(base, tile_props):
     """Spawn an openlock base slot cutter into scene and positions it correctly.
 
@@ -401,27 +433,26 @@ def spawn_openlock_base_slot_cutter(base, tile_props):
         "booleans",
         "rect_floor_slot_cutter.blend")
 
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = [
-            'corner_xneg_yneg',
-            'corner_xneg_ypos',
-            'corner_xpos_yneg',
-            'corner_xpos_ypos',
-            'slot_cutter_a',
-            'slot_cutter_b',
-            'slot_cutter_c',
-            'base_slot_cutter_final']
-
-    for obj in data_to.objects:
+    loaded_objects = load_objects(booleans_path, [
+        'corner_xneg_yneg',
+        'corner_xneg_ypos',
+        'corner_xpos_yneg',
+        'corner_xpos_ypos',
+        'slot_cutter_a',
+        'slot_cutter_b',
+        'slot_cutter_c',
+        'base_slot_cutter_final'])
+
+    for obj in loaded_objects:
         add_object_to_collection(obj, tile_props.tile_name)
 
-    for obj in data_to.objects:
+    for obj in loaded_objects:
         obj.hide_viewport = True
 
-    cutter_a = data_to.objects[4]
-    cutter_b = data_to.objects[5]
-    cutter_c = data_to.objects[6]
-    cutter_d = data_to.objects[7]
+    cutter_a = loaded_objects[4]
+    cutter_b = loaded_objects[5]
+    cutter_c = loaded_objects[6]
+    cutter_d = loaded_objects[7]
 
     cutter_d.name = 'Base Slot Cutter.' + tile_props.tile_name
 
@@ -445,6 +476,7 @@ def spawn_openlock_base_slot_cutter(base, tile_props):
     return cutter_d
 
 
+@timed('cutters')
 def spawn_openlock_base_clip_cutters(base, tile_props):
     """Make cutters for the openlock base clips.
 
@@ -466,19 +498,18 @@ def spawn_openlock_base_clip_cutters(base, tile_props):
         "booleans",
         "openlock.blend")
 
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = [
-            'openlock.wall.base.cutter.clip',
-            'openlock.wall.base.cutter.clip.cap.start',
-            'openlock.wall.base.cutter.clip.cap.end']
+    loaded_objects = load_objects(booleans_path, [
+        'openlock.wall.base.cutter.clip',
+        'openlock.wall.base.cutter.clip.cap.start',
+        'openlock.wall.base.cutter.clip.cap.end'])
 
-    for obj in data_to.objects:
+    for obj in loaded_objects:
         add_object_to_collection(obj, tile_props.tile_name)
 
-    clip_cutter = data_to.objects[0]
+    clip_cutter = loaded_objects[0]
     clip_cutter.name = 'Y Neg Clip.' + base.name
-    cutter_start_cap = data_to.objects[1]
-    cutter_end_cap = data_to.objects[2]
+    cutter_start_cap = loaded_objects[1]
+    cutter_end_cap = loaded_objects[2]
 
     cutter_start_cap.hide_viewport = True
     cutter_end_cap.hide_viewport = True
@@ -556,6 +587,4 @@ def spawn_openlock_base_clip_cutters(base, tile_props):
     array_mod4.fit_type = 'FIT_LENGTH'
     array_mod4.fit_length = base.dimensions[1] - 1
 
-    bpy.ops.object.make_single_user(type='ALL', object=True, obdata=True)
-
     return [clip_cutter, clip_cutter2, clip_cutter3, clip_cutter4]
@@ -7,9 +7,11 @@ import bmesh
 from bpy.types import Operator, Panel
 
 from . create_tile import (
+    load_objects,
     convert_to_displacement_core,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     spawn_prefab,
     set_bool_obj_props,
     set_bool_props,
@@ -18,15 +20,16 @@ from . create_tile import (
     create_common_tile_props)
 
 from .. utils.registration import get_prefs
-from .. lib.utils.selection import (
-    select,
-    deselect_all,
-    activate)
+from .. lib.bmturtle.cache import cached_core
+from .. lib.utils.selection import activate
 from .. lib.utils.utils import (
     mode,
-    get_all_subclasses,
     distance_between_two_points,
     calc_tri)
+from .. lib.utils.profiling import stage, timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin, rotate
+from .. lib.bmturtle.adapter import project_uvs
 from .. lib.utils.collections import (
     add_object_to_collection,
     create_collection,
@@ -100,6 +103,86 @@ class MT_PT_Semi_Circ_Floor_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_semi_circ_floor(context):
+    """Generate a semi circular floor tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'SEMI_CIRC_BASE'
+    core_type = 'SEMI_CIRC_FLOOR_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
+        context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_openlock_semi_circ_base(context):
+    """Spawn an OpenLOCK semi circular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_semi_circ_base(context):
+    """Spawn a plain semi circular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_semi_circ_base(context):
+    """Spawn an empty semi circular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_semi_circ_floor_core(context):
+    """Spawn a plain semi circular floor core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_floor_cores(tile_props)
+
+
+def make_openlock_semi_circ_floor_core(context):
+    """Spawn an openlock semi circular floor core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_floor_cores(tile_props)
+
+
 class MT_OT_Make_Semi_Circ_Floor_Tile(MT_Tile_Generator, Operator):
     """Create a Semi Circular Floor Tile."""
 
@@ -108,29 +191,13 @@ class MT_OT_Make_Semi_Circ_Floor_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "SEMI_CIRC_FLOOR"
+    mt_spawn = staticmethod(make_semi_circ_floor)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'SEMI_CIRC_BASE'
-        core_type = 'SEMI_CIRC_FLOOR_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(
-            context, scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -142,13 +209,7 @@ class MT_OT_Make_Openlock_Semi_Circ_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "SEMI_CIRC_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_semi_circ_base)
 
 
 class MT_OT_Make_Plain_Semi_Circ_Base(MT_Tile_Generator, Operator):
@@ -159,13 +220,7 @@ class MT_OT_Make_Plain_Semi_Circ_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "SEMI_CIRC_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_semi_circ_base)
 
 
 class MT_OT_Make_Empty_Semi_Circular_Base(MT_Tile_Generator, Operator):
@@ -176,13 +231,7 @@ class MT_OT_Make_Empty_Semi_Circular_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "SEMI_CIRC_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_semi_circ_base)
 
 
 class MT_OT_Make_Plain_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
@@ -193,13 +242,7 @@ class MT_OT_Make_Plain_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "SEMI_CIRC_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_floor_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_semi_circ_floor_core)
 
 
 class MT_OT_Make_Openlock_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
@@ -210,13 +253,7 @@ class MT_OT_Make_Openlock_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "SEMI_CIRC_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_floor_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_semi_circ_floor_core)
 
 
 class MT_OT_Make_Empty_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
@@ -227,10 +264,7 @@ class MT_OT_Make_Empty_Semi_Circ_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "SEMI_CIRC_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 def initialise_floor_creator(context, scene_props):
@@ -271,6 +305,7 @@ def initialise_floor_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -295,12 +330,7 @@ def spawn_plain_base(tile_props):
     else:
         base = draw_neg_curved_semi_circ_base(dimensions, subdivs)
 
-    ctx = {
-        'selected_objects': [base],
-        'active_object': base
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(base, bpy.context.scene.cursor.location)
 
     base.name = tile_props.tile_name + '.base'
     props = base.mt_object_props
@@ -312,6 +342,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('base_draw')
 def spawn_openlock_base(tile_props):
     """Spawn OpenLOCK base into scene.
 
@@ -337,13 +368,7 @@ def spawn_openlock_base(tile_props):
     base = spawn_plain_base(tile_props)
 
     base.mt_object_props.geometry_type = 'BASE'
-    ctx = {
-        'selected_objects': [base],
-        'object': base,
-        'active_object': base,
-        'selected_editable_objects': [base]}
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(base, bpy.context.scene.cursor.location)
     base.name = tile_props.tile_name + '.base'
     props = base.mt_object_props
     props.is_mt_object = True
@@ -373,6 +398,7 @@ def spawn_openlock_base(tile_props):
     return base
 
 
+@timed('core_draw')
 def spawn_plain_floor_cores(tile_props):
     """Spawn preview and displacement cores into scene.
 
@@ -391,6 +417,7 @@ def spawn_plain_floor_cores(tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_core(tile_props):
     """Spawn core into scene.
 
@@ -421,15 +448,9 @@ def spawn_core(tile_props):
     core.location[2] = core.location[2] + base_size[2]
     core.name = tile_props.tile_name + '.core'
 
-    ctx = {
-        'selected_editable_objects': [core],
-        'selected_objects': [core],
-        'object': core,
-        'active_object': core
-    }
-
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin, ['Side a'])
+    set_origin(core, bpy.context.scene.cursor.location)
 
     obj_props = core.mt_object_props
     obj_props.is_mt_object = True
@@ -437,6 +458,7 @@ def spawn_core(tile_props):
     return core
 
 
+@timed('cutters')
 def create_openlock_base_clip_cutters(tile_props):
     """Generate base clip cutters for semi circular tiles.
 
@@ -464,19 +486,18 @@ def create_openlock_base_clip_cutters(tile_props):
             preferences.assets_path,
             "meshes", "booleans", "openlock.blend")
 
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = [
-                'openlock.wall.base.cutter.clip',
-                'openlock.wall.base.cutter.clip.cap.start',
-                'openlock.wall.base.cutter.clip.cap.end']
+        loaded_objects = load_objects(booleans_path, [
+            'openlock.wall.base.cutter.clip',
+            'openlock.wall.base.cutter.clip.cap.start',
+            'openlock.wall.base.cutter.clip.cap.end'])
 
-        for obj in data_to.objects:
+        for obj in loaded_objects:
             add_object_to_collection(obj, tile_props.tile_name)
 
-        clip_cutter_1 = data_to.objects[0]
+        clip_cutter_1 = loaded_objects[0]
         clip_cutter_1.name = "Clip Cutter 1"
-        cutter_start_cap = data_to.objects[1]
-        cutter_end_cap = data_to.objects[2]
+        cutter_start_cap = loaded_objects[1]
+        cutter_end_cap = loaded_objects[2]
 
         cutter_start_cap.hide_viewport = True
         cutter_end_cap.hide_viewport = True
@@ -503,14 +524,7 @@ def create_openlock_base_clip_cutters(tile_props):
             )
             array_mod.fit_length = radius - 1.5
 
-        deselect_all()
-        select(clip_cutter_1.name)
-
-        bpy.ops.transform.rotate(
-            value=(radians(angle - 90)),
-            orient_axis='Z',
-            orient_type='GLOBAL',
-            center_override=cursor_orig_loc)
+        rotate([clip_cutter_1], radians(angle - 90), 'Z', cursor_orig_loc)
 
         cutters.append(clip_cutter_1)
         # cutter 2
@@ -538,25 +552,15 @@ def create_openlock_base_clip_cutters(tile_props):
         clip_cutter_2.rotation_euler = (0, 0, radians(-90))
         cutters.append(clip_cutter_2)
 
-        deselect_all()
-
     if tile_props.curve_type == 'POS':
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = ['openlock.wall.base.cutter.clip_single']
-        clip_cutter_3 = data_to.objects[0]
+        loaded_objects = load_objects(booleans_path, ['openlock.wall.base.cutter.clip_single'])
+        clip_cutter_3 = loaded_objects[0]
         clip_cutter_3.name = "Clip Cutter 3"
         add_object_to_collection(clip_cutter_3, tile_props.tile_name)
 
-        deselect_all()
-        select(clip_cutter_3.name)
-
         clip_cutter_3.rotation_euler = (0, 0, radians(180))
         clip_cutter_3.location[1] = cursor_orig_loc[1] + radius - 0.25
-        bpy.ops.transform.rotate(
-            value=(radians(angle / 2)),
-            orient_axis='Z',
-            orient_type='GLOBAL',
-            center_override=cursor_orig_loc)
+        rotate([clip_cutter_3], radians(angle / 2), 'Z', cursor_orig_loc)
 
         cutters.append(clip_cutter_3)
 
@@ -586,15 +590,15 @@ def draw_pos_curved_semi_circ_base(dimensions, subdivs):
     angle = dimensions['angle']
     height = dimensions['height']
 
-    bm, obj = create_turtle('base')
+    bm, obj, turtle = create_turtle('base')
     verts = bm.verts
 
     bm.select_mode = {'VERT'}
-    add_vert(bm)
-    fd(bm, radius)
-    pu(bm)
-    home(obj)
-    pd(bm)
+    add_vert(bm, turtle)
+    fd(bm, turtle, radius)
+    pu(bm, turtle)
+    home(turtle, obj)
+    pd(bm, turtle)
 
     # we only draw part of the arc and then join the end to the final side later
     # we do this because there's always a difference in the location of the final
@@ -602,13 +606,13 @@ def draw_pos_curved_semi_circ_base(dimensions, subdivs):
     # merge by distance doesn't work.
     part_angle = (angle / subdivs['arc'])
     part_angle = part_angle * (subdivs['arc'] - 1)
-    arc(bm, radius, part_angle, subdivs['arc'] - 1)
-    pd(bm)
-    add_vert(bm)
-    rt(angle)
-    fd(bm, radius)
-    pu(bm)
-    home(obj)
+    arc(bm, turtle, radius, part_angle, subdivs['arc'] - 1)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
+    rt(turtle, angle)
+    fd(bm, turtle, radius)
+    pu(bm, turtle)
+    home(turtle, obj)
 
     bmesh.ops.remove_doubles(bm, verts=verts, dist=0.001)
 
@@ -616,14 +620,14 @@ def draw_pos_curved_semi_circ_base(dimensions, subdivs):
     bmesh.ops.edgenet_prepare(bm, edges=bm.edges)
 
     bmesh.ops.triangle_fill(bm, use_beauty=True, use_dissolve=False, edges=bm.edges)
-    pd(bm)
+    pd(bm, turtle)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, height, False)
-    pu(bm)
-    home(obj)
+    up(bm, turtle, height, False)
+    pu(bm, turtle)
+    home(turtle, obj)
 
-    finalise_turtle(bm, obj)
+    finalise_turtle(bm, obj, turtle)
     return obj
 
 
@@ -647,45 +651,46 @@ def draw_neg_curved_semi_circ_base(dimensions, subdivs):
     # calculate a triangle that is the mirror of the one formed by legs b an c
     triangle = calc_tri(angle, radius, radius)
 
-    bm, obj = create_turtle('base')
+    bm, obj, turtle = create_turtle('base')
     verts = bm.verts
     bm.select_mode = {'VERT'}
-    pd(bm)
-    add_vert(bm)
-
-    fd(bm, radius)
-    pu(bm)
-    home(obj)
-    pd(bm)
-    rt(angle)
-    add_vert(bm)
-    fd(bm, radius)
-    pu(bm)
-    lt(180 - triangle['C'] * 2)
-    fd(bm, radius)
-    lt(180)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
+
+    fd(bm, turtle, radius)
+    pu(bm, turtle)
+    home(turtle, obj)
+    pd(bm, turtle)
+    rt(turtle, angle)
+    add_vert(bm, turtle)
+    fd(bm, turtle, radius)
+    pu(bm, turtle)
+    lt(turtle, 180 - triangle['C'] * 2)
+    fd(bm, turtle, radius)
+    lt(turtle, 180)
 
     part_angle = (angle / subdivs['arc'])
     part_angle = part_angle * (subdivs['arc'] - 1)
 
-    arc(bm, radius, part_angle, subdivs['arc'] - 1)
-    pu(bm)
-    home(obj)
+    arc(bm, turtle, radius, part_angle, subdivs['arc'] - 1)
+    pu(bm, turtle)
+    home(turtle, obj)
     bmesh.ops.remove_doubles(bm, verts=verts, dist=0.01)
     bmesh.ops.edgenet_prepare(bm, edges=bm.edges)
 
     bmesh.ops.triangle_fill(bm, use_beauty=True, use_dissolve=False, edges=bm.edges)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    pd(bm)
-    up(bm, height, False)
-    pu(bm)
-    home(obj)
-    finalise_turtle(bm, obj)
+    pd(bm, turtle)
+    up(bm, turtle, height, False)
+    pu(bm, turtle)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
 
 
+@cached_core
 def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     """Return a positively curved semi circular core.
 
@@ -727,25 +732,25 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
         'Top': [],
         'Bottom': []}
 
-    bm, obj = create_turtle('core', vert_groups)
+    bm, obj, turtle = create_turtle('core', vert_groups)
     verts = bm.verts
 
     bm.select_mode = {'VERT'}
-    add_vert(bm)
+    add_vert(bm, turtle)
 
     verts.ensure_lookup_table()
     vert_locs['Side c'].append(verts[-1].co.copy())
 
     i = 0
     while i < subdivs['sides']:
-        fd(bm, radius / subdivs['sides'])
+        fd(bm, turtle, radius / subdivs['sides'])
         verts.ensure_lookup_table()
         vert_locs['Side c'].append(verts[-1].co.copy())
         i += 1
 
-    pu(bm)
-    home(obj)
-    pd(bm)
+    pu(bm, turtle)
+    home(turtle, obj)
+    pd(bm, turtle)
 
     verts.ensure_lookup_table()
     start_index = verts[-1].index + 1
@@ -754,7 +759,7 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     part_angle = (angle / subdivs['arc'])
     part_angle = part_angle * (subdivs['arc'] - 1)
 
-    arc(bm, radius, part_angle, subdivs['arc'] - 1)
+    arc(bm, turtle, radius, part_angle, subdivs['arc'] - 1)
 
     verts.ensure_lookup_table()
     i = start_index
@@ -762,16 +767,16 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
         vert_locs['Side a'].append(verts[i].co.copy())
         i += 1
 
-    pd(bm)
-    add_vert(bm)
-    rt(angle)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
+    rt(turtle, angle)
 
     verts.ensure_lookup_table()
     vert_locs['Side b'].append(verts[-1].co.copy())
 
     i = 0
     while i < subdivs['sides']:
-        fd(bm, radius / subdivs['sides'])
+        fd(bm, turtle, radius / subdivs['sides'])
         verts.ensure_lookup_table()
         vert_locs['Side b'].append(verts[-1].co.copy())
         i += 1
@@ -779,8 +784,8 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     # save this vert to side a as well because or error when drawing arc
     vert_locs['Side a'].append(verts[-1].co.copy())
 
-    pu(bm)
-    home(obj)
+    pu(bm, turtle)
+    home(turtle, obj)
 
     bmesh.ops.remove_doubles(bm, verts=verts, dist=margin / 2)
     bmesh.ops.edgenet_prepare(bm, edges=bm.edges)
@@ -802,13 +807,13 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     bm = bmesh.new()
     bm.from_mesh(mesh)
 
-    pd(bm)
+    pd(bm, turtle)
     verts = bm.verts
     bottom_verts = [v for v in verts]
 
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, height, False)
+    up(bm, turtle, height, False)
 
     selected_faces = [f for f in bm.faces if f.select]
 
@@ -858,10 +863,11 @@ def draw_pos_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
         deform_groups,
         'Top')
 
-    finalise_turtle(bm, obj)
+    finalise_turtle(bm, obj, turtle)
     return obj
 
 
+@cached_core
 def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     """Return a negatively curved semi circular core.
 
@@ -906,18 +912,18 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     # calculate a triangle that is the mirror of the one formed by legs b an c
     triangle = calc_tri(angle, radius, radius)
 
-    bm, obj = create_turtle('core', vert_groups)
+    bm, obj, turtle = create_turtle('core', vert_groups)
     verts = bm.verts
 
     bm.select_mode = {'VERT'}
-    add_vert(bm)
+    add_vert(bm, turtle)
 
     verts.ensure_lookup_table()
     vert_locs['Side c'].append(verts[-1].co.copy())
 
     i = 0
     while i < subdivs['sides']:
-        fd(bm, radius / subdivs['sides'])
+        fd(bm, turtle, radius / subdivs['sides'])
         verts.ensure_lookup_table()
         vert_locs['Side c'].append(verts[-1].co.copy())
         i += 1
@@ -925,18 +931,18 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     # save this vert to side a as well because of margin of error when drawing arc
     vert_locs['Side a'].append(verts[-1].co.copy())
 
-    pu(bm)
-    home(obj)
-    pd(bm)
+    pu(bm, turtle)
+    home(turtle, obj)
+    pd(bm, turtle)
 
-    rt(angle)
-    add_vert(bm)
+    rt(turtle, angle)
+    add_vert(bm, turtle)
     verts.ensure_lookup_table()
     vert_locs['Side b'].append(verts[-1].co.copy())
 
     i = 0
     while i < subdivs['sides']:
-        fd(bm, radius / subdivs['sides'])
+        fd(bm, turtle, radius / subdivs['sides'])
         verts.ensure_lookup_table()
         vert_locs['Side b'].append(verts[-1].co.copy())
         i += 1
@@ -944,10 +950,10 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     # save this vert to side a as well because or error when drawing arc
     vert_locs['Side a'].append(verts[-1].co.copy())
 
-    pu(bm)
-    lt(180 - triangle['C'] * 2)
-    fd(bm, radius)
-    lt(180)
+    pu(bm, turtle)
+    lt(turtle, 180 - triangle['C'] * 2)
+    fd(bm, turtle, radius)
+    lt(turtle, 180)
 
     verts.ensure_lookup_table()
     start_index = bm.verts[-1].index + 1
@@ -955,7 +961,7 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
     part_angle = (angle / subdivs['arc'])
     part_angle = part_angle * (subdivs['arc'] - 1)
 
-    arc(bm, radius, part_angle, subdivs['arc'] - 1)
+    arc(bm, turtle, radius, part_angle, subdivs['arc'] - 1)
 
     verts.ensure_lookup_table()
     i = start_index
@@ -963,8 +969,8 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
         vert_locs['Side a'].append(verts[i].co.copy())
         i += 1
 
-    pu(bm)
-    home(obj)
+    pu(bm, turtle)
+    home(turtle, obj)
 
     bmesh.ops.remove_doubles(bm, verts=verts, dist=margin / 2)
     bmesh.ops.edgenet_prepare(bm, edges=bm.edges)
@@ -978,8 +984,8 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
 
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    pd(bm)
-    up(bm, height, False)
+    pd(bm, turtle)
+    up(bm, turtle, height, False)
 
     selected_faces = [f for f in bm.faces if f.select]
 
@@ -1029,7 +1035,7 @@ def draw_neg_curved_semi_circ_core(dimensions, subdivs, margin=0.001):
         deform_groups,
         'Top')
 
-    finalise_turtle(bm, obj)
+    finalise_turtle(bm, obj, turtle)
     return obj
 
 
@@ -1052,32 +1058,31 @@ def draw_pos_curved_slot_cutter(dimensions, subdivs):
     slot_w = dimensions['slot_w']
     slot_h = dimensions['slot_h']
 
-    bm, obj = create_turtle('base')
+    bm, obj, turtle = create_turtle('base')
     verts = bm.verts
 
     bm.select_mode = {'VERT'}
-    turtle = bpy.context.scene.cursor
     origin = turtle.location.copy()
 
-    pu(bm)
+    pu(bm, turtle)
 
     # get locs of ends of edges inside and parallel to base outer edges
-    rt(angle)
-    fd(bm, radius / 2)
-    lt(90)
-    fd(bm, outer_w)
-    lt(90)
+    rt(turtle, angle)
+    fd(bm, turtle, radius / 2)
+    lt(turtle, 90)
+    fd(bm, turtle, outer_w)
+    lt(turtle, 90)
     v1 = turtle.location.copy()
-    fd(bm, 0.01)
+    fd(bm, turtle, 0.01)
     v2 = turtle.location.copy()
 
-    home(obj)
-    fd(bm, radius / 2)
-    rt(90)
-    fd(bm, outer_w)
-    rt(90)
+    home(turtle, obj)
+    fd(bm, turtle, radius / 2)
+    rt(turtle, 90)
+    fd(bm, turtle, outer_w)
+    rt(turtle, 90)
     v3 = turtle.location.copy()
-    fd(bm, 0.01)
+    fd(bm, turtle, 0.01)
     v4 = turtle.location.copy()
 
     # get intersection
@@ -1090,20 +1095,20 @@ def draw_pos_curved_slot_cutter(dimensions, subdivs):
     new_radius = radius - dist - outer_w
 
     # draw outer arc
-    arc(bm, new_radius, angle, subdivs['arc'] + 1)
+    arc(bm, turtle, new_radius, angle, subdivs['arc'] + 1)
 
     # draw sides
-    add_vert(bm)
-    pd(bm)
-    fd(bm, new_radius)
-    pu(bm)
+    add_vert(bm, turtle)
+    pd(bm, turtle)
+    fd(bm, turtle, new_radius)
+    pu(bm, turtle)
     turtle.location = intersection
-    pd(bm)
+    pd(bm, turtle)
     verts.ensure_lookup_table()
     verts[-2].select = True
-    rt(angle)
-    fd(bm, new_radius)
-    pu(bm)
+    rt(turtle, angle)
+    fd(bm, turtle, new_radius)
+    pu(bm, turtle)
     bmesh.ops.remove_doubles(bm, verts=verts, dist=0.001)
 
     # repeat for inner edge of slot cutter
@@ -1111,23 +1116,23 @@ def draw_pos_curved_slot_cutter(dimensions, subdivs):
     turtle.rotation_euler = (0, 0, 0)
 
     # get locs of ends of edges inside and parallel to base outer edges
-    rt(angle)
-    fd(bm, radius / 2)
-    lt(90)
-    fd(bm, slot_w)
-    lt(90)
+    rt(turtle, angle)
+    fd(bm, turtle, radius / 2)
+    lt(turtle, 90)
+    fd(bm, turtle, slot_w)
+    lt(turtle, 90)
     v1 = turtle.location.copy()
-    fd(bm, 0.01)
+    fd(bm, turtle, 0.01)
     v2 = turtle.location.copy()
 
     turtle.location = intersection
     turtle.rotation_euler = (0, 0, 0)
-    fd(bm, radius / 2)
-    rt(90)
-    fd(bm, slot_w)
-    rt(90)
+    fd(bm, turtle, radius / 2)
+    rt(turtle, 90)
+    fd(bm, turtle, slot_w)
+    rt(turtle, 90)
     v3 = turtle.location.copy()
-    fd(bm, 0.01)
+    fd(bm, turtle, 0.01)
     v4 = turtle.location.copy()
 
     # get intersection
@@ -1140,28 +1145,28 @@ def draw_pos_curved_slot_cutter(dimensions, subdivs):
     new_radius = new_radius - dist - slot_w
 
     # draw outer arc
-    arc(bm, new_radius, angle, subdivs['arc'] + 1)
-    add_vert(bm)
-    pd(bm)
-    fd(bm, new_radius)
-    pu(bm)
+    arc(bm, turtle, new_radius, angle, subdivs['arc'] + 1)
+    add_vert(bm, turtle)
+    pd(bm, turtle)
+    fd(bm, turtle, new_radius)
+    pu(bm, turtle)
     turtle.location = intersection_2
-    pd(bm)
+    pd(bm, turtle)
     verts.ensure_lookup_table()
     verts[-2].select = True
-    rt(angle)
-    fd(bm, new_radius)
-    pu(bm)
+    rt(turtle, angle)
+    fd(bm, turtle, new_radius)
+    pu(bm, turtle)
     bmesh.ops.remove_doubles(bm, verts=verts, dist=0.001)
     bmesh.ops.bridge_loops(bm, edges=bm.edges)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    pd(bm)
-    up(bm, slot_h + 0.001, False)
-    pu(bm)
-    home(obj)
+    pd(bm, turtle)
+    up(bm, turtle, slot_h + 0.001, False)
+    pu(bm, turtle)
+    home(turtle, obj)
     obj.location = (obj.location[0], obj.location[1], obj.location[2] - 0.001)
-    finalise_turtle(bm, obj)
+    finalise_turtle(bm, obj, turtle)
 
     return obj
 
@@ -1199,49 +1204,48 @@ def draw_neg_curved_slot_cutter(dimensions):
         slot_w,
         angle)
 
-    bm, obj = create_turtle('slot_cutter')
+    bm, obj, turtle = create_turtle('slot_cutter')
     bm.select_mode = {'VERT'}
 
-    turtle = bpy.context.scene.cursor
     # move turtle to start
     orig_rot = turtle.rotation_euler.copy()
 
-    pu(bm)
-    dn(bm, 0.001)
-    rt(angle)
-    fd(bm, triangles_1['a_adj'])
-    lt(90)
-    fd(bm, outer_w)
-    lt(90)
-    fd(bm, triangles_1['b_adj'])
+    pu(bm, turtle)
+    dn(bm, turtle, 0.001)
+    rt(turtle, angle)
+    fd(bm, turtle, triangles_1['a_adj'])
+    lt(turtle, 90)
+    fd(bm, turtle, outer_w)
+    lt(turtle, 90)
+    fd(bm, turtle, triangles_1['b_adj'])
     turtle.rotation_euler = orig_rot
     turtle_start_loc = turtle.location.copy()
-    pd(bm)
-
-    add_vert(bm)
-    rt(angle)
-    fd(bm, triangles_2['a_adj'] - (radius / 2))
-    lt(90)
-    fd(bm, slot_w)
-    lt(90)
-    fd(bm, triangles_2['b_adj'] - (radius / 2))
-    pu(bm)
-    home(obj)
+    pd(bm, turtle)
+
+    add_vert(bm, turtle)
+    rt(turtle, angle)
+    fd(bm, turtle, triangles_2['a_adj'] - (radius / 2))
+    lt(turtle, 90)
+    fd(bm, turtle, slot_w)
+    lt(turtle, 90)
+    fd(bm, turtle, triangles_2['b_adj'] - (radius / 2))
+    pu(bm, turtle)
+    home(turtle, obj)
     turtle.location = turtle_start_loc
-    pd(bm)
-    add_vert(bm)
-    fd(bm, triangles_2['c_adj'] - (radius / 2))
-    rt(90)
-    fd(bm, slot_w)
-    rt(90)
-    fd(bm, triangles_2['d_adj'] - (radius / 2))
+    pd(bm, turtle)
+    add_vert(bm, turtle)
+    fd(bm, turtle, triangles_2['c_adj'] - (radius / 2))
+    rt(turtle, 90)
+    fd(bm, turtle, slot_w)
+    rt(turtle, 90)
+    fd(bm, turtle, triangles_2['d_adj'] - (radius / 2))
 
     bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.01)
     bmesh.ops.triangle_fill(bm, use_beauty=True, use_dissolve=False, edges=bm.edges)
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, slot_h, False)
-    pu(bm)
-    home(obj)
-    finalise_turtle(bm, obj)
+    up(bm, turtle, slot_h, False)
+    pu(bm, turtle)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
     return obj
@@ -11,12 +11,18 @@ from .. lib.utils.collections import (
     activate_collection)
 from ..lib.bmturtle.scripts import (
     draw_cuboid,
-    draw_straight_wall_core)
-from .. lib.utils.utils import mode, get_all_subclasses
+    generate_straight_wall_core)
+from .. lib.utils.utils import mode
+from .. lib.utils.profiling import stage, timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin
+from .. lib.bmturtle.adapter import project_uvs
 
 from .create_tile import (
+    load_objects,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     convert_to_displacement_core,
     spawn_prefab,
     set_bool_obj_props,
@@ -141,6 +147,132 @@ class MT_PT_Straight_Floor_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_openlock_straight_base(context):
+    """Spawn an OpenLOCK straight base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_straight_base(context):
+    """Spawn a plain straight base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_straight_base(context):
+    """Spawn an empty straight base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_straight_wall_core(context):
+    """Spawn a plain straight wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_wall_cores(tile_props)
+
+
+def make_openlock_straight_wall_core(context):
+    """Spawn an openlock straight wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    spawn_openlock_wall_cores(base, tile_props)
+
+
+def make_plain_straight_floor_core(context):
+    """Spawn a plain straight floor core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    create_plain_floor_cores(tile_props)
+
+
+def make_openlock_straight_floor_core(context):
+    """Spawn an openlock straight floor core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    create_plain_floor_cores(tile_props)
+
+
+def make_straight_wall(context):
+    """Generate a straight wall tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'STRAIGHT_BASE'
+    core_type = 'STRAIGHT_WALL_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_straight_floor(context):
+    """Generate a straight floor tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'STRAIGHT_BASE'
+    core_type = 'STRAIGHT_FLOOR_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
 class MT_OT_Make_Openlock_Straight_Base(MT_Tile_Generator, Operator):
     """Internal Operator. Generate an OpenLOCK straight base."""
 
@@ -149,13 +281,7 @@ class MT_OT_Make_Openlock_Straight_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "STRAIGHT_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_straight_base)
 
 
 class MT_OT_Make_Plain_Straight_Base(MT_Tile_Generator, Operator):
@@ -166,13 +292,7 @@ class MT_OT_Make_Plain_Straight_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "STRAIGHT_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_straight_base)
 
 
 class MT_OT_Make_Empty_Straight_Base(MT_Tile_Generator, Operator):
@@ -183,13 +303,7 @@ class MT_OT_Make_Empty_Straight_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "STRAIGHT_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_straight_base)
 
 
 class MT_OT_Make_Plain_Straight_Wall_Core(MT_Tile_Generator, Operator):
@@ -200,13 +314,7 @@ class MT_OT_Make_Plain_Straight_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "STRAIGHT_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_wall_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_straight_wall_core)
 
 
 class MT_OT_Make_Openlock_Straight_Wall_Core(MT_Tile_Generator, Operator):
@@ -217,14 +325,7 @@ class MT_OT_Make_Openlock_Straight_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "STRAIGHT_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        spawn_openlock_wall_cores(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_straight_wall_core)
 
 
 class MT_OT_Make_Empty_Straight_Wall_Core(MT_Tile_Generator, Operator):
@@ -235,10 +336,7 @@ class MT_OT_Make_Empty_Straight_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "STRAIGHT_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 class MT_OT_Make_Plain_Straight_Floor_Core(MT_Tile_Generator, Operator):
@@ -249,13 +347,7 @@ class MT_OT_Make_Plain_Straight_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "STRAIGHT_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        create_plain_floor_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_straight_floor_core)
 
 
 class MT_OT_Make_Openlock_Straight_Floor_Core(MT_Tile_Generator, Operator):
@@ -266,13 +358,7 @@ class MT_OT_Make_Openlock_Straight_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "STRAIGHT_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        create_plain_floor_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_straight_floor_core)
 
 
 class MT_OT_Make_Empty_Straight_Floor_Core(MT_Tile_Generator, Operator):
@@ -283,10 +369,7 @@ class MT_OT_Make_Empty_Straight_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "STRAIGHT_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 class MT_OT_Make_Straight_Wall_Tile(MT_Tile_Generator, Operator):
@@ -297,29 +380,13 @@ class MT_OT_Make_Straight_Wall_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "STRAIGHT_WALL"
+    mt_spawn = staticmethod(make_straight_wall)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'STRAIGHT_BASE'
-        core_type = 'STRAIGHT_WALL_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(context, scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
-
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -331,29 +398,13 @@ class MT_OT_Make_Straight_Floor_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "STRAIGHT_FLOOR"
+    mt_spawn = staticmethod(make_straight_floor)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'STRAIGHT_BASE'
-        core_type = 'STRAIGHT_FLOOR_CORE'
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-
-        cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(context, scene_props)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
-
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -429,6 +480,7 @@ def initialise_floor_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -447,13 +499,7 @@ def spawn_plain_base(tile_props):
     base.name = tile_name + '.base'
     add_object_to_collection(base, tile_name)
 
-    ctx = {
-        'object': base,
-        'active_object': base,
-        'selected_objects': [base]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(base, bpy.context.scene.cursor.location)
 
     obj_props = base.mt_object_props
     obj_props.is_mt_object = True
@@ -464,6 +510,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('base_draw')
 def spawn_openlock_base(tile_props):
     """Spawn an openlock base into the scene.
 
@@ -493,6 +540,7 @@ def spawn_openlock_base(tile_props):
     return base
 
 
+@timed('cutters')
 def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
     """Makes a cutter for the openlock base slot
     based on the width of the base
@@ -523,18 +571,12 @@ def spawn_openlock_base_slot_cutter(base, tile_props, offset=0.236):
         base_location[1] + offset,
         base_location[2] - 0.001)
 
-    ctx = {
-        'object': cutter,
-        'active_object': cutter,
-        'selected_objects': [cutter]
-    }
-
-    base.select_set(False)
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(cutter, bpy.context.scene.cursor.location)
 
     return cutter
 
 
+@timed('cutters')
 def spawn_openlock_base_clip_cutter(base, tile_props):
     """Makes a cutter for the openlock base clip based
     on the width of the base and positions it correctly
@@ -554,18 +596,17 @@ def spawn_openlock_base_clip_cutter(base, tile_props):
         "openlock.blend")
 
     # load base cutters
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = [
-            'openlock.wall.base.cutter.clip',
-            'openlock.wall.base.cutter.clip.cap.start',
-            'openlock.wall.base.cutter.clip.cap.end']
+    loaded_objects = load_objects(booleans_path, [
+        'openlock.wall.base.cutter.clip',
+        'openlock.wall.base.cutter.clip.cap.start',
+        'openlock.wall.base.cutter.clip.cap.end'])
 
-    for obj in data_to.objects:
+    for obj in loaded_objects:
         add_object_to_collection(obj, tile_props.tile_name)
 
-    clip_cutter = data_to.objects[0]
-    cutter_start_cap = data_to.objects[1]
-    cutter_end_cap = data_to.objects[2]
+    clip_cutter = loaded_objects[0]
+    cutter_start_cap = loaded_objects[1]
+    cutter_end_cap = loaded_objects[2]
 
     cutter_start_cap.hide_viewport = True
     cutter_end_cap.hide_viewport = True
@@ -588,6 +629,7 @@ def spawn_openlock_base_clip_cutter(base, tile_props):
     return clip_cutter
 
 
+@timed('core_draw')
 def spawn_plain_wall_cores(tile_props):
     """Spawn plain Core.
 
@@ -605,6 +647,7 @@ def spawn_plain_wall_cores(tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_openlock_wall_cores(base, tile_props):
     """Spawn OpenLOCK core.
 
@@ -641,6 +684,7 @@ def spawn_openlock_wall_cores(base, tile_props):
     return core
 
 
+@timed('core_draw')
 def spawn_wall_core(tile_props):
     """Return the core (vertical) part of a straight wall tile.
     """
@@ -655,7 +699,7 @@ def spawn_wall_core(tile_props):
         tile_props.y_native_subdivisions,
         tile_props.z_native_subdivisions]
 
-    core = draw_straight_wall_core(
+    core = generate_straight_wall_core(
         [tile_size[0],
          tile_size[1],
          tile_size[2] - base_size[2]],
@@ -670,23 +714,20 @@ def spawn_wall_core(tile_props):
         core.location[1] + (base_size[1] - tile_size[1]) / 2,
         cursor_start_loc[2] + base_size[2])
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_editable_objects': [core],
-        'selected_objects': [core]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    set_origin(core, bpy.context.scene.cursor.location)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
 
     obj_props = core.mt_object_props
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
+    # generated by box_grid so can be resized in place
+    obj_props.is_resizable = True
 
     return core
 
 
+@timed('cutters')
 def spawn_openlock_top_pegs(core, tile_props):
     """Spawn top peg(s) for stacking wall tiles and position it.
 
@@ -731,6 +772,7 @@ def spawn_openlock_top_pegs(core, tile_props):
     return peg
 
 
+@timed('cutters')
 def spawn_openlock_wall_cutters(core, tile_props):
     """Creates the cutters for the wall and positions them correctly
     """
@@ -747,14 +789,13 @@ def spawn_openlock_wall_cutters(core, tile_props):
         "openlock.blend")
 
     # load side cutter
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
     core_location = core.location.copy()
 
     cutters = []
     # left side cutters
-    left_cutter_bottom = data_to.objects[0].copy()
+    left_cutter_bottom = loaded_objects[0].copy()
     left_cutter_bottom.name = 'X Neg Bottom.' + tile_name
 
     add_object_to_collection(left_cutter_bottom, tile_name)
@@ -790,7 +831,7 @@ def spawn_openlock_wall_cutters(core, tile_props):
 
     # right side cutters
 
-    right_cutter_bottom = data_to.objects[0].copy()
+    right_cutter_bottom = loaded_objects[0].copy()
     right_cutter_bottom.name = 'X Pos Bottom.' + tile_name
 
     add_object_to_collection(right_cutter_bottom, tile_name)
@@ -9,12 +9,18 @@ from .. lib.utils.collections import (
     add_object_to_collection,
     create_collection,
     activate_collection)
-from .. lib.utils.utils import mode, get_all_subclasses
+from .. lib.utils.utils import mode
+from .. lib.utils.profiling import stage, timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin, rotate
+from .. lib.bmturtle.adapter import project_uvs
 from .. lib.utils.selection import select
 from .create_tile import (
+    load_objects,
     convert_to_displacement_core,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     spawn_prefab,
     set_bool_obj_props,
     set_bool_props,
@@ -71,6 +77,84 @@ class MT_PT_Triangular_Floor_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_triangular_floor(context):
+    """Generate a triangle floor tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'TRIANGULAR_BASE'
+    core_type = 'TRIANGULAR_FLOOR_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_type == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_openlock_triangular_base(context):
+    """Spawn an OpenLOCK triangular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_triangular_base(context):
+    """Spawn a plain triangular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_triangular_base(context):
+    """Spawn an empty triangular base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_triangular_floor_core(context):
+    """Spawn a plain triangular core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    create_plain_triangular_floor_cores(base, tile_props)
+
+
+def make_openlock_triangular_floor_core(context):
+    """Spawn an openlock triangular floor core.
+
+    Args:
+        context (bpy.context): context
+    """
+    spawn_prefab(context, 'PLAIN', 'TRIANGULAR_FLOOR_CORE')
+
+
 class MT_OT_Make_Triangular_Floor_Tile(MT_Tile_Generator, Operator):
     """Operator. Create a Triangular Floor Tile."""
 
@@ -79,29 +163,13 @@ class MT_OT_Make_Triangular_Floor_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "TRIANGULAR_FLOOR"
+    mt_spawn = staticmethod(make_triangular_floor)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'TRIANGULAR_BASE'
-        core_type = 'TRIANGULAR_FLOOR_CORE'
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-
-        cursor_orig_loc, cursor_orig_rot = initialise_floor_creator(context, scene_props)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_type == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
-
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -113,13 +181,7 @@ class MT_OT_Make_Openlock_Triangular_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "TRIANGULAR_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_triangular_base)
 
 
 class MT_OT_Make_Plain_Triangular_Base(MT_Tile_Generator, Operator):
@@ -130,13 +192,7 @@ class MT_OT_Make_Plain_Triangular_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "TRIANGULAR_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_triangular_base)
 
 
 class MT_OT_Make_Empty_Triangular_Base(MT_Tile_Generator, Operator):
@@ -147,13 +203,7 @@ class MT_OT_Make_Empty_Triangular_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "TRIANGULAR_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_triangular_base)
 
 
 class MT_OT_Make_Plain_Triangular_Floor_Core(MT_Tile_Generator, Operator):
@@ -164,14 +214,7 @@ class MT_OT_Make_Plain_Triangular_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "TRIANGULAR_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        create_plain_triangular_floor_cores(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_triangular_floor_core)
 
 
 class MT_OT_Make_Openlock_Triangular_Floor_Core(MT_Tile_Generator, Operator):
@@ -182,11 +225,7 @@ class MT_OT_Make_Openlock_Triangular_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "TRIANGULAR_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        bpy.ops.object.make_plain_triangular_floor_core()
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_triangular_floor_core)
 
 
 class MT_OT_Make_Empty_Triangular_Floor_Core(MT_Tile_Generator, Operator):
@@ -197,10 +236,7 @@ class MT_OT_Make_Empty_Triangular_Floor_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "TRIANGULAR_FLOOR_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
 def initialise_floor_creator(context, scene_props):
@@ -245,6 +281,7 @@ def initialise_floor_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -265,13 +302,7 @@ def spawn_plain_base(tile_props):
     base.name = tile_name + '.base'
     add_object_to_collection(base, tile_name)
 
-    ctx = {
-        'object': base,
-        'active_object': base,
-        'selected_objects': [base]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(base, bpy.context.scene.cursor.location)
 
     obj_props = base.mt_object_props
     obj_props.is_mt_object = True
@@ -282,6 +313,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('base_draw')
 def spawn_openlock_base(tile_props):
     """Spawn an OpenLOCK base into the scene.
 
@@ -303,14 +335,7 @@ def spawn_openlock_base(tile_props):
     base.name = tile_name + '.base'
     add_object_to_collection(base, tile_name)
 
-    ctx = {
-        'object': base,
-        'active_object': base,
-        'selected_objects': [base],
-        'selected_editable_objects': [base]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(base, bpy.context.scene.cursor.location)
 
     clip_cutters = spawn_openlock_base_clip_cutters(dimensions, tile_props)
 
@@ -330,6 +355,7 @@ def spawn_openlock_base(tile_props):
     return base
 
 
+@timed('cutters')
 def spawn_openlock_base_clip_cutters(dimensions, tile_props):
     """Make cutters for the openlock base clips.
 
@@ -370,20 +396,19 @@ def spawn_openlock_base_clip_cutters(dimensions, tile_props):
             "openlock.blend")
 
         cutters = []
-        with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-            data_to.objects = [
-                'openlock.wall.base.cutter.clip',
-                'openlock.wall.base.cutter.clip.cap.start',
-                'openlock.wall.base.cutter.clip.cap.end']
+        loaded_objects = load_objects(booleans_path, [
+            'openlock.wall.base.cutter.clip',
+            'openlock.wall.base.cutter.clip.cap.start',
+            'openlock.wall.base.cutter.clip.cap.end'])
 
-        for obj in data_to.objects:
+        for obj in loaded_objects:
             add_object_to_collection(obj, tile_props.tile_name)
 
-        b_cutter = data_to.objects[0]
+        b_cutter = loaded_objects[0]
 
         b_cutter.name = "Leg 1 Clip."
-        cutter_start_cap = data_to.objects[1]
-        cutter_end_cap = data_to.objects[2]
+        cutter_start_cap = loaded_objects[1]
+        cutter_end_cap = loaded_objects[2]
 
         cutter_start_cap.hide_viewport = True
         cutter_end_cap.hide_viewport = True
@@ -421,20 +446,10 @@ def spawn_openlock_base_clip_cutters(dimensions, tile_props):
                 else:
                     array_mod.fit_length = b - 2
 
-            ctx = {
-                'object': b_cutter,
-                'active_object': b_cutter,
-                'selected_objects': [b_cutter],
-                'selected_editable_objects': [b_cutter]}
-
-            bpy.ops.transform.rotate(
-                ctx,
-                value=(radians(A - 90)),
-                orient_axis='Z',
-                orient_type='GLOBAL',
-                center_override=loc_A)
+            rotate([b_cutter], radians(A - 90), 'Z', loc_A)
 
             c_cutter = b_cutter.copy()
+            c_cutter.data = c_cutter.data.copy()
             c_cutter.name = "Leg 2 Clip"
             add_object_to_collection(c_cutter, tile_props.tile_name)
             cutters.append(b_cutter)
@@ -468,10 +483,10 @@ def spawn_openlock_base_clip_cutters(dimensions, tile_props):
 
             if a >= 2:
                 a_cutter = c_cutter.copy()
+                a_cutter.data = a_cutter.data.copy()
                 a_cutter.name = "Opposite Clip."
                 add_object_to_collection(a_cutter, tile_props.tile_name)
             else:
-                bpy.ops.object.make_single_user(type='ALL', object=True, obdata=True)
                 return cutters
         else:
             a_cutter = c_cutter
@@ -500,27 +515,15 @@ def spawn_openlock_base_clip_cutters(dimensions, tile_props):
                     array_mod.fit_length = a - 1.5
                 else:
                     array_mod.fit_length = a - 2
-            ctx = {
-                'object': a_cutter,
-                'active_object': a_cutter,
-                'selected_objects': [a_cutter],
-                'selected_editable_objects': [a_cutter]}
-
-            bpy.ops.transform.rotate(
-                ctx,
-                value=(radians(-90 - B)),
-                orient_axis='Z',
-                orient_type='GLOBAL',
-                center_override=loc_C)
+            rotate([a_cutter], radians(-90 - B), 'Z', loc_C)
 
             cutters.append(a_cutter)
-
-            bpy.ops.object.make_single_user(type='ALL', object=True, obdata=True)
         return cutters
     else:
         return None
 
 
+@timed('core_draw')
 def create_plain_triangular_floor_cores(base, tile_props):
     """Create preview and displacement cores.
 
@@ -540,6 +543,7 @@ def create_plain_triangular_floor_cores(base, tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_floor_core(tile_props):
     """Spawn the core (top part) of a floor tile.
 
@@ -561,7 +565,8 @@ def spawn_floor_core(tile_props):
             'A': tile_props.angle,
             'height': tile_props.tile_size[2] - tile_props.base_size[2]
         },
-        subdivs=native_subdivisions
+        subdivs=native_subdivisions,
+        use_builder=True
     )
     core.name = tile_name + '.core'
     add_object_to_collection(core, tile_name)
@@ -570,15 +575,9 @@ def spawn_floor_core(tile_props):
 
     core.location[2] = core.location[2] + tile_props.base_size[2]
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_objects': [core],
-        'selected_editable_objects': [core]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    set_origin(core, bpy.context.scene.cursor.location)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
     obj_props = core.mt_object_props
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
@@ -15,23 +15,31 @@ from ..lib.bmturtle.commands import (
     lt,
     up,
     home,
-    finalise_turtle)
+    finalise_turtle,
+    release_turtle)
 from ..lib.bmturtle.helpers import (
     bm_select_all,
     bm_deselect_all,
     assign_verts_to_group,
     select_verts_in_bounds,
     bm_shortest_path)
-from .. lib.utils.utils import mode, get_all_subclasses
+from ..lib.bmturtle.cache import cached_core
+from .. lib.utils.utils import mode
+from .. lib.utils.profiling import stage, timed, profile_generation
+from .. lib.utils.updates import batch_updates
+from .. lib.utils.transforms import set_origin, apply_rotation
+from .. lib.bmturtle.adapter import project_uvs
 from .. utils.registration import get_prefs
 from .. lib.utils.collections import (
     add_object_to_collection,
     create_collection,
     activate_collection)
 from .create_tile import (
+    load_objects,
     convert_to_displacement_core,
     finalise_tile,
     spawn_empty_base,
+    spawn_nothing,
     spawn_prefab,
     set_bool_obj_props,
     set_bool_props,
@@ -114,6 +122,87 @@ class MT_PT_U_Tile_Panel(Panel):
         layout.operator('scene.reset_tile_defaults')
 
 
+def make_u_wall(context):
+    """Generate a U wall tile using the scene properties.
+
+    Args:
+        context (bpy.context): context
+    """
+    scene = context.scene
+    scene_props = scene.mt_scene_props
+    base_blueprint = scene_props.base_blueprint
+    core_blueprint = scene_props.main_part_blueprint
+    base_type = 'U_BASE'
+    core_type = 'U_WALL_CORE'
+
+    cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(
+        context, scene_props)
+    base = spawn_prefab(context, base_blueprint, base_type)
+
+    if core_blueprint == 'NONE':
+        preview_core = None
+    else:
+        preview_core = spawn_prefab(context, core_blueprint, core_type)
+
+    finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
+
+
+def make_openlock_u_base(context):
+    """Spawn an OpenLOCK U base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_openlock_base(tile_props)
+
+
+def make_plain_u_base(context):
+    """Spawn a plain u base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_base(tile_props)
+
+
+def make_empty_u_base(context):
+    """Spawn an empty u base.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_empty_base(tile_props)
+
+
+def make_plain_u_wall_core(context):
+    """Spawn a plain u wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    spawn_plain_wall_cores(tile_props)
+
+
+def make_openlock_u_wall_core(context):
+    """Spawn an openlock u wall core.
+
+    Args:
+        context (bpy.context): context
+    """
+    tile = context.collection
+    tile_props = tile.mt_tile_props
+    base = context.active_object
+    spawn_openlock_wall_cores(base, tile_props)
+
+
 class MT_OT_Make_U_Wall_Tile(MT_Tile_Generator, Operator):
     """Create a U Wall Tile."""
 
@@ -122,29 +211,13 @@ class MT_OT_Make_U_Wall_Tile(MT_Tile_Generator, Operator):
     bl_options = {'UNDO'}
     mt_blueprint = "CUSTOM"
     mt_type = "U_WALL"
+    mt_spawn = staticmethod(make_u_wall)
 
+    @profile_generation
+    @batch_updates
     def execute(self, context):
         """Execute the operator."""
-        scene = context.scene
-        scene_props = scene.mt_scene_props
-        base_blueprint = scene_props.base_blueprint
-        core_blueprint = scene_props.main_part_blueprint
-        base_type = 'U_BASE'
-        core_type = 'U_WALL_CORE'
-
-        cursor_orig_loc, cursor_orig_rot = initialise_wall_creator(
-            context, scene_props)
-        subclasses = get_all_subclasses(MT_Tile_Generator)
-        base = spawn_prefab(context, subclasses, base_blueprint, base_type)
-
-        if core_blueprint == 'NONE':
-            preview_core = None
-        else:
-            preview_core = spawn_prefab(context, subclasses, core_blueprint, core_type)
-
-        finalise_tile(base, preview_core, cursor_orig_loc, cursor_orig_rot)
-
-        # scene.render.engine = original_renderer
+        self.mt_spawn(context)
         return {'FINISHED'}
 
 
@@ -156,13 +229,7 @@ class MT_OT_Make_Openlock_U_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "U_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_openlock_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_u_base)
 
 
 class MT_OT_Make_Plain_U_Base(MT_Tile_Generator, Operator):
@@ -173,13 +240,7 @@ class MT_OT_Make_Plain_U_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "U_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_u_base)
 
 
 class MT_OT_Make_Empty_U_Base(MT_Tile_Generator, Operator):
@@ -190,13 +251,7 @@ class MT_OT_Make_Empty_U_Base(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "U_BASE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_empty_base(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_empty_u_base)
 
 
 class MT_OT_Make_Plain_U_Wall_Core(MT_Tile_Generator, Operator):
@@ -207,13 +262,7 @@ class MT_OT_Make_Plain_U_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "PLAIN"
     mt_type = "U_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        spawn_plain_wall_cores(tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_plain_u_wall_core)
 
 
 class MT_OT_Make_Openlock_U_Wall_Core(MT_Tile_Generator, Operator):
@@ -224,14 +273,7 @@ class MT_OT_Make_Openlock_U_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "OPENLOCK"
     mt_type = "U_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        tile = context.collection
-        tile_props = tile.mt_tile_props
-        base = context.active_object
-        spawn_openlock_wall_cores(base, tile_props)
-        return{'FINISHED'}
+    mt_spawn = staticmethod(make_openlock_u_wall_core)
 
 
 class MT_OT_Make_Empty_U_Wall_Core(MT_Tile_Generator, Operator):
@@ -242,12 +284,10 @@ class MT_OT_Make_Empty_U_Wall_Core(MT_Tile_Generator, Operator):
     bl_options = {'INTERNAL'}
     mt_blueprint = "NONE"
     mt_type = "U_WALL_CORE"
-
-    def execute(self, context):
-        """Execute the operator."""
-        return {'PASS_THROUGH'}
+    mt_spawn = staticmethod(spawn_nothing)
 
 
+@timed('core_draw')
 def spawn_openlock_wall_cores(base, tile_props):
     """Spawn preview and displacement cores into scene.
 
@@ -284,6 +324,7 @@ def spawn_openlock_wall_cores(base, tile_props):
     return core
 
 
+@timed('cutters')
 def spawn_openlock_wall_cutters(base, tile_props):
     """Spawn OpenLOCK wall cores into scene and position them.
 
@@ -304,13 +345,12 @@ def spawn_openlock_wall_cutters(base, tile_props):
         "openlock.blend")
 
     # load side cutter
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.wall.cutter.side']
+    loaded_objects = load_objects(booleans_path, ['openlock.wall.cutter.side'])
 
-    for obj in data_to.objects:
+    for obj in loaded_objects:
         add_object_to_collection(obj, tile_name)
 
-    cutter = data_to.objects[0]
+    cutter = loaded_objects[0]
 
     array_mod = cutter.modifiers.new('Array', 'ARRAY')
     array_mod.use_relative_offset = False
@@ -379,6 +419,7 @@ def spawn_openlock_wall_cutters(base, tile_props):
     return cutters
 
 
+@timed('cutters')
 def spawn_openlock_top_pegs(core, tile_props):
     """Spawn top peg(s) for stacking wall tiles and position it.
 
@@ -441,20 +482,7 @@ def spawn_openlock_top_pegs(core, tile_props):
         peg_2.name = 'Leg 1 Top Peg.' + tile_props.tile_name
 
         peg_2.rotation_euler[2] = radians(-90)
-        ctx = {
-            'object': peg_2,
-            'active_object': peg_2,
-            'selected_objects': [peg_2],
-            'selectable_objects': [peg_2],
-            'selected_editable_objects': [peg_2]
-        }
-
-        bpy.ops.object.transform_apply(
-            ctx,
-            location=False,
-            rotation=True,
-            scale=False,
-            properties=True)
+        apply_rotation(peg_2)
 
         if leg_1_outer_len < 4 and leg_1_outer_len >= 1:
             peg_2.location = (
@@ -491,20 +519,7 @@ def spawn_openlock_top_pegs(core, tile_props):
         peg_3.name = 'Leg 2 Top Peg.' + tile_props.tile_name
 
         peg_3.rotation_euler[2] = radians(90)
-        ctx = {
-            'object': peg_3,
-            'active_object': peg_3,
-            'selected_objects': [peg_3],
-            'selectable_objects': [peg_3],
-            'selected_editable_objects': [peg_3]
-        }
-
-        bpy.ops.object.transform_apply(
-            ctx,
-            location=False,
-            rotation=True,
-            scale=False,
-            properties=True)
+        apply_rotation(peg_3)
 
         if leg_2_outer_len < 4 and leg_2_outer_len >= 1:
             peg_3.location = (
@@ -538,6 +553,7 @@ def spawn_openlock_top_pegs(core, tile_props):
     return pegs
 
 
+@timed('core_draw')
 def spawn_plain_wall_cores(tile_props):
     """Spawn preview and displacement cores into scene.
 
@@ -555,6 +571,7 @@ def spawn_plain_wall_cores(tile_props):
     return preview_core
 
 
+@timed('core_draw')
 def spawn_core(tile_props):
     """Spawn core into scene.
 
@@ -588,17 +605,11 @@ def spawn_core(tile_props):
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
 
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_objects': [core],
-        'selected_editable_objects': [core]
-    }
-
     mode('OBJECT')
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
     bpy.context.scene.cursor.location = (0, 0, 0)
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
+    set_origin(core, bpy.context.scene.cursor.location)
     return core
 
 
@@ -643,6 +654,7 @@ def initialise_wall_creator(context, scene_props):
     return cursor_orig_loc, cursor_orig_rot
 
 
+@timed('base_draw')
 def spawn_plain_base(tile_props):
     """Spawn a plain base into the scene.
 
@@ -671,6 +683,7 @@ def spawn_plain_base(tile_props):
     return base
 
 
+@timed('base_draw')
 def spawn_openlock_base(tile_props):
     """Spawn OpenLOCK base into scene.
 
@@ -743,6 +756,7 @@ def spawn_openlock_base(tile_props):
     return base
 
 
+@timed('cutters')
 def spawn_openlock_base_slot_cutter(tile_props):
     """Spawn base slot cutter into scene.
 
@@ -770,23 +784,22 @@ def spawn_openlock_base_slot_cutter(tile_props):
         "booleans",
         "openlock.blend")
 
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = [
-            'openlock.u_tile.base.cutter.slot.root',
-            'openlock.u_tile.base.cutter.slot.start_cap.root',
-            'openlock.u_tile.base.cutter.slot.end_cap.root']
+    loaded_objects = load_objects(booleans_path, [
+        'openlock.u_tile.base.cutter.slot.root',
+        'openlock.u_tile.base.cutter.slot.start_cap.root',
+        'openlock.u_tile.base.cutter.slot.end_cap.root'])
 
-    for obj in data_to.objects:
+    for obj in loaded_objects:
         add_object_to_collection(obj, tile_props.tile_name)
         obj.hide_viewport = True
 
     # The slot cutter is a 0.1 wide rectangle with an array modifier
-    slot_cutter = data_to.objects[0]
+    slot_cutter = loaded_objects[0]
     slot_cutter.name = 'Base Slot.' + tile_props.tile_name + '.slot_cutter'
 
     # the start and end caps are both made of objects with their own modifier
-    cutter_start_cap = data_to.objects[1]
-    cutter_end_cap = data_to.objects[2]
+    cutter_start_cap = loaded_objects[1]
+    cutter_end_cap = loaded_objects[2]
 
     if base_socket_side == 'OUTER':
         # gap between slot end and side
@@ -829,6 +842,7 @@ def spawn_openlock_base_slot_cutter(tile_props):
     return slot_cutter
 
 
+@timed('cutters')
 def spawn_openlock_base_clip_cutter(tile_props):
     """Spawn base clip cutter into scene.
 
@@ -846,18 +860,17 @@ def spawn_openlock_base_clip_cutter(tile_props):
         "openlock.blend")
 
     # load base cutters
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = [
-            'openlock.wall.base.cutter.clip',
-            'openlock.wall.base.cutter.clip.cap.start',
-            'openlock.wall.base.cutter.clip.cap.end']
+    loaded_objects = load_objects(booleans_path, [
+        'openlock.wall.base.cutter.clip',
+        'openlock.wall.base.cutter.clip.cap.start',
+        'openlock.wall.base.cutter.clip.cap.end'])
 
-    for obj in data_to.objects:
+    for obj in loaded_objects:
         add_object_to_collection(obj, tile_props.tile_name)
 
-    clip_cutter = data_to.objects[0]
-    cutter_start_cap = data_to.objects[1]
-    cutter_end_cap = data_to.objects[2]
+    clip_cutter = loaded_objects[0]
+    cutter_start_cap = loaded_objects[1]
+    cutter_end_cap = loaded_objects[2]
 
     cutter_start_cap.hide_viewport = True
     cutter_end_cap.hide_viewport = True
@@ -897,35 +910,35 @@ def draw_plain_u_base(dimensions):
     leg_2_outer = leg_2_inner + thickness
     x_outer = x_inner + (thickness * 2)
 
-    bm, obj = create_turtle('U Base')
+    bm, obj, turtle = create_turtle('U Base')
     bm.select_mode = {'VERT'}
 
-    pd(bm)
-    add_vert(bm)
-
-    fd(bm, leg_1_outer)
-    rt(90)
-    fd(bm, thickness)
-    rt(90)
-    fd(bm, leg_1_inner)
-    lt(90)
-    fd(bm, x_inner)
-    lt(90)
-    fd(bm, leg_2_inner)
-    rt(90)
-    fd(bm, thickness)
-    rt(90)
-    fd(bm, leg_2_outer)
-    rt(90)
-    fd(bm, x_outer)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
+
+    fd(bm, turtle, leg_1_outer)
+    rt(turtle, 90)
+    fd(bm, turtle, thickness)
+    rt(turtle, 90)
+    fd(bm, turtle, leg_1_inner)
+    lt(turtle, 90)
+    fd(bm, turtle, x_inner)
+    lt(turtle, 90)
+    fd(bm, turtle, leg_2_inner)
+    rt(turtle, 90)
+    fd(bm, turtle, thickness)
+    rt(turtle, 90)
+    fd(bm, turtle, leg_2_outer)
+    rt(turtle, 90)
+    fd(bm, turtle, x_outer)
     bm_select_all(bm)
     bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.001)
     bmesh.ops.triangle_fill(bm, use_beauty=True, use_dissolve=True, edges=bm.edges, normal=(0, 0, -1))
     bm.select_mode = {'FACE'}
     bm_select_all(bm)
-    up(bm, height, False)
-    home(obj)
-    finalise_turtle(bm, obj)
+    up(bm, turtle, height, False)
+    home(turtle, obj)
+    finalise_turtle(bm, obj, turtle)
     return obj
 
 
@@ -995,7 +1008,7 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
         'Leg 2 Bottom',
         'End Wall Bottom']
 
-    bm, obj = create_turtle('U core', vert_groups)
+    bm, obj, turtle = create_turtle('U core', vert_groups)
     verts = bm.verts
     verts.layers.deform.verify()
     deform_groups = verts.layers.deform.active
@@ -1012,17 +1025,17 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
     leg_2_end_vert_locs = []
 
     # move cursor to start
-    pu(bm)
-    up(bm, base_height)
-    fd(bm, thickness_diff / 2)
-    ri(bm, thickness_diff / 2)
-    pd(bm)
+    pu(bm, turtle)
+    up(bm, turtle, base_height)
+    fd(bm, turtle, thickness_diff / 2)
+    ri(bm, turtle, thickness_diff / 2)
+    pd(bm, turtle)
 
     # draw leg 1 outer
     subdiv_dist = (leg_1_outer - margin) / subdivs['leg_1']
 
     bm.select_mode = {'VERT'}
-    add_vert(bm)
+    add_vert(bm, turtle)
     verts.ensure_lookup_table()
     leg_1_outer_vert_locs.append(verts[-1].co.copy())
 
@@ -1030,9 +1043,9 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
     start_index = verts[-1].index
     i = 0
     while i < subdivs['leg_1']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
-    fd(bm, margin)
+    fd(bm, turtle, margin)
 
     bm.verts.ensure_lookup_table()
     i = start_index
@@ -1044,23 +1057,23 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
     # we will bride inner and outer sides so we dont draw end edges
     bm.verts.ensure_lookup_table()
     leg_1_end_vert_locs.append(verts[-1].co.copy())
-    pu(bm)
-    rt(90)
-    fd(bm, thickness)
-    pd(bm)
-    add_vert(bm)
+    pu(bm, turtle)
+    rt(turtle, 90)
+    fd(bm, turtle, thickness)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
     bm.verts.ensure_lookup_table()
     leg_1_end_vert_locs.append(verts[-1].co.copy())
-    rt(90)
+    rt(turtle, 90)
 
     # leg 1 inner
     subdiv_dist = (leg_1_inner - margin) / subdivs['leg_1']
     start_index = verts[-1].index
-    fd(bm, margin)
+    fd(bm, turtle, margin)
 
     i = 0
     while i < subdivs['leg_1']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
 
     i = start_index
@@ -1073,11 +1086,11 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
     subdiv_dist = (x_inner) / subdivs['x']
     start_index = verts[-1].index
 
-    lt(90)
+    lt(turtle, 90)
 
     i = 0
     while i < subdivs['x']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
 
     i = start_index
@@ -1090,11 +1103,11 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
     subdiv_dist = (leg_2_inner - margin) / subdivs['leg_2']
     start_index = verts[-1].index
 
-    lt(90)
+    lt(turtle, 90)
 
     i = 0
     while i < subdivs['leg_2']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
 
     i = start_index
@@ -1103,29 +1116,29 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
         leg_2_inner_vert_locs.append(verts[i].co.copy())
         i += 1
 
-    fd(bm, margin)
+    fd(bm, turtle, margin)
     bm.verts.ensure_lookup_table()
     leg_2_inner_vert_locs.append(verts[-1].co.copy())
 
     #leg 2 end
     leg_2_end_vert_locs.append(verts[-1].co.copy())
-    pu(bm)
-    rt(90)
-    fd(bm, thickness)
-    pd(bm)
-    add_vert(bm)
+    pu(bm, turtle)
+    rt(turtle, 90)
+    fd(bm, turtle, thickness)
+    pd(bm, turtle)
+    add_vert(bm, turtle)
     bm.verts.ensure_lookup_table()
     leg_2_end_vert_locs.append(verts[-1].co.copy())
 
     # leg 2 outer
     subdiv_dist = (leg_2_outer - margin) / subdivs['leg_2']
-    rt(90)
+    rt(turtle, 90)
 
     start_index = verts[-1].index
-    fd(bm, margin)
+    fd(bm, turtle, margin)
     i = 0
     while i < subdivs['leg_2']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
 
     i = start_index
@@ -1136,13 +1149,13 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
 
     # x outer
     subdiv_dist = x_outer / subdivs['x']
-    rt(90)
+    rt(turtle, 90)
 
     start_index = verts[-1].index
 
     i = 0
     while i < subdivs['x']:
-        fd(bm, subdiv_dist)
+        fd(bm, turtle, subdiv_dist)
         i += 1
 
     i = start_index
@@ -1164,15 +1177,16 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
     bm_select_all(bm)
     bm.select_mode = {'FACE'}
 
-    up(bm, margin, False)
+    up(bm, turtle, margin, False)
 
     i = 0
     while i < subdivs['height']:
-        up(bm, subdiv_dist)
+        up(bm, turtle, subdiv_dist)
         i += 1
-    up(bm, margin)
+    up(bm, turtle, margin)
 
-    home(obj)
+    home(turtle, obj)
+    release_turtle(turtle, obj)
 
     vert_locs = {
         'Leg 1 Inner': leg_1_inner_vert_locs,
@@ -1187,6 +1201,7 @@ def draw_u_core(dimensions, subdivs, margin=0.001):
     return bm, obj, deform_groups, vert_locs
 
 
+@cached_core
 def draw_u_wall_core(dimensions, subdivs, margin=0.001):
     """Return a U wall core
 
@@ -1,15 +1,28 @@
 import os
 import bpy
+import bmesh
 from .. utils.registration import get_prefs
 from .. lib.utils.vertex_groups import construct_displacement_mod_vert_group
 from .. lib.utils.collections import add_object_to_collection, create_collection
 from .. lib.utils.selection import select, deselect_all, activate
+from .. lib.utils.profiling import stage, timed
+from .. lib.utils.transforms import set_origin
+from .. lib.bmturtle.adapter import project_uvs, bake_arrays
+from .. lib.bmturtle.helpers import subdivide_faces_in_groups
+from .. lib.utils.utils import get_all_subclasses
 from .. materials.materials import (
     assign_mat_to_vert_group)
 
 
 class MT_Tile_Generator:
-    """Subclass this to create your tile operator."""
+    """Subclass this to create your tile operator.
+
+    Set mt_spawn to the module level function that builds the tile or prefab
+    from context. spawn_prefab and generate_batch call it directly rather than
+    running the operator.
+    """
+
+    mt_spawn = None
 
     @classmethod
     def poll(cls, context):
@@ -18,7 +31,13 @@ class MT_Tile_Generator:
         else:
             return True
 
+    def execute(self, context):
+        """Execute the operator."""
+        self.mt_spawn(context)
+        return {'FINISHED'}
+
 
+@timed('initialise')
 def initialise_tile_creator(context):
     deselect_all()
     scene = context.scene
@@ -93,6 +112,7 @@ def lock_all_transforms(obj):
     obj.lock_scale[2] = True
 
 
+@timed('displacement_setup')
 def convert_to_displacement_core(core, textured_vertex_groups):
     """Convert the core part of a tile so it can be used by the maketile dispacement system.
 
@@ -127,13 +147,21 @@ def convert_to_displacement_core(core, textured_vertex_groups):
     # create texture for displacement modifier
     props.disp_texture = bpy.data.textures.new(core.name + '.texture', 'IMAGE')
 
+    # subdivide only the textured faces rather than using the subsurf modifier
+    density = scene.mt_scene_props.displacement_density
+    if density > 0:
+        subdivide_textured_faces(core, textured_vertex_groups, density / get_unit_multiplier(scene))
+        props.is_subdivided = True
+        # extra verts mean the mesh no longer matches box_grid
+        props.is_resizable = False
+
     # add a triangulate modifier to correct for distortion after bools
     core.modifiers.new('MT Triangulate', 'TRIANGULATE')
 
     # add a subsurf modifier
     subsurf = core.modifiers.new('MT Subsurf', 'SUBSURF')
     subsurf.subdivision_type = 'SIMPLE'
-    subsurf.levels = 3
+    subsurf.levels = get_subsurf_levels(core, 3)
     props.subsurf_mod_name = subsurf.name
     # core['subsurf_mod_name'] = subsurf.name
     core.cycles.use_adaptive_subdivision = True
@@ -151,30 +179,80 @@ def convert_to_displacement_core(core, textured_vertex_groups):
     core.mt_object_props.geometry_type = 'PREVIEW'
 
 
+@timed('finalise')
 def finalise_core(core, tile_props):
     """Finalise core.
 
-    Set origin, UV project, set object props
+    Set origin, box project UVs, set object props
 
     Args:
         core (bpy.types.Object): core
         tile_props (MakeTile.properties.MT_Tile_Properties): tile properties
     """
-    ctx = {
-        'object': core,
-        'active_object': core,
-        'selected_editable_objects': [core],
-        'selected_objects': [core]
-    }
-
-    bpy.ops.object.origin_set(ctx, type='ORIGIN_CURSOR', center='MEDIAN')
-    bpy.ops.uv.smart_project(ctx, island_margin=tile_props.UV_island_margin)
+    set_origin(core, bpy.context.scene.cursor.location)
+    with stage('uv_project'):
+        project_uvs(core, tile_props.UV_island_margin)
 
     obj_props = core.mt_object_props
     obj_props.is_mt_object = True
     obj_props.tile_name = tile_props.tile_name
 
 
+def subdivide_textured_faces(obj, textured_vertex_groups, max_edge_length):
+    """Subdivide the textured faces of obj until their edges are no longer than max_edge_length.
+
+    Args:
+        obj (bpy.types.Object): core
+        textured_vertex_groups (list[str]): names of textured vertex groups
+        max_edge_length (float): target edge length in blender units
+    """
+    group_indices = {
+        obj.vertex_groups[name].index for name in textured_vertex_groups
+        if name in obj.vertex_groups}
+
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    subdivide_faces_in_groups(bm, group_indices, max_edge_length)
+    bm.to_mesh(obj.data)
+    bm.free()
+    obj.data.update()
+
+
+def get_subsurf_levels(obj, levels):
+    """Return the subsurf levels to use for a displacement object.
+
+    Objects whose textured faces were subdivided when they were made don't need subsurf.
+
+    Args:
+        obj (bpy.types.Object): displacement object
+        levels (int): levels to use if obj wasn't subdivided
+
+    Returns:
+        int: subsurf levels
+    """
+    if obj.mt_object_props.is_subdivided:
+        return 0
+    return levels
+
+
+def get_unit_multiplier(scene):
+    """Return the number of millimetres in a blender unit for the scene's export units.
+
+    Args:
+        scene (bpy.types.Scene): scene
+
+    Returns:
+        float: millimetres per blender unit
+    """
+    units = scene.mt_scene_props.export_units
+    if units == 'CM':
+        return 10
+    if units == 'INCHES':
+        return 25.4
+    return 1
+
+
+@timed('finalise')
 def finalise_tile(base, core, cursor_orig_loc, cursor_orig_rot):
     """Finalise tile.
 
@@ -210,6 +288,7 @@ def finalise_tile(base, core, cursor_orig_loc, cursor_orig_rot):
     activate(base.name)
 
 
+@timed('base_draw')
 def spawn_empty_base(tile_props):
     """Spawn an empty base into the scene.
 
@@ -234,28 +313,246 @@ def spawn_empty_base(tile_props):
     return base
 
 
-def spawn_prefab(context, subclasses, blueprint, mt_type):
+def spawn_nothing(context):
+    """Spawn function of the empty prefabs, which add nothing to the tile.
+
+    Args:
+        context (bpy.context): context
+    """
+
+
+def spawn_prefab(context, blueprint, mt_type):
     """Spawn a maketile prefab such as a base or tile core(s).
 
+    Calls the prefab's spawn function from prefab_registry directly rather
+    than running its operator through bpy.ops.
+
     Args:
         context (bpy.context): Blender context
-        subclasses (list): list of all subclasses of MT_Tile_Generator
         blueprint (str): mt_blueprint enum item
-        type (str): mt_type enum item
+        mt_type (str): mt_type enum item
 
     Returns:
         bpy.types.Object: Prefab
     """
-    # ensure we can only run bpy.ops in our eval statements
-    allowed_names = {k: v for k, v in bpy.__dict__.items() if k == 'ops'}
-    for subclass in subclasses:
-        if hasattr(subclass, 'mt_type') and hasattr(subclass, 'mt_blueprint'):
-            if subclass.mt_type == mt_type and subclass.mt_blueprint == blueprint:
-                eval_str = 'ops.' + subclass.bl_idname + '()'
-                eval(eval_str, {"__builtins__": {}}, allowed_names)
+    prefab = prefab_registry.get((blueprint, mt_type))
+    if prefab is not None:
+        bl_idname, spawn = prefab
+        # cores are drawn by *_CORE prefabs, everything else is part of the base
+        category = 'core_draw' if mt_type.endswith('_CORE') else 'base_draw'
+        with stage(bl_idname, category):
+            spawn(context)
+
+    return context.active_object
+
+
+# Prefab spawn functions. Built when the addon is registered.
+# {(mt_blueprint, mt_type): (operator bl_idname, function(context))}
+prefab_registry = {}
+
+
+def build_prefab_registry():
+    """Fill prefab_registry from the internal MT_Tile_Generator operators.
+
+    The operators stay registered so prefabs can still be run from the UI.
+    """
+    prefab_registry.clear()
+    for subclass in get_all_subclasses(MT_Tile_Generator):
+        if 'INTERNAL' in subclass.bl_options and hasattr(subclass, 'mt_type') and hasattr(subclass, 'mt_blueprint'):
+            prefab_registry[(subclass.mt_blueprint, subclass.mt_type)] = (
+                subclass.bl_idname,
+                subclass.mt_spawn)
 
-    prefab = context.active_object
-    return prefab
+
+def register():
+    build_prefab_registry()
+
+
+def unregister():
+    prefab_registry.clear()
+
+
+# Hidden collection that objects read by load_objects are kept in as templates
+TEMPLATES_COLLECTION = 'MT Cutter Templates'
+
+# Collection the collections of cutters used by combined booleans are kept in
+COMBINED_CUTTERS_COLLECTION = 'MT Combined Cutters'
+
+
+def get_templates_collection():
+    """Return the hidden collection load_objects keeps templates in, creating it if needed.
+
+    Returns:
+        bpy.types.Collection: templates collection
+    """
+    collection = bpy.data.collections.get(TEMPLATES_COLLECTION)
+    if collection is None:
+        collection = bpy.data.collections.new(TEMPLATES_COLLECTION)
+        # hidden collections aren't evaluated so templates cost nothing per update
+        collection.hide_viewport = True
+        collection.hide_render = True
+        helper_collection = create_collection('MT Helpers', bpy.context.scene.collection)
+        helper_collection.children.link(collection)
+    return collection
+
+
+def clear_cutter_templates():
+    """Remove the templates kept by load_objects so they are read from disk again.
+
+    Called when the asset libraries change. Templates that are still pointed
+    at by objects outside the templates collection, e.g. by the boolean
+    modifiers of tiles made before the templates were kept separate, are
+    kept but are no longer handed out as templates.
+    """
+    collection = bpy.data.collections.get(TEMPLATES_COLLECTION)
+    if collection is None:
+        return
+
+    templates = set(collection.objects)
+    user_map = bpy.data.user_map(subset=list(templates))
+
+    # keep templates used by anything other than the collection and the
+    # templates being removed, and anything those kept templates use
+    kept = set()
+    changed = True
+    while changed:
+        changed = False
+        for obj in templates - kept:
+            users = user_map[obj] - {collection}
+            if any(user not in templates or user in kept for user in users):
+                kept.add(obj)
+                changed = True
+
+    for obj in kept:
+        for key in ('mt_template_path', 'mt_template_name', 'mt_template_type'):
+            if key in obj:
+                del obj[key]
+
+    removed = templates - kept
+    meshes = [obj.data for obj in removed if obj.type == 'MESH']
+    for obj in removed:
+        bpy.data.objects.remove(obj)
+    for mesh in meshes:
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def get_templates(blend_path, names, data_type='objects'):
+    """Return template objects for the named datablocks of a blend file.
+
+    Datablocks not already in the templates collection are read from disk
+    together in one go so any pointers between them, e.g. an array modifier's
+    caps, point at each other's templates.
+
+    Args:
+        blend_path (str): path to blend file
+        names (list[str]): names of datablocks
+        data_type (str, optional): 'objects' or 'meshes'. Meshes are kept as \
+        the data of a template object. Defaults to 'objects'.
+
+    Returns:
+        dict{str: bpy.types.Object}: templates keyed by name
+    """
+    collection = get_templates_collection()
+
+    # looked up by custom property rather than kept in a dict because
+    # references to objects become invalid on undo or when a file is loaded
+    templates = {
+        obj['mt_template_name']: obj
+        for obj in collection.objects
+        if obj.get('mt_template_path') == blend_path
+        and obj.get('mt_template_type', 'objects') == data_type}
+
+    missing = [name for name in names if name not in templates]
+    if missing:
+        with bpy.data.libraries.load(blend_path) as (data_from, data_to):
+            setattr(data_to, data_type, missing)
+        for name, data in zip(missing, getattr(data_to, data_type)):
+            if data_type == 'objects':
+                obj = data
+            else:
+                obj = bpy.data.objects.new(name, data)
+            obj['mt_template_path'] = blend_path
+            obj['mt_template_name'] = name
+            obj['mt_template_type'] = data_type
+            collection.objects.link(obj)
+            templates[name] = obj
+
+    return {name: templates[name] for name in names}
+
+
+def remap_object_pointers(obj, object_map):
+    """Point obj's parent and its modifiers' object properties at the mapped objects.
+
+    Args:
+        obj (bpy.types.Object): object
+        object_map (dict{bpy.types.Object: bpy.types.Object}): objects to replace \
+        and what to replace them with
+    """
+    if obj.parent in object_map:
+        obj.parent = object_map[obj.parent]
+
+    for mod in obj.modifiers:
+        # covers e.g. array start_cap, end_cap and offset_object and boolean object
+        for prop in mod.bl_rna.properties:
+            if prop.type != 'POINTER' or prop.is_readonly or prop.fixed_type.identifier != 'Object':
+                continue
+            target = getattr(mod, prop.identifier)
+            if target in object_map:
+                setattr(mod, prop.identifier, object_map[target])
+
+
+def load_objects(blend_path, object_names):
+    """Return copies of objects from a blend file.
+
+    Each object is read from disk the first time it is requested and kept as a
+    template in a hidden collection. Later requests copy the template. The
+    copies are not linked to any collection.
+
+    Objects are copied as a set, so where one requested object points at
+    another, e.g. through an array modifier's caps or a boolean modifier,
+    the copy points at the other copy rather than at its template.
+
+    Args:
+        blend_path (str): path to blend file
+        object_names (list[str]): names of objects to load
+
+    Returns:
+        list[bpy.types.Object]: objects in the same order as object_names
+    """
+    templates = get_templates(blend_path, object_names)
+
+    copies = {}
+    for template in templates.values():
+        obj = template.copy()
+        for key in ('mt_template_path', 'mt_template_name', 'mt_template_type'):
+            if key in obj:
+                del obj[key]
+        # copy mesh too as some callers apply transforms to it
+        if obj.data is not None:
+            obj.data = obj.data.copy()
+        copies[template] = obj
+
+    for obj in copies.values():
+        remap_object_pointers(obj, copies)
+
+    return [copies[templates[name]] for name in object_names]
+
+
+def load_meshes(blend_path, mesh_names):
+    """Return copies of meshes from a blend file.
+
+    Meshes are kept as templates in the same way as load_objects.
+
+    Args:
+        blend_path (str): path to blend file
+        mesh_names (list[str]): names of meshes to load
+
+    Returns:
+        list[bpy.types.Mesh]: meshes in the same order as mesh_names
+    """
+    templates = get_templates(blend_path, mesh_names, 'meshes')
+    return [templates[name].data.copy() for name in mesh_names]
 
 
 def load_openlock_top_peg(tile_props):
@@ -277,16 +574,14 @@ def load_openlock_top_peg(tile_props):
         "openlock.blend")
 
     # load peg bool
-    with bpy.data.libraries.load(booleans_path) as (data_from, data_to):
-        data_to.objects = ['openlock.top_peg']
-
-    peg = data_to.objects[0]
+    peg = load_objects(booleans_path, ['openlock.top_peg'])[0]
     peg.name = 'Top Peg.' + tile_name
     add_object_to_collection(peg, tile_name)
 
     return peg
 
 
+@timed('booleans')
 def set_bool_obj_props(bool_obj, parent_obj, tile_props):
     """Set properties for boolean object used for e.g. clip cutters.
 
@@ -305,6 +600,7 @@ def set_bool_obj_props(bool_obj, parent_obj, tile_props):
     bool_obj.mt_object_props.tile_name = tile_props.tile_name
 
 
+@timed('booleans')
 def set_bool_props(bool_obj, target_obj, bool_type):
     """Set Properties for boolean and add bool to target_object's cutters collection.
 
@@ -315,10 +611,8 @@ def set_bool_props(bool_obj, target_obj, bool_type):
         target_obj (bpy.types.Object): target object
         bool_type (enum): enum in {'DIFFERENCE', 'UNION', 'INTERSECT'}
     """
-    boolean = target_obj.modifiers.new(bool_obj.name + '.bool', 'BOOLEAN')
-    boolean.operation = bool_type
-    boolean.object = bool_obj
-    boolean.show_render = False
+    if get_prefs().bake_cutter_arrays:
+        bake_arrays(bool_obj)
 
     # add cutters to object's cutters_collection
     # so we can activate and deactivate them when necessary
@@ -326,3 +620,58 @@ def set_bool_props(bool_obj, target_obj, bool_type):
     cutter_coll_item.name = bool_obj.name
     cutter_coll_item.value = True
     cutter_coll_item.parent = target_obj.name
+
+    if get_prefs().combine_cutters and bpy.app.version >= (2, 91, 0):
+        operands = get_combined_cutters(target_obj, bool_type)
+        operands.objects.link(bool_obj)
+        cutter_coll_item.operands = operands.name
+        return
+
+    boolean = target_obj.modifiers.new(bool_obj.name + '.bool', 'BOOLEAN')
+    boolean.operation = bool_type
+    boolean.object = bool_obj
+    boolean.show_render = False
+
+
+def get_combined_cutters(target_obj, bool_type):
+    """Return the collection of cutters used by target_obj's combined boolean for bool_type.
+
+    A combined boolean cuts with every object in its collection in one pass rather
+    than target_obj having a boolean per cutter. The boolean and its collection
+    are created the first time they are needed. Cutters are toggled by linking
+    them to and unlinking them from the collection.
+
+    Args:
+        target_obj (bpy.types.Object): target object
+        bool_type (enum): enum in {'DIFFERENCE', 'UNION', 'INTERSECT'}
+
+    Returns:
+        bpy.types.Collection: cutters collection
+    """
+    name = bool_type.title() + ' Cutters'
+    boolean = target_obj.modifiers.get(name)
+    if boolean is None:
+        boolean = target_obj.modifiers.new(name, 'BOOLEAN')
+        boolean.operation = bool_type
+        boolean.operand_type = 'COLLECTION'
+        operands = bpy.data.collections.new(target_obj.name + ' ' + name)
+        # a boolean doesn't count as a user so link the collection somewhere it will be saved
+        get_combined_cutters_collection().children.link(operands)
+        boolean.collection = operands
+        boolean.show_render = False
+    return boolean.collection
+
+
+def get_combined_cutters_collection():
+    """Return the collection the collections used by combined booleans are kept in, creating it if needed.
+
+    Returns:
+        bpy.types.Collection: combined cutters collection
+    """
+    collection = bpy.data.collections.get(COMBINED_CUTTERS_COLLECTION)
+    if collection is None:
+        collection = bpy.data.collections.new(COMBINED_CUTTERS_COLLECTION)
+        # not hidden so the cutters in it are still evaluated
+        helper_collection = create_collection('MT Helpers', bpy.context.scene.collection)
+        helper_collection.children.link(collection)
+    return collection
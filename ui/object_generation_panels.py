@@ -28,6 +28,8 @@ class MT_PT_Tile_Generator_Panel(Panel):
         layout.prop(scene_props, 'tile_material_1', text="Main Material")
         layout.prop(scene_props, 'UV_island_margin')
         layout.prop(scene_props, 'subdivisions')
+        layout.prop(scene_props, 'displacement_density')
+        layout.prop(scene_props, 'apply_displacement')
 
         tile_type = scene_props.tile_type
         tile_defaults = scene_props['tile_defaults']
@@ -35,6 +37,8 @@ class MT_PT_Tile_Generator_Panel(Panel):
             if default['type'] == tile_type:
                 layout.operator(default['bl_idname'], text="MakeTile")
 
+        layout.operator('scene.mt_generate_batch', text="Generate Batch")
+
         if obj is not None and obj.type == 'MESH':
             if obj.mt_object_props.geometry_type == 'PREVIEW':
                 layout.operator('scene.mt_make_3d', text='Make 3D')
@@ -42,6 +46,7 @@ class MT_PT_Tile_Generator_Panel(Panel):
                 layout.operator(
                     'scene.mt_return_to_preview',
                     text='Return to Preview')
+            layout.operator('object.mt_resize_tile_core', text='Resize Core')
 
         layout.operator('scene.delete_tiles', text="Delete Tiles")
 
@@ -0,0 +1,38 @@
+from bpy.types import Panel
+from ..utils.registration import get_prefs
+from ..lib.utils.profiling import generation_profiles
+
+# number of recent generations shown in the panel
+PROFILES_SHOWN = 5
+
+
+class MT_PT_Profiling_Panel(Panel):
+    """Show how long each stage of recent tile generations took."""
+    bl_order = 10
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Make Tile"
+    bl_idname = "MT_PT_Profiling_Panel"
+    bl_label = "Profiling"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        prefs = get_prefs()
+        layout = self.layout
+
+        layout.prop(prefs, 'profile_generation', text="Profile Tile Generation")
+
+        row = layout.row()
+        row.operator('scene.mt_export_generation_trace')
+        row.operator('scene.mt_clear_generation_profiles')
+
+        for profile in reversed(list(generation_profiles)[-PROFILES_SHOWN:]):
+            box = layout.box()
+            box.label(text=profile['label'] + ": " + format(profile['duration'] * 1000, '.1f') + " ms")
+
+            stages = sorted(profile['totals'].items(), key=lambda item: item[1], reverse=True)
+            for category, total in stages:
+                row = box.row()
+                row.label(text=category)
+                row.label(text=format(total * 1000, '.1f') + " ms")
+                row.label(text=str(profile['counts'][category]) + " calls")